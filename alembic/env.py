@@ -5,6 +5,12 @@ from sqlalchemy import pool
 
 from alembic import context
 
+import reflex as rx  # Must come before sqlmodel (Reflex patches pydantic on import)
+from sqlmodel import SQLModel
+
+from rxconfig import DATABASE_URL
+import ltx_automation_app.database.models  # noqa: F401 - registers the tables on SQLModel.metadata
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -14,11 +20,21 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# Use the app database unless alembic.ini points somewhere real
+if config.get_main_option("sqlalchemy.url", "").startswith("driver://"):
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+
 # add your model's MetaData object here
 # for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
+target_metadata = SQLModel.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip the FTS5 search tables (and their shadow tables), which live outside the models."""
+    if type_ == "table" and reflected and compare_to is None and "_fts" in name:
+        return False
+    return True
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -44,6 +60,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -65,7 +83,11 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most constraints in place
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,34 @@
+"""drop score cache metric id
+
+Revision ID: 4fa9b0c1f1bd
+Revises: 0613e73e45ca
+Create Date: 2026-10-19 14:21:07.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4fa9b0c1f1bd'
+down_revision: Union[str, Sequence[str], None] = '0613e73e45ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The cache key already covers the metric definition; the pre-eval
+    # signals it is used for are not catalog metrics, so the id was never set
+    with op.batch_alter_table('metricscorecache', schema=None) as batch_op:
+        batch_op.drop_column('metric_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('metricscorecache', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('metric_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_metricscorecache_metric_id_metric', 'metric', ['metric_id'], ['id'])
@@ -0,0 +1,67 @@
+"""add catalog fts search
+
+Revision ID: bcf09effbcc8
+Revises: c2388afa3579
+Create Date: 2026-10-19 10:41:52.730118
+
+FTS5 external-content tables over the metric and README catalogs, kept in
+sync by triggers. SQLite only; other databases use the LIKE fallback in
+ltx_automation_app/database/catalog_search.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'bcf09effbcc8'
+down_revision: Union[str, Sequence[str], None] = 'c2388afa3579'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_TABLES = {
+    'metric_fts': ('metric', ['METRIC_NAME', 'METRIC_DEF', 'METRIC_NOTES']),
+    'readmeinstruction_fts': ('readmeinstruction', ['README_TITLE', 'README_TXT']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for fts, (table, columns) in FTS_TABLES.items():
+        cols = ', '.join(f'"{c}"' for c in columns)
+        new = ', '.join(f'new."{c}"' for c in columns)
+        old = ', '.join(f'old."{c}"' for c in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+        )
+        # Index the rows that already exist
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for fts in FTS_TABLES:
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -0,0 +1,43 @@
+# ltx_automation_app/components/infinite_scroll.py
+"""
+Scrollable container that asks its state for the next page as the user
+nears the bottom. Used with the keyset-paginated listings.
+"""
+
+import reflex as rx
+from reflex.vars.base import Var
+from reflex.vars.object import ObjectVar
+
+# Handlers load the next page when fewer pixels than this remain below the fold
+LOAD_MORE_THRESHOLD_PX = 300
+
+
+def _scroll_remaining(e: ObjectVar) -> tuple[Var[float]]:
+    """Args spec for on_scroll: pixels left between the viewport and the bottom."""
+    return (
+        Var(f"({e}.target.scrollHeight - {e}.target.scrollTop - {e}.target.clientHeight)").to(float),
+    )
+
+
+class InfiniteScrollArea(rx.el.Div):
+    """Div whose on_scroll passes the remaining scroll distance in pixels."""
+
+    on_scroll: rx.EventHandler[_scroll_remaining]
+
+
+def infinite_scroll_area(*children, on_load_more, **props) -> rx.Component:
+    """
+    Scrollable list container with infinite scroll.
+
+    Args:
+        children: List content
+        on_load_more: Event handler taking the remaining scroll distance (px);
+            it should load the next page when that drops below
+            LOAD_MORE_THRESHOLD_PX and more rows exist
+        props: Passed to the div (class_name etc.)
+    """
+    return InfiniteScrollArea.create(
+        *children,
+        on_scroll=on_load_more.throttle(200),
+        **props,
+    )
@@ -75,6 +75,13 @@ def sidebar_navigation() -> rx.Component:
                 on_click=LTXBenchNavigationState.show_new_project,
             ),
             
+            # Database admin button
+            sidebar_button(
+                icon_name="database",
+                title="Database",
+                on_click=LTXBenchNavigationState.show_database_admin,
+            ),
+            
             class_name="space-y-4"
         ),
         
@@ -0,0 +1,162 @@
+# ltx_automation_app/components/ltx_bench/database_admin_view.py
+"""
+Database admin view: file size and page usage, score cache hits, per-table
+row counts and sizes, index sizes, and a button to run maintenance now.
+"""
+
+import reflex as rx
+from ltx_automation_app.states.ltx_bench_state import (
+    DatabaseAdminState,
+    LTXBenchNavigationState,
+)
+
+
+def database_admin_view() -> rx.Component:
+    """
+    Storage statistics of the application database.
+    Loaded when the view is opened (LTXBenchNavigationState.show_database_admin).
+    """
+    return rx.el.div(
+        # Back button
+        rx.el.button(
+            rx.icon("arrow-left", class_name="w-5 h-5 mr-2"),
+            "Back to Dashboard",
+            on_click=LTXBenchNavigationState.show_dashboard,
+            class_name="mb-6 flex items-center text-indigo-600 hover:text-indigo-700"
+        ),
+
+        rx.el.div(
+            rx.el.h1(
+                "Database",
+                class_name="text-3xl font-bold text-gray-800"
+            ),
+            rx.el.div(
+                rx.el.button(
+                    rx.icon("refresh-cw", class_name="w-4 h-4 mr-2"),
+                    "Refresh",
+                    on_click=DatabaseAdminState.load_storage_stats,
+                    class_name="flex items-center px-4 py-2 text-indigo-600 hover:text-indigo-700 font-medium"
+                ),
+                rx.el.button(
+                    rx.cond(
+                        DatabaseAdminState.maintenance_running,
+                        "Running maintenance...",
+                        "Run Maintenance",
+                    ),
+                    on_click=DatabaseAdminState.run_maintenance,
+                    disabled=DatabaseAdminState.maintenance_running,
+                    class_name="px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 disabled:opacity-50"
+                ),
+                class_name="flex items-center gap-2"
+            ),
+            class_name="flex items-center justify-between mb-6"
+        ),
+
+        rx.cond(
+            DatabaseAdminState.storage_error != "",
+            rx.el.p(
+                DatabaseAdminState.storage_error,
+                class_name="text-red-600 mb-6"
+            ),
+            rx.el.div(
+                storage_summary(),
+                table_sizes(),
+                index_sizes(),
+                class_name="space-y-6"
+            ),
+        ),
+
+        class_name="container mx-auto p-8 max-w-5xl"
+    )
+
+
+def summary_item(label: str, value) -> rx.Component:
+    """One labelled figure of the summary card."""
+    return rx.el.div(
+        rx.el.p(label, class_name="text-xs text-gray-500 uppercase"),
+        rx.el.p(value, class_name="text-lg font-semibold text-gray-800"),
+    )
+
+
+def storage_summary() -> rx.Component:
+    """File, free-page and WAL sizes, the last maintenance pass and score cache hits."""
+    return rx.el.div(
+        rx.el.div(
+            summary_item("File size", DatabaseAdminState.storage_summary["file_size"]),
+            summary_item("Free pages", DatabaseAdminState.storage_summary["free_size"]),
+            summary_item("WAL", DatabaseAdminState.storage_summary["wal_size"]),
+            summary_item("Pages", DatabaseAdminState.storage_summary["pages"]),
+            summary_item("Journal", DatabaseAdminState.storage_summary["journal_mode"]),
+            summary_item("Auto vacuum", DatabaseAdminState.storage_summary["auto_vacuum"]),
+            class_name="grid grid-cols-3 md:grid-cols-6 gap-4"
+        ),
+        rx.el.p(
+            "Last maintenance: ",
+            DatabaseAdminState.last_maintenance,
+            class_name="mt-4 text-sm text-gray-500"
+        ),
+        rx.el.p(
+            "Score cache: ",
+            DatabaseAdminState.score_cache_summary,
+            class_name="mt-1 text-sm text-gray-500"
+        ),
+        class_name="bg-white rounded-lg shadow border border-gray-200 p-6"
+    )
+
+
+def stats_table(title: str, headers: list[str], rows, row_fn) -> rx.Component:
+    """Card with a simple table; row_fn renders one row."""
+    return rx.el.div(
+        rx.el.h2(title, class_name="text-lg font-semibold text-gray-800 mb-4"),
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    *[
+                        rx.el.th(header, class_name="px-3 py-2 text-left text-xs font-medium text-gray-500 uppercase")
+                        for header in headers
+                    ],
+                    class_name="border-b border-gray-200"
+                )
+            ),
+            rx.el.tbody(rx.foreach(rows, row_fn)),
+            class_name="w-full text-sm"
+        ),
+        class_name="bg-white rounded-lg shadow border border-gray-200 p-6 overflow-x-auto"
+    )
+
+
+def stats_cell(value, align: str = "text-right") -> rx.Component:
+    return rx.el.td(value, class_name=f"px-3 py-2 text-gray-700 {align}")
+
+
+def table_sizes() -> rx.Component:
+    """Row count, data size and index size per table, largest first."""
+    return stats_table(
+        "Tables",
+        ["Table", "Rows", "Data", "Indexes", "Index size", "Share"],
+        DatabaseAdminState.storage_tables,
+        lambda table: rx.el.tr(
+            stats_cell(table["name"], "text-left font-medium"),
+            stats_cell(table["rows"]),
+            stats_cell(table["size"]),
+            stats_cell(table["indexes"]),
+            stats_cell(table["index_size"]),
+            stats_cell(table["share"]),
+            class_name="border-b border-gray-100"
+        ),
+    )
+
+
+def index_sizes() -> rx.Component:
+    """Size of every index, largest first."""
+    return stats_table(
+        "Indexes",
+        ["Index", "Table", "Size"],
+        DatabaseAdminState.storage_indexes,
+        lambda index: rx.el.tr(
+            stats_cell(index["name"], "text-left font-medium"),
+            stats_cell(index["table"], "text-left"),
+            stats_cell(index["size"]),
+            class_name="border-b border-gray-100"
+        ),
+    )
@@ -4,7 +4,10 @@ Updated Evaluation Library view with proper alignment, icons, and database integ
 """
 
 import reflex as rx
-from ltx_automation_app.states.ltx_bench_state import EvaluationLibraryState
+from ltx_automation_app.states.ltx_bench_state import (
+    EvaluationLibraryState,
+    README_INPUT_DEBOUNCE_MS,
+)
 
 
 def evaluation_library_view() -> rx.Component:
@@ -224,9 +227,24 @@ def readme_library_view() -> rx.Component:
         rx.el.div(
             rx.el.h2("Read Me Library", class_name="text-xl font-semibold"),
             # TODO: Add New Instructions button will be implemented with new design
+            rx.el.button(
+                rx.icon("archive-restore", class_name="w-4 h-4 mr-2"),
+                rx.cond(
+                    EvaluationLibraryState.show_archived_readmes,
+                    "Hide Archived",
+                    "Archived"
+                ),
+                on_click=EvaluationLibraryState.toggle_archived_readmes,
+                class_name="flex items-center px-4 py-2 border border-gray-300 rounded hover:bg-gray-50"
+            ),
             class_name="flex items-center justify-between mb-6"
         ),
         
+        rx.cond(
+            EvaluationLibraryState.show_archived_readmes,
+            archived_readmes_view(),
+        ),
+        
         # README Selection Dropdown
         rx.el.div(
             rx.el.label("Select Read Me", class_name="text-sm font-medium text-gray-700 mr-3"),
@@ -261,6 +279,37 @@ def readme_library_view() -> rx.Component:
     )
 
 
+def archived_readmes_view() -> rx.Component:
+    """
+    Archived README instructions, each with a Restore button that puts it
+    back into the library.
+    """
+    return rx.el.div(
+        rx.el.h3("Archived Read Me", class_name="text-sm font-semibold text-gray-700 mb-2"),
+        rx.cond(
+            EvaluationLibraryState.archived_readmes.length() > 0,
+            rx.el.div(
+                rx.foreach(
+                    EvaluationLibraryState.archived_readmes,
+                    lambda readme: rx.el.div(
+                        rx.el.span(readme["title"], class_name="text-sm text-gray-800"),
+                        rx.el.button(
+                            rx.icon("rotate-ccw", class_name="w-4 h-4 mr-2"),
+                            "Restore",
+                            on_click=EvaluationLibraryState.restore_archived_readme(readme["id"]),
+                            class_name="flex items-center px-3 py-1 text-sm border border-gray-300 rounded hover:bg-white"
+                        ),
+                        class_name="flex items-center justify-between py-2 border-b border-gray-200 last:border-b-0"
+                    )
+                ),
+                class_name="max-h-60 overflow-y-auto"
+            ),
+            rx.el.p("No archived README instructions.", class_name="text-sm text-gray-500")
+        ),
+        class_name="mb-6 p-4 border border-gray-200 bg-gray-50 rounded-lg"
+    )
+
+
 def readme_content_section() -> rx.Component:
     """
     README content section with edit mode including title editing.
@@ -268,16 +317,19 @@ def readme_content_section() -> rx.Component:
     return rx.el.div(
         # Title bar with edit controls
         rx.el.div(
-            # Title (editable in edit mode)
-            rx.el.input(
-                value=rx.cond(
-                    EvaluationLibraryState.readme_edit_mode,
-                    EvaluationLibraryState.edit_readme_title,
-                    EvaluationLibraryState.selected_readme_title
+            # Title (editable in edit mode, sent to the server after a pause in typing)
+            rx.debounce_input(
+                rx.el.input(
+                    value=rx.cond(
+                        EvaluationLibraryState.readme_edit_mode,
+                        EvaluationLibraryState.edit_readme_title,
+                        EvaluationLibraryState.selected_readme_title
+                    ),
+                    on_change=EvaluationLibraryState.set_edit_readme_title,
+                    disabled=~EvaluationLibraryState.readme_edit_mode,
+                    class_name="text-xl font-semibold px-2 py-1 border border-gray-300 rounded disabled:bg-gray-50 disabled:cursor-not-allowed"
                 ),
-                on_change=EvaluationLibraryState.set_edit_readme_title,
-                disabled=~EvaluationLibraryState.readme_edit_mode,
-                class_name="text-xl font-semibold px-2 py-1 border border-gray-300 rounded disabled:bg-gray-50 disabled:cursor-not-allowed"
+                debounce_timeout=README_INPUT_DEBOUNCE_MS,
             ),
             
             # Edit/Save/Cancel buttons
@@ -285,6 +337,10 @@ def readme_content_section() -> rx.Component:
                 rx.cond(
                     EvaluationLibraryState.readme_edit_mode,
                     rx.el.div(
+                        rx.el.span(
+                            EvaluationLibraryState.readme_autosave_status,
+                            class_name="text-sm text-gray-500 mr-4"
+                        ),
                         rx.el.button(
                             "Cancel",
                             on_click=EvaluationLibraryState.cancel_edit,
@@ -297,11 +353,20 @@ def readme_content_section() -> rx.Component:
                         ),
                         class_name="flex items-center"
                     ),
-                    rx.el.button(
-                        rx.icon("pencil", class_name="w-4 h-4 mr-2"),
-                        "Edit",
-                        on_click=EvaluationLibraryState.toggle_edit_mode,
-                        class_name="flex items-center px-4 py-2 border border-gray-300 rounded hover:bg-gray-50"
+                    rx.el.div(
+                        rx.el.button(
+                            rx.icon("archive", class_name="w-4 h-4 mr-2"),
+                            "Archive",
+                            on_click=EvaluationLibraryState.delete_readme,
+                            class_name="flex items-center px-4 py-2 border border-gray-300 rounded hover:bg-gray-50 mr-2"
+                        ),
+                        rx.el.button(
+                            rx.icon("pencil", class_name="w-4 h-4 mr-2"),
+                            "Edit",
+                            on_click=EvaluationLibraryState.toggle_edit_mode,
+                            class_name="flex items-center px-4 py-2 border border-gray-300 rounded hover:bg-gray-50"
+                        ),
+                        class_name="flex items-center"
                     )
                 ),
                 class_name="flex items-center"
@@ -309,6 +374,12 @@ def readme_content_section() -> rx.Component:
             class_name="flex items-center justify-between mb-6 pb-4 border-b"
         ),
         
+        # Merge view - shown when someone else saved the same fields meanwhile
+        rx.cond(
+            EvaluationLibraryState.readme_conflict_fields.length() > 0,
+            readme_merge_view(),
+        ),
+        
         # Dropdowns and Radio buttons - all visible, just disabled in view mode
         rx.el.div(
             # Eval Type dropdown
@@ -419,22 +490,82 @@ def readme_content_section() -> rx.Component:
         
         # README Content Text with proper scroll
         rx.el.div(
-            rx.el.textarea(
-                value=rx.cond(
-                    EvaluationLibraryState.readme_edit_mode,
-                    EvaluationLibraryState.edit_readme_content,
-                    EvaluationLibraryState.selected_readme_content
+            rx.debounce_input(
+                rx.el.textarea(
+                    value=rx.cond(
+                        EvaluationLibraryState.readme_edit_mode,
+                        EvaluationLibraryState.edit_readme_content,
+                        EvaluationLibraryState.selected_readme_content
+                    ),
+                    on_change=EvaluationLibraryState.set_edit_readme_content,
+                    disabled=~EvaluationLibraryState.readme_edit_mode,
+                    rows=12,
+                    class_name="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 resize-none disabled:bg-gray-50 disabled:cursor-not-allowed"
                 ),
-                on_change=EvaluationLibraryState.set_edit_readme_content,
-                disabled=~EvaluationLibraryState.readme_edit_mode,
-                rows=12,
-                class_name="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 resize-none disabled:bg-gray-50 disabled:cursor-not-allowed"
+                debounce_timeout=README_INPUT_DEBOUNCE_MS,
             ),
             class_name="mt-4"
         )
     )
 
 
+def readme_merge_view() -> rx.Component:
+    """
+    Conflicting fields side by side (your edit / the saved version) with a
+    choice per field, then one save of the merged README.
+    """
+    return rx.el.div(
+        rx.el.div(
+            rx.icon("git-merge", class_name="w-5 h-5 text-amber-600 mr-2"),
+            rx.el.p(
+                "Someone else saved this README while you were editing. Choose which value to keep for each field.",
+                class_name="text-sm text-amber-800"
+            ),
+            class_name="flex items-center mb-3"
+        ),
+        rx.foreach(
+            EvaluationLibraryState.readme_conflict_fields,
+            lambda field: readme_conflict_row(field)
+        ),
+        rx.el.div(
+            rx.el.button(
+                "Save merged",
+                on_click=EvaluationLibraryState.apply_readme_merge,
+                class_name="px-4 py-2 bg-indigo-600 text-white rounded hover:bg-indigo-700"
+            ),
+            class_name="flex justify-end mt-3"
+        ),
+        class_name="mb-6 p-4 border border-amber-300 bg-amber-50 rounded-lg"
+    )
+
+
+def readme_conflict_value(field: rx.Var, side: str, label: str) -> rx.Component:
+    """One side of a conflicting field; click to keep it."""
+    return rx.el.button(
+        rx.el.p(label, class_name="text-xs font-medium text-gray-500 mb-1"),
+        rx.el.p(field[side], class_name="text-sm text-gray-800 whitespace-pre-wrap max-h-40 overflow-y-auto"),
+        on_click=EvaluationLibraryState.choose_readme_conflict_value(field["column"], side),
+        class_name=rx.cond(
+            field["choice"] == side,
+            "flex-1 text-left p-3 rounded border-2 border-indigo-500 bg-white",
+            "flex-1 text-left p-3 rounded border border-gray-300 bg-white hover:bg-gray-50"
+        )
+    )
+
+
+def readme_conflict_row(field: rx.Var) -> rx.Component:
+    """A conflicting README field: your value and the saved value."""
+    return rx.el.div(
+        rx.el.p(field["label"], class_name="text-sm font-semibold text-gray-700 mb-1"),
+        rx.el.div(
+            readme_conflict_value(field, "mine", "Your edit"),
+            readme_conflict_value(field, "theirs", "Saved by someone else"),
+            class_name="flex gap-3"
+        ),
+        class_name="mb-3"
+    )
+
+
 # Placeholder functions for other sections
 def default_content() -> rx.Component:
     return rx.el.div(
@@ -8,8 +8,13 @@ import reflex as rx
 from ltx_automation_app.states.ltx_bench_state import (
     FilePrepState,
     LTXBenchNavigationState,
-    EvaluationLibraryState  # To load README and metrics from database
+    EvaluationLibraryState,  # To load README and metrics from database
+    METRIC_LIST_HEIGHT_PX,
+    METRIC_LIST_ID,
+    METRIC_ROW_HEIGHT_PX,
 )
+from ltx_automation_app.components.infinite_scroll import infinite_scroll_area
+from ltx_automation_app.components.virtual_list import virtual_list
 
 # NO MORE STATIC FILE IMPORTS!
 # All data comes from database through the state
@@ -54,7 +59,7 @@ def file_prep_view() -> rx.Component:
         # These event handlers populate the state vars from the database
         on_mount=[
             EvaluationLibraryState.load_readme_instructions,
-            EvaluationLibraryState.load_all_metrics  # This was being called but the method didn't exist!
+            FilePrepState.load_metric_list
         ]
     )
 
@@ -81,7 +86,7 @@ def step_2_metrics_selection() -> rx.Component:
             rx.el.div(
                 # This foreach now references a properly defined state var
                 rx.foreach(
-                    EvaluationLibraryState.all_metrics,  # This now exists!
+                    EvaluationLibraryState.visible_metrics,
                     lambda metric: rx.el.div(
                         rx.checkbox(
                             rx.el.div(
@@ -205,12 +210,12 @@ def progress_indicator() -> rx.Component:
 def custom_metrics_datalist() -> rx.Component:
     """
     Create datalist for custom metrics suggestions from database.
-    Uses metrics loaded from database instead of static files.
+    Holds only the names matching what is typed in the custom metric input.
     """
     return rx.el.datalist(
         rx.foreach(
-            EvaluationLibraryState.all_metrics,
-            lambda metric: rx.el.option(metric["name"])
+            FilePrepState.custom_metric_suggestions,
+            lambda name: rx.el.option(name)
         ),
         id="custom_metrics_list"
     )
@@ -229,8 +234,8 @@ def step_1_readme_config() -> rx.Component:
                 rx.foreach(
                     EvaluationLibraryState.readme_instructions,
                     lambda readme: rx.el.option(
-                        readme["README_TITLE"],
-                        value=str(readme["README_ID"])
+                        readme["title"],
+                        value=readme["id"]
                     )
                 ),
                 value=FilePrepState.selected_readme_template,
@@ -297,6 +302,59 @@ def step_1_readme_config() -> rx.Component:
     )
 
 
+def metric_option(metric: dict, highlighted: bool = False) -> rx.Component:
+    """
+    Selectable metric card. Search results render the HTML-escaped
+    name/definition highlights from the full-text search; rows of the
+    virtualized list have a fixed height (definition clipped to two lines).
+    """
+    return rx.el.div(
+        rx.checkbox(
+            rx.el.div(
+                rx.html(metric["name_highlight"], class_name="font-medium")
+                if highlighted
+                else rx.el.span(metric["name"], class_name="font-medium"),
+                rx.el.span(f" ({metric['type']})", class_name="text-sm text-gray-500"),
+                class_name="flex items-center"
+            ),
+            checked=FilePrepState.selected_metric_ids.contains(metric["id"]),
+            on_change=lambda: FilePrepState.toggle_metric(metric["id"])
+        ),
+        rx.html(metric["definition_snippet"], class_name="ml-6 text-sm text-gray-600 mt-1")
+        if highlighted
+        else rx.el.p(
+            metric["definition"],
+            class_name="ml-6 text-sm text-gray-600 mt-1 line-clamp-2"
+        ),
+        class_name="mb-3 p-3 border rounded hover:bg-gray-50"
+        if highlighted
+        else "h-full p-3 border rounded hover:bg-gray-50 overflow-hidden"
+    )
+
+
+def bulk_metric_button(label, on_click) -> rx.Component:
+    """Small outline button for a bulk metric selection action."""
+    return rx.el.button(
+        label,
+        on_click=on_click,
+        class_name="px-3 py-1 text-sm border border-gray-300 rounded hover:bg-gray-50"
+    )
+
+
+def metric_filter_chip(option: dict) -> rx.Component:
+    """Toggleable facet value filter showing its metric count."""
+    return rx.el.button(
+        option["label"],
+        rx.el.span(option["count"], class_name="ml-1 text-xs opacity-70"),
+        on_click=lambda: FilePrepState.toggle_metric_filter(option["facet"], option["value"]),
+        class_name=rx.cond(
+            option["selected"] == "Y",
+            "px-2 py-1 text-sm rounded-full border border-indigo-300 bg-indigo-100 text-indigo-700",
+            "px-2 py-1 text-sm rounded-full border border-gray-300 bg-white text-gray-700 hover:bg-gray-50"
+        )
+    )
+
+
 def step_2_metrics_selection() -> rx.Component:
     """Step 2: Metrics Selection from database."""
     return rx.el.div(
@@ -313,30 +371,61 @@ def step_2_metrics_selection() -> rx.Component:
             class_name="mb-4"
         ),
         
-        # Metrics from database
+        # Facet filters with the number of metrics each would leave
+        rx.el.div(
+            rx.foreach(
+                FilePrepState.metric_filter_options,
+                lambda option: metric_filter_chip(option)
+            ),
+            rx.cond(
+                FilePrepState.metric_filter_options.length() > 0,
+                rx.el.button(
+                    "Clear filters",
+                    on_click=FilePrepState.clear_metric_filters,
+                    class_name="px-2 py-1 text-xs text-gray-500 hover:text-gray-700 underline"
+                ),
+            ),
+            class_name="flex flex-wrap gap-2 mb-4"
+        ),
+        
+        # Bulk selection (each action is one event, however many metrics it selects)
+        rx.el.div(
+            bulk_metric_button(
+                rx.cond(FilePrepState.metric_search != "", "Select all results", "Select all filtered"),
+                FilePrepState.select_all_shown_metrics
+            ),
+            bulk_metric_button("Select evergreen", FilePrepState.select_all_evergreen_metrics),
+            bulk_metric_button("Invert", FilePrepState.invert_metric_selection),
+            bulk_metric_button("Clear custom", FilePrepState.clear_metrics_by_type("CUSTOM")),
+            bulk_metric_button("Clear all", FilePrepState.clear_all_metrics),
+            class_name="flex flex-wrap gap-2 mb-4"
+        ),
+        
+        # Metrics from database: ranked search results (a page at a time as
+        # they are scrolled) while searching, otherwise a virtualized list
+        # that renders only the rows around the visible ones
         rx.el.div(
             rx.el.h3("Available Metrics", class_name="text-lg font-semibold mb-3"),
-            rx.el.div(
-                rx.foreach(
-                    EvaluationLibraryState.all_metrics,
-                    lambda metric: rx.el.div(
-                        rx.checkbox(
-                            rx.el.div(
-                                rx.el.span(metric["name"], class_name="font-medium"),
-                                rx.el.span(f" ({metric['type']})", class_name="text-sm text-gray-500"),
-                                class_name="flex items-center"
-                            ),
-                            checked=FilePrepState.selected_metrics.contains(metric["name"]),
-                            on_change=lambda: FilePrepState.toggle_metric(metric["name"])
-                        ),
-                        rx.el.p(
-                            metric["definition"],
-                            class_name="ml-6 text-sm text-gray-600 mt-1"
-                        ),
-                        class_name="mb-3 p-3 border rounded hover:bg-gray-50"
-                    )
+            rx.cond(
+                FilePrepState.metric_search != "",
+                infinite_scroll_area(
+                    rx.foreach(
+                        FilePrepState.metric_search_results,
+                        lambda metric: metric_option(metric, highlighted=True)
+                    ),
+                    on_load_more=FilePrepState.load_more_metrics,
+                    class_name="max-h-96 overflow-y-auto space-y-2"
+                ),
+                virtual_list(
+                    FilePrepState.metric_window,
+                    lambda metric: rx.el.div(metric_option(metric), class_name="h-full pb-2"),
+                    total=FilePrepState.metric_list_total,
+                    start=FilePrepState.metric_window_start,
+                    row_height=METRIC_ROW_HEIGHT_PX,
+                    on_scroll_window=FilePrepState.scroll_metric_list,
+                    height=METRIC_LIST_HEIGHT_PX,
+                    id=METRIC_LIST_ID,
                 ),
-                class_name="max-h-96 overflow-y-auto space-y-2"
             ),
             class_name="mb-6"
         ),
@@ -367,8 +456,8 @@ def step_2_metrics_selection() -> rx.Component:
             rx.el.h3("Selected Metrics", class_name="text-lg font-semibold mb-2"),
             rx.el.p(
                 rx.cond(
-                    FilePrepState.selected_metrics.length() > 0,
-                    f"{FilePrepState.selected_metrics.length()} metrics selected",
+                    FilePrepState.selected_metric_count > 0,
+                    f"{FilePrepState.selected_metric_count} metrics selected",
                     "No metrics selected"
                 ),
                 class_name="text-gray-600"
@@ -510,7 +599,7 @@ def step_5_review_export() -> rx.Component:
             rx.el.div(
                 rx.el.p(f"README Template: {FilePrepState.selected_readme_template}", 
                        class_name="mb-2"),
-                rx.el.p(f"Selected Metrics: {FilePrepState.selected_metrics.length()}", 
+                rx.el.p(f"Selected Metrics: {FilePrepState.selected_metric_count}", 
                        class_name="mb-2"),
                 rx.el.p(f"Uploaded Files: {FilePrepState.uploaded_files.length()}", 
                        class_name="mb-2"),
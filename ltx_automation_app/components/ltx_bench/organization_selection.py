@@ -9,6 +9,7 @@ from ltx_automation_app.states.ltx_bench_state import (
     LTXBenchNavigationState,
     ProjectManagementState
 )
+from ltx_automation_app.components.infinite_scroll import infinite_scroll_area
 
 
 def organization_selection_view() -> rx.Component:
@@ -54,7 +55,7 @@ def organization_selection_view() -> rx.Component:
                     "Select Existing Organization",
                     class_name="text-lg font-semibold text-gray-700 mt-6 mb-3",
                 ),
-                rx.el.div(
+                infinite_scroll_area(
                     rx.cond(
                         LTXBenchNavigationState.organizations.length() == 0,
                         rx.el.p(
@@ -66,6 +67,7 @@ def organization_selection_view() -> rx.Component:
                             lambda org: organization_button(org),
                         ),
                     ),
+                    on_load_more=LTXBenchNavigationState.load_more_organizations,
                     class_name="space-y-2 p-4 bg-white rounded-xl shadow border border-gray-200 max-h-[calc(100vh-420px)] overflow-y-auto",
                 ),
             ),
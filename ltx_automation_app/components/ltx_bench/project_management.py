@@ -9,6 +9,7 @@ from ltx_automation_app.states.ltx_bench_state import (
     LTXBenchNavigationState,
     ProjectManagementState
 )
+from ltx_automation_app.components.infinite_scroll import infinite_scroll_area
 
 
 def project_creation_and_selection_view() -> rx.Component:
@@ -78,7 +79,7 @@ def project_creation_and_selection_view() -> rx.Component:
                 "Select Existing Project",
                 class_name="text-lg font-semibold text-gray-700 mt-6 mb-3",
             ),
-            rx.el.div(
+            infinite_scroll_area(
                 rx.cond(
                     LTXBenchNavigationState.projects.length() == 0,
                     rx.el.p(
@@ -90,6 +91,7 @@ def project_creation_and_selection_view() -> rx.Component:
                         project_selector_button,
                     ),
                 ),
+                on_load_more=LTXBenchNavigationState.load_more_projects,
                 class_name="space-y-2 p-4 bg-white rounded-xl shadow border border-gray-200 max-h-[calc(100vh-520px)] overflow-y-auto",
             ),
         ),
@@ -0,0 +1,113 @@
+# ltx_automation_app/components/virtual_list.py
+"""
+Windowed (virtualized) list for long catalogs, paged on the server.
+
+Only the rows of the current window exist in the DOM. A spacer as tall as
+all rows together keeps the scrollbar true to the full list, and the
+window is shifted down to its position. As the list scrolls the state is
+sent the scroll position; when the visible rows near the edge of the
+window it fetches a new window around them (see window_for_scroll).
+
+Rows must have a fixed height (row_height, in px) so positions can be
+computed from the scroll offset.
+"""
+
+from typing import Optional, Tuple
+
+import reflex as rx
+from reflex.vars.base import Var
+from reflex.vars.object import ObjectVar
+
+# Rows fetched beyond each edge of the visible part of the list
+VIRTUAL_LIST_OVERSCAN_ROWS = 20
+
+
+def _scroll_position(e: ObjectVar) -> tuple[Var[float], Var[float]]:
+    """Args spec for on_scroll: scroll offset and viewport height in pixels."""
+    return (
+        Var(f"{e}.target.scrollTop").to(float),
+        Var(f"{e}.target.clientHeight").to(float),
+    )
+
+
+class VirtualListArea(rx.el.Div):
+    """Div whose on_scroll passes the scroll offset and viewport height."""
+
+    on_scroll: rx.EventHandler[_scroll_position]
+
+
+def window_for_scroll(
+    scroll_top: float,
+    viewport_height: float,
+    row_height: int,
+    start: int,
+    count: int,
+    total: int,
+) -> Optional[Tuple[int, int]]:
+    """
+    Window (start, limit) to fetch for a scroll position, or None while the
+    loaded window (start, count rows) still covers the visible rows with at
+    least half the overscan to spare on each side that has more rows.
+    """
+    first = max(0, int(scroll_top // row_height))
+    last = min(total, int((scroll_top + viewport_height) // row_height) + 1)
+    margin = VIRTUAL_LIST_OVERSCAN_ROWS // 2
+    end = start + count
+    if (start == 0 or first - start >= margin) and (end >= total or end - last >= margin):
+        return None
+    new_start = max(0, first - VIRTUAL_LIST_OVERSCAN_ROWS)
+    return new_start, last - new_start + VIRTUAL_LIST_OVERSCAN_ROWS
+
+
+def scroll_to_top(element_id: str):
+    """Event that scrolls a virtual list back to its first row (e.g. after filtering)."""
+    return rx.call_script(
+        f"(document.getElementById('{element_id}') || {{}}).scrollTop = 0"
+    )
+
+
+def virtual_list(
+    rows,
+    render_row,
+    *,
+    total,
+    start,
+    row_height: int,
+    on_scroll_window,
+    height: int = 384,
+    **props,
+) -> rx.Component:
+    """
+    Scrollable list that renders only the loaded window of rows.
+
+    Args:
+        rows: Var with the rows of the current window
+        render_row: Function rendering one row (placed in a row_height px box)
+        total: Var with the number of rows in the whole list
+        start: Var with the position of rows[0] in the whole list
+        row_height: Fixed row height in px
+        on_scroll_window: Event handler taking (scroll_top, viewport_height);
+            it should load the window given by window_for_scroll when that
+            is not None
+        height: Viewport height in px
+        props: Passed to the scroll container (id, class_name etc.)
+    """
+    return VirtualListArea.create(
+        rx.el.div(
+            rx.el.div(
+                rx.foreach(
+                    rows,
+                    lambda row: rx.el.div(
+                        render_row(row),
+                        style={"height": f"{row_height}px", "overflow": "hidden"},
+                    ),
+                ),
+                style={"transform": f"translateY({start * row_height}px)"},
+            ),
+            # Full-length spacer so the scrollbar reflects every row
+            style={"height": f"{total * row_height}px", "position": "relative"},
+        ),
+        on_scroll=on_scroll_window.throttle(100),
+        style={"height": f"{height}px", "overflowY": "auto"},
+        **props,
+    )
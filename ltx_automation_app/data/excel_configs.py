@@ -74,7 +74,8 @@ COLUMN_WIDTHS = {
         'M': 15,     # Rating (Not Weighted)
         'N': 15,     # Rating (Weighted)
         'O': 10,     # Tag/URL (custom metric)
-        'P': 30      # Additional notes
+        'P': 30,     # Additional notes
+        'Q': 40      # Pre-eval hints (optional, automated)
     },
     "part2": {
         "default": 10  # All columns width 10
@@ -165,7 +166,9 @@ SHEET_CONFIGS = {
         "name_template": "PART 1 - MODEL {letter}",
         "tab_color": "FFFFFF", 
         "show_gridlines": False,
-        "freeze_panes": "A2"
+        "freeze_panes": "A2",
+        "hint_column": "Q",
+        "hint_header": "AUTO HINTS (length / chrF / BLEU / copy)"
     },
     "part2": {
         "name": "PART 2 - DATA ANALYSIS",
@@ -5,31 +5,137 @@ Exports all models and database utilities
 """
 
 from .models import (
+    ACTIVE_STATUS,
+    RETIRED_STATUS,
     Organization,
     Project,
     Template,
     ReadmeInstruction,
     Metric,
     Evaluation,
-    EvaluationMetric
+    EvaluationMetric,
+    MetricScoreCache,
+    CatalogChange,
+    CatalogSource,
+    CatalogRevision
 )
 
 from .database_config import (
     seed_database,
     get_all_organizations,
     get_organization_projects,
+    get_organization_id,
+    invalidate_organization_cache,
     get_all_metrics,
     get_evergreen_metrics,
     get_custom_metrics,  # Added this since it's in the updated database_config
     get_all_templates,
     get_all_readme_instructions,  # Changed from get_all_instructions
     get_readme_by_title,  # Added these new functions too
-    get_metric_by_name    # Added these new functions too
+    get_readme_text,
+    get_metric_by_name,    # Added these new functions too
+    # Async variants for async event handlers
+    get_organization_id_async
+)
+
+from .score_cache import (
+    score_cache_key,
+    lookup_cached_scores,
+    store_cached_scores,
+    score_metrics_with_cache,
+    score_with_cache,
+    get_score_cache_stats
+)
+
+from .sqlite_tuning import (
+    install_sqlite_tuning,
+    get_sqlite_pragmas,
+    set_sqlite_profile
+)
+
+from .engine import (
+    configure_database_engines,
+    POOL_SETTINGS
+)
+
+from .bulk_ingest import ingest_evaluation_results
+
+from .catalog_cache import (
+    catalog_version,
+    catalog_versions,
+    clear_catalog_cache,
+    get_metric_catalog,
+    get_readme_catalog,
+    get_metric_options,
+    get_readme_options,
+    get_readme_dropdown_options,
+    get_readme_facets
+)
+
+from .read_snapshot import (
+    load_read_snapshot,
+    snapshot_session
+)
+
+from .catalog_changes import (
+    get_catalog_feed_version,
+    get_catalog_changes,
+    apply_catalog_changes,
+    record_catalog_reload,
+    prune_catalog_changes
+)
+
+from .catalog_archive import (
+    archive_readme,
+    restore_readme,
+    get_archived_readmes
+)
+
+from .catalog_edits import (
+    CatalogEditConflict,
+    update_catalog_row
+)
+
+from .maintenance import (
+    run_database_maintenance,
+    database_maintenance_task,
+    get_storage_stats
+)
+
+from .catalog_revisions import (
+    get_revision_text,
+    get_revision_history,
+    get_revision_stats
+)
+
+from .catalog_search import (
+    search_metrics,
+    search_metric_ids,
+    search_readmes,
+    create_search_index,
+    rebuild_search_index
+)
+
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    get_organizations_page,
+    get_organization_projects_page,
+    get_organizations_page_async,
+    get_organization_projects_page_async
+)
+
+from .metric_index import (
+    MetricFacetIndex,
+    get_metric_facet_index,
+    get_filtered_metrics_page,
+    get_metrics_window
 )
 
 # Initialize database on import
-# This ensures tables are created and seeded when the app starts
-# Removed since we don't have db_config instance anymore
+# Tables are created by migrations; here we only hook engine connect so
+# every SQLite connection gets the performance pragmas (WAL, cache, mmap)
+install_sqlite_tuning()
 
 __all__ = [
     # Models
@@ -40,16 +146,106 @@ __all__ = [
     "Metric",
     "Evaluation",
     "EvaluationMetric",
+    "MetricScoreCache",
+    "CatalogChange",
+    "CatalogSource",
+    "CatalogRevision",
+    "ACTIVE_STATUS",
+    "RETIRED_STATUS",
     
     # Database utilities
     "seed_database",
     "get_all_organizations",
     "get_organization_projects",
+    "get_organization_id",
+    "invalidate_organization_cache",
     "get_all_metrics",
     "get_evergreen_metrics",
     "get_custom_metrics",
     "get_all_templates",
     "get_all_readme_instructions",
     "get_readme_by_title",
-    "get_metric_by_name"
+    "get_readme_text",
+    "get_metric_by_name",
+    "get_organization_id_async",
+    
+    # Score cache
+    "score_cache_key",
+    "lookup_cached_scores",
+    "store_cached_scores",
+    "score_metrics_with_cache",
+    "score_with_cache",
+    "get_score_cache_stats",
+    
+    # SQLite tuning
+    "install_sqlite_tuning",
+    "get_sqlite_pragmas",
+    "set_sqlite_profile",
+    
+    # Engines and bulk ingestion
+    "configure_database_engines",
+    "POOL_SETTINGS",
+    "ingest_evaluation_results",
+    
+    # Shared catalog cache
+    "catalog_version",
+    "catalog_versions",
+    "clear_catalog_cache",
+    "get_metric_catalog",
+    "get_readme_catalog",
+    "get_metric_options",
+    "get_readme_options",
+    "get_readme_dropdown_options",
+    "get_readme_facets",
+    
+    # Catalog read snapshot
+    "load_read_snapshot",
+    "snapshot_session",
+    
+    # Catalog change feed
+    "get_catalog_feed_version",
+    "get_catalog_changes",
+    "apply_catalog_changes",
+    "record_catalog_reload",
+    "prune_catalog_changes",
+    
+    # Catalog archive
+    "archive_readme",
+    "restore_readme",
+    "get_archived_readmes",
+    
+    # Optimistic catalog edits
+    "CatalogEditConflict",
+    "update_catalog_row",
+    
+    # Database maintenance
+    "run_database_maintenance",
+    "database_maintenance_task",
+    "get_storage_stats",
+    
+    # Catalog revision history
+    "get_revision_text",
+    "get_revision_history",
+    "get_revision_stats",
+    
+    # Catalog search
+    "search_metrics",
+    "search_metric_ids",
+    "search_readmes",
+    "create_search_index",
+    "rebuild_search_index",
+    
+    # Keyset pagination
+    "encode_cursor",
+    "decode_cursor",
+    "get_organizations_page",
+    "get_organization_projects_page",
+    "get_organizations_page_async",
+    "get_organization_projects_page_async",
+    
+    # Metric facet index
+    "MetricFacetIndex",
+    "get_metric_facet_index",
+    "get_filtered_metrics_page",
+    "get_metrics_window"
 ]
\ No newline at end of file
@@ -0,0 +1,75 @@
+# ltx_automation_app/database/bulk_ingest.py
+"""
+Bulk ingestion of evaluation results.
+
+On PostgreSQL rows are streamed with COPY (asyncpg copy_records_to_table),
+which skips per-row statement overhead entirely. On SQLite the same rows
+go through one executemany INSERT inside a single transaction.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import reflex as rx
+import sqlalchemy
+from reflex import model as rx_model
+
+from .models import EvaluationMetric
+
+logger = logging.getLogger(__name__)
+
+# Columns written by bulk ingestion; created_at is filled by the server default
+RESULT_COLUMNS = ["evaluation_id", "metric_id", "value", "notes"]
+
+
+async def _copy_results_postgres(engine, rows: Sequence[Dict[str, Any]]):
+    """Stream rows into evaluationmetric with PostgreSQL COPY."""
+    records = [tuple(row.get(column) for column in RESULT_COLUMNS) for row in rows]
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            EvaluationMetric.__tablename__,
+            records=records,
+            columns=RESULT_COLUMNS,
+        )
+
+
+async def _insert_results_executemany(url: Optional[str], rows: Sequence[Dict[str, Any]]):
+    """Insert rows with one executemany in a single transaction."""
+    payload = [{column: row.get(column) for column in RESULT_COLUMNS} for row in rows]
+    async with rx.asession(url) as session:
+        await session.exec(sqlalchemy.insert(EvaluationMetric), params=payload)
+        await session.commit()
+
+
+async def ingest_evaluation_results(
+    rows: Sequence[Dict[str, Any]],
+    url: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Bulk insert evaluation results (EvaluationMetric rows).
+
+    Args:
+        rows: Dicts with evaluation_id, metric_id, value and notes
+        url: Async database URL; defaults to async_db_url from rxconfig
+
+    Returns:
+        Rows written, method used ("copy" or "executemany") and rows/second
+    """
+    if not rows:
+        return {"rows": 0, "method": None, "rows_per_sec": 0.0}
+
+    engine = rx_model.get_async_engine(url)
+    start = time.perf_counter()
+    if engine.dialect.name == "postgresql" and engine.dialect.driver == "asyncpg":
+        method = "copy"
+        await _copy_results_postgres(engine, rows)
+    else:
+        method = "executemany"
+        await _insert_results_executemany(url, rows)
+    elapsed = time.perf_counter() - start
+
+    rate = len(rows) / elapsed if elapsed else float("inf")
+    logger.info(f"Ingested {len(rows)} evaluation results via {method} ({rate:,.0f} rows/s)")
+    return {"rows": len(rows), "method": method, "rows_per_sec": rate}
@@ -0,0 +1,74 @@
+# ltx_automation_app/database/catalog_archive.py
+"""
+Archive and restore README catalog rows.
+
+The catalogs are split into an active and an archived partition by
+STATUS_IND. Archiving sets a row to "Retired": it drops out of the catalog
+cache, dropdowns, search and listings, which only read Active rows through
+the partial "active" indexes, but it stays in its table so evaluations
+that used it keep their foreign keys and old versions stay queryable.
+Restoring sets it back to "Active". The README library lists the archived
+README instructions and restores them.
+
+Writes go through the ORM so the catalog cache version and the change feed
+pick them up (an archived row reaches states as a feed delete).
+"""
+
+import logging
+from typing import List, Optional
+
+import reflex as rx
+from sqlmodel import select
+
+from .models import ACTIVE_STATUS, RETIRED_STATUS, ReadmeInstruction
+
+logger = logging.getLogger(__name__)
+
+
+def _set_status(model, row_id: int, status: str) -> Optional[str]:
+    """Set a catalog row's STATUS_IND. Returns the row's key name, None if missing."""
+    with rx.session() as session:
+        row = session.get(model, row_id)
+        if row is None:
+            return None
+        name = row.README_TITLE
+        if row.STATUS_IND != status:
+            row.STATUS_IND = status
+            session.add(row)
+            session.commit()
+            logger.info(f"Set {model.__tablename__} {row_id} ({name}) to {status}")
+        return name
+
+
+def _archived(model, order_column) -> list:
+    with rx.session() as session:
+        return session.exec(
+            select(model).where(model.STATUS_IND != ACTIVE_STATUS).order_by(order_column)
+        ).all()
+
+
+# ============ README instructions ============
+
+def archive_readme(readme_id: int) -> Optional[str]:
+    """
+    Archive a README instruction. Returns its title, None if it does not exist.
+    Should be called from within a State event handler.
+    """
+    return _set_status(ReadmeInstruction, readme_id, RETIRED_STATUS)
+
+
+def restore_readme(readme_id: int) -> Optional[str]:
+    """
+    Restore an archived README instruction. Returns its title, None if it does not exist.
+    Should be called from within a State event handler.
+    """
+    return _set_status(ReadmeInstruction, readme_id, ACTIVE_STATUS)
+
+
+def get_archived_readmes() -> List[ReadmeInstruction]:
+    """
+    Get the archived (non-Active) README instructions ordered by title.
+    Should be called from within a State event handler.
+    """
+    return _archived(ReadmeInstruction, ReadmeInstruction.README_TITLE)
+
@@ -0,0 +1,301 @@
+# ltx_automation_app/database/catalog_cache.py
+"""
+Process-wide read-through cache of the Metric and README catalogs.
+
+The catalogs are the same for every user, so they are read from the
+database once per process and shared by all sessions. The version of a
+catalog is the id of its latest catalogchange entry (see catalog_changes),
+which every catalog write logs in its own transaction. Each read checks
+that id (one indexed lookup), so writes from any process - another
+worker, the catalog importer - are picked up; cached values are rebuilt
+lazily on the first read after the version moved.
+
+Only Active rows are cached: Retired (archived) rows stay in their tables
+for history but are read through the partial "active" indexes, so the
+hot path never scans them (see catalog_archive).
+
+States keep the version they last loaded (see catalog_version) and skip
+the reload, and the resend to the client, while it is unchanged.
+
+Cached lists and dicts are shared between sessions: treat them as
+read-only and assign new lists instead of mutating them in place.
+
+README facets (distinct values with row counts, for the dropdowns)
+come from one GROUP BY over all facet columns of the catalog. The result
+(one row per value combination, small even for large catalogs) is
+cached per catalog version and rolled up per facet in Python, which
+also gives cross-filtered counts without another query. Metric facet
+counts come from the bitmap index in metric_index; METRIC_FACETS names
+the columns it indexes.
+"""
+
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import reflex as rx
+import sqlalchemy
+from sqlalchemy.orm import defer
+from sqlmodel import func, select
+
+from .models import ACTIVE_STATUS, CatalogChange, Metric, ReadmeInstruction
+
+logger = logging.getLogger(__name__)
+
+METRIC_CATALOG = "metric"
+README_CATALOG = "readme"
+
+CATALOG_TABLES = {
+    Metric.__tablename__: METRIC_CATALOG,
+    ReadmeInstruction.__tablename__: README_CATALOG,
+}
+CATALOG_MODELS = {Metric: METRIC_CATALOG, ReadmeInstruction: README_CATALOG}
+
+_entries: Dict[str, Tuple[int, Any]] = {}
+_lock = threading.RLock()
+# Engines known to have a table, by table name (only hits are remembered,
+# so a table created by a later migration is still picked up)
+_known_tables: Dict[str, "weakref.WeakSet"] = {}
+
+
+def has_table(connection, name: str) -> bool:
+    """
+    True if the database behind a Connection has the table. The catalog
+    write hooks use it to stay out of databases without the bookkeeping
+    tables (scratch benchmark databases, a database not yet migrated).
+    """
+    known = _known_tables.setdefault(name, weakref.WeakSet())
+    if connection.engine in known:
+        return True
+    if not sqlalchemy.inspect(connection).has_table(name):
+        return False
+    known.add(connection.engine)
+    return True
+
+
+# ============ Versioning ============
+
+def catalog_versions() -> Dict[str, int]:
+    """
+    Current version of each catalog ({"metric": id, "readme": id}): the id
+    of its latest change log entry, 0 if it never changed. Read from the
+    database on every call (one query, two index lookups).
+    """
+    latest = {
+        catalog: select(func.max(CatalogChange.id))
+        .where(CatalogChange.catalog == catalog)
+        .scalar_subquery()
+        for catalog in (METRIC_CATALOG, README_CATALOG)
+    }
+    with rx.session() as session:
+        row = session.exec(select(*latest.values())).one()
+    return {catalog: version or 0 for catalog, version in zip(latest, row)}
+
+
+def catalog_version(catalog: str) -> int:
+    """Current version of a catalog ("metric" or "readme"), see catalog_versions."""
+    return catalog_versions()[catalog]
+
+
+# ============ Read-through cache ============
+
+def _cached(key: str, catalog: str, loader: Callable[[], Any]) -> Any:
+    """Return the cached value for key, reloading it if its catalog changed."""
+    # Read before loading: a write that lands in between makes the next
+    # read reload again instead of keeping its rows under an old version
+    version = catalog_version(catalog)
+    entry = _entries.get(key)
+    if entry is not None and entry[0] >= version:
+        return entry[1]
+    with _lock:
+        # Another session may have reloaded while we waited
+        entry = _entries.get(key)
+        if entry is not None and entry[0] >= version:
+            return entry[1]
+        value = loader()
+        _entries[key] = (version, value)
+        return value
+
+
+def clear_catalog_cache():
+    """Drop all cached catalog values (they reload on next read)."""
+    with _lock:
+        _entries.clear()
+
+
+def metric_catalog_row(metric: Metric) -> Dict[str, str]:
+    """Catalog dict for one metric (id, name, type, definition, notes, status, version)."""
+    return {
+        "id": str(metric.id),
+        "name": metric.METRIC_NAME,
+        "type": metric.METRIC_TYPE,
+        "definition": metric.METRIC_DEF or "",
+        "notes": metric.METRIC_NOTES or "",
+        "status": metric.STATUS_IND or ACTIVE_STATUS,
+        "version": str(metric.VERSION),
+    }
+
+
+def readme_catalog_row(instruction: ReadmeInstruction) -> Dict[str, str]:
+    """
+    Catalog summary of one README instruction (id, title, facets, status,
+    version). README_TXT is left out: lists ship these rows to the browser,
+    the text of the selected README is fetched with get_readme_text.
+    """
+    return {
+        "id": str(instruction.id),
+        "title": instruction.README_TITLE,
+        "score_type": instruction.SCORE_TYPE or "",
+        "eval_type": instruction.EVAL_TYPE or "",
+        "pre_eval_context": instruction.PRE_EVAL_CONTEXT or "",
+        "default_ind": instruction.DEFAULT_IND or "N",
+        "custom_ind": instruction.CUSTOM_IND or "Y",
+        "status": instruction.STATUS_IND or ACTIVE_STATUS,
+        "version": str(instruction.VERSION),
+    }
+
+
+def _load_metrics() -> List[Dict[str, str]]:
+    with rx.session() as session:
+        metrics = session.exec(
+            select(Metric).where(Metric.STATUS_IND == ACTIVE_STATUS).order_by(Metric.id)
+        ).all()
+        return [metric_catalog_row(metric) for metric in metrics]
+
+
+def _load_readmes() -> List[Dict[str, str]]:
+    with rx.session() as session:
+        instructions = session.exec(
+            select(ReadmeInstruction)
+            .options(defer(ReadmeInstruction.README_TXT))  # Not part of the summary
+            .where(ReadmeInstruction.STATUS_IND == ACTIVE_STATUS)
+            .order_by(ReadmeInstruction.id)
+        ).all()
+        return [readme_catalog_row(instruction) for instruction in instructions]
+
+
+def get_metric_catalog() -> List[Dict[str, str]]:
+    """
+    Get the Active metrics as dicts (id, name, type, definition, notes,
+    status). Shared, read-only list.
+    """
+    return _cached("metrics", METRIC_CATALOG, _load_metrics)
+
+
+def get_readme_catalog() -> List[Dict[str, str]]:
+    """
+    Get the Active README instructions as summary dicts (see
+    readme_catalog_row). Shared, read-only list.
+    """
+    return _cached("readmes", README_CATALOG, _load_readmes)
+
+
+def get_metric_options() -> List[Dict[str, str]]:
+    """Get Active metrics as dropdown options (id, name, type, definition)."""
+    return _cached(
+        "metric_options",
+        METRIC_CATALOG,
+        lambda: [
+            {"id": m["id"], "name": m["name"], "type": m["type"], "definition": m["definition"]}
+            for m in get_metric_catalog()
+        ],
+    )
+
+
+def get_readme_options() -> List[Dict[str, str]]:
+    """Get Active README instructions as dropdown options (id, title, type)."""
+    return _cached(
+        "readme_options",
+        README_CATALOG,
+        lambda: [
+            {"id": r["id"], "title": r["title"], "type": r["eval_type"] or "GENERAL"}
+            for r in get_readme_catalog()
+        ],
+    )
+
+
+# ============ Facets ============
+
+README_FACETS = {
+    "eval_type": ReadmeInstruction.EVAL_TYPE,
+    "score_type": ReadmeInstruction.SCORE_TYPE,
+    "pre_eval_context": ReadmeInstruction.PRE_EVAL_CONTEXT,
+}
+METRIC_FACETS = {
+    "metric_type": Metric.METRIC_TYPE,
+    "eval_type": Metric.EVAL_TYPE,
+    "content_type": Metric.CONTENT_TYPE,
+    "genai_ind": Metric.GENAI_IND,
+    "mt_llm_ind": Metric.MT_LLM_IND,
+}
+
+
+def _load_facet_combinations(model, columns, active_only: bool) -> List[Tuple[tuple, int]]:
+    """Row count per distinct combination of the facet columns, in one grouped query."""
+    query = select(*columns, func.count()).group_by(*columns)
+    if active_only:
+        query = query.where(model.STATUS_IND == ACTIVE_STATUS)
+    with rx.session() as session:
+        return [(tuple(row[:-1]), row[-1]) for row in session.exec(query).all()]
+
+
+def _facet_counts(
+    names: List[str],
+    combinations: List[Tuple[tuple, int]],
+    selected: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Roll combinations up into per-facet value counts, sorted by value.
+    With a selection, each facet counts the rows matching the selected
+    values of the other facets (the usual drill-down behaviour).
+    """
+    selected = {name: value for name, value in (selected or {}).items() if value and name in names}
+    wanted = [(names.index(name), value) for name, value in selected.items()]
+    facets = {}
+    for position, name in enumerate(names):
+        counts: Dict[str, int] = {}
+        for values, count in combinations:
+            if any(values[i] != value for i, value in wanted if i != position):
+                continue
+            value = values[position]
+            if value:
+                counts[value] = counts.get(value, 0) + count
+        facets[name] = [{"value": value, "count": counts[value]} for value in sorted(counts)]
+    return facets
+
+
+def _get_facets(catalog: str, model, facets: Dict[str, Any], active_only: bool, selected):
+    combinations = _cached(
+        f"facets:{catalog}:{active_only}",
+        catalog,
+        lambda: _load_facet_combinations(model, list(facets.values()), active_only),
+    )
+    return _facet_counts(list(facets), combinations, selected)
+
+
+def get_readme_facets(
+    active_only: bool = False,
+    selected: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get README facets {"eval_type"|"score_type"|"pre_eval_context":
+    [{"value", "count"}]} with non-empty values sorted. `selected` maps
+    facet names to chosen values to get cross-filtered counts.
+    """
+    return _get_facets(README_CATALOG, ReadmeInstruction, README_FACETS, active_only, selected)
+
+
+def get_readme_dropdown_options() -> Dict[str, List[str]]:
+    """
+    Get the distinct non-empty EVAL_TYPE, SCORE_TYPE and PRE_EVAL_CONTEXT
+    values, keyed "eval_type", "score_type" and "pre_eval_context".
+    """
+    return _cached(
+        "readme_dropdowns",
+        README_CATALOG,
+        lambda: {
+            name: [facet["value"] for facet in values]
+            for name, values in get_readme_facets().items()
+        },
+    )
@@ -0,0 +1,260 @@
+# ltx_automation_app/database/catalog_changes.py
+"""
+Change feed for the Metric and README catalogs.
+
+Every insert, update and delete of a Metric or ReadmeInstruction is logged
+to the catalogchange table in the same transaction as the write. The log
+id is the feed version: a state that holds version N asks for the changes
+after N and patches its list, so re-entering a view costs one indexed
+query (and nothing is resent) when the catalog did not change, and work
+proportional to the edits when it did.
+
+Bulk insert/update/delete statements do not expose the affected ids; they
+log a single "reload" entry, which tells readers to fetch the whole catalog.
+Code that writes through a raw connection should call record_catalog_reload.
+Writes to a database without the catalogchange table (scratch benchmark
+databases) are not logged.
+
+The log is trimmed by prune_catalog_changes (run by database maintenance)
+to the last CHANGE_FEED_RETENTION_DAYS days. Each catalog keeps a
+watermark row (catalog "<catalog>:pruned", row_id = the newest entry of
+that catalog pruned so far); a reader whose version is below it missed
+pruned changes and is told to reload. Version queries match the catalog
+name exactly, so watermark rows never move a catalog version.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import reflex as rx
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import func, select
+
+from .catalog_cache import (
+    CATALOG_MODELS,
+    CATALOG_TABLES,
+    METRIC_CATALOG,
+    README_CATALOG,
+    catalog_version,
+    has_table,
+    metric_catalog_row,
+    readme_catalog_row,
+)
+from .models import ACTIVE_STATUS, CatalogChange, Metric, ReadmeInstruction
+
+logger = logging.getLogger(__name__)
+
+# More pending changes than this and a full reload is cheaper than a patch
+CHANGE_FEED_LIMIT = 500
+# Entries older than this are pruned (each catalog keeps its latest one)
+CHANGE_FEED_RETENTION_DAYS = float(os.environ.get("LTX_CHANGE_FEED_RETENTION_DAYS", 7))
+
+_CATALOG_ROWS = {
+    METRIC_CATALOG: (Metric, metric_catalog_row),
+    README_CATALOG: (ReadmeInstruction, readme_catalog_row),
+}
+
+
+# ============ Recording ============
+
+def _after_flush(session, flush_context):
+    changes = []
+    for operation, objects in (
+        ("insert", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for obj in objects:
+            catalog = CATALOG_MODELS.get(type(obj))
+            if not catalog:
+                continue
+            if operation == "update" and not session.is_modified(obj):
+                continue
+            changes.append({"catalog": catalog, "row_id": obj.id, "operation": operation})
+    if changes:
+        connection = session.connection()
+        if has_table(connection, CatalogChange.__tablename__):
+            connection.execute(sqlalchemy.insert(CatalogChange.__table__), changes)
+
+
+# session.info key: catalogs that already logged a reload in this transaction
+_RELOADED_KEY = "ltx_catalog_reloads"
+
+
+def _do_orm_execute(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    catalog = CATALOG_TABLES.get(getattr(table, "name", None))
+    session = orm_execute_state.session
+    reloaded = session.info.setdefault(_RELOADED_KEY, set())
+    if catalog and catalog not in reloaded:
+        connection = session.connection()
+        if has_table(connection, CatalogChange.__tablename__):
+            record_catalog_reload(connection, catalog)
+        reloaded.add(catalog)
+
+
+def _end_transaction(session):
+    session.info.pop(_RELOADED_KEY, None)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "do_orm_execute", _do_orm_execute)
+event.listen(Session, "after_commit", _end_transaction)
+event.listen(Session, "after_rollback", _end_transaction)
+
+
+def record_catalog_reload(connection, catalog: str):
+    """
+    Log a "reload" entry for a catalog written without per-row tracking.
+    Call it on the connection (or session) that did the write, before commit.
+    """
+    connection.execute(
+        sqlalchemy.insert(CatalogChange.__table__),
+        {"catalog": catalog, "row_id": None, "operation": "reload"},
+    )
+
+
+def _latest_change_ids():
+    """Id of the latest entry of each catalog (the catalog versions)."""
+    return select(func.max(CatalogChange.id)).group_by(CatalogChange.catalog)
+
+
+def watermark_catalog(catalog: str) -> str:
+    """Catalog name of the watermark row holding how far a catalog was pruned."""
+    return f"{catalog}:pruned"
+
+
+def pruned_up_to(session, catalog: str) -> int:
+    """Id of the newest entry of a catalog removed by pruning (0 if none)."""
+    return session.exec(
+        select(CatalogChange.row_id).where(CatalogChange.catalog == watermark_catalog(catalog))
+    ).first() or 0
+
+
+def prune_catalog_changes(retention_days: float = CHANGE_FEED_RETENTION_DAYS) -> int:
+    """
+    Delete the change entries logged more than retention_days ago, except
+    the latest entry of each catalog (its id is the catalog version), and
+    move each catalog's watermark up to the newest entry deleted.
+    Returns the number of entries deleted.
+    Should be called from within a State event handler.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    with rx.session() as session:
+        trim = session.exec(
+            select(func.min(CatalogChange.id)).where(CatalogChange.changed_at >= cutoff)
+        ).one()
+        if trim is None:
+            trim = (session.exec(select(func.max(CatalogChange.id))).one() or 0) + 1
+        prunable = (
+            CatalogChange.catalog.in_(list(_CATALOG_ROWS)),
+            CatalogChange.id < trim,
+            CatalogChange.id.not_in(_latest_change_ids()),
+        )
+        newest_pruned = session.exec(
+            select(CatalogChange.catalog, func.max(CatalogChange.id))
+            .where(*prunable)
+            .group_by(CatalogChange.catalog)
+        ).all()
+        for catalog, newest in newest_pruned:
+            watermark = session.exec(
+                select(CatalogChange).where(CatalogChange.catalog == watermark_catalog(catalog))
+            ).first()
+            if watermark is None:
+                session.add(CatalogChange(catalog=watermark_catalog(catalog), row_id=newest, operation="pruned"))
+            else:
+                watermark.row_id = max(watermark.row_id or 0, newest)
+                session.add(watermark)
+        result = session.execute(sqlalchemy.delete(CatalogChange).where(*prunable))
+        session.commit()
+        return result.rowcount
+
+
+# ============ Reading ============
+
+def get_catalog_feed_version(catalog: str) -> int:
+    """
+    Get the latest change id for a catalog (0 if it never changed), which
+    is also its catalog_version.
+    Should be called from within a State event handler.
+    """
+    return catalog_version(catalog)
+
+
+def get_catalog_changes(catalog: str, since: int, limit: int = CHANGE_FEED_LIMIT) -> Dict[str, Any]:
+    """
+    Get the net changes to a catalog after feed version `since`.
+    Should be called from within a State event handler.
+
+    Returns:
+        version: feed version the changes bring the caller up to
+        reload: True if the caller must refetch the whole catalog
+            (bulk write, too many changes, or changes already pruned)
+        upserts: current catalog rows (dicts) for inserted/updated ids
+        deletes: ids (str) of deleted and archived rows (the catalog
+            lists hold Active rows only)
+    """
+    model, to_row = _CATALOG_ROWS[catalog]
+    with rx.session() as session:
+        entries = session.exec(
+            select(CatalogChange.id, CatalogChange.row_id, CatalogChange.operation)
+            .where(CatalogChange.catalog == catalog, CatalogChange.id > since)
+            .order_by(CatalogChange.id)
+            .limit(limit + 1)
+        ).all()
+        if not entries:
+            return {"version": since, "reload": False, "upserts": [], "deletes": []}
+
+        # Entries of this catalog up to its watermark were pruned
+        if (
+            len(entries) > limit
+            or since < pruned_up_to(session, catalog)
+            or any(entry.operation == "reload" for entry in entries)
+        ):
+            version = session.exec(
+                select(func.max(CatalogChange.id)).where(CatalogChange.catalog == catalog)
+            ).one()
+            return {"version": version, "reload": True, "upserts": [], "deletes": []}
+
+        # Net effect per row: the last operation wins
+        last_operation = {}
+        for entry in entries:
+            last_operation[entry.row_id] = entry.operation
+        changed_ids = [row_id for row_id, op in last_operation.items() if op != "delete"]
+
+        rows = session.exec(
+            select(model).where(model.id.in_(changed_ids), model.STATUS_IND == ACTIVE_STATUS)
+        ).all() if changed_ids else []
+        found = {row.id for row in rows}
+        deletes = [
+            str(row_id) for row_id, op in last_operation.items()
+            if op == "delete" or row_id not in found
+        ]
+        return {
+            "version": entries[-1].id,
+            "reload": False,
+            "upserts": [to_row(row) for row in rows],
+            "deletes": deletes,
+        }
+
+
+def apply_catalog_changes(rows: List[Dict[str, Any]], changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Return a new catalog list with the changes applied (rows replaced by id,
+    new rows appended, deleted rows dropped). The input list is not modified.
+    """
+    upserts = {row["id"]: row for row in changes["upserts"]}
+    deletes = set(changes["deletes"])
+    patched = [
+        upserts.pop(row["id"], row)
+        for row in rows
+        if row["id"] not in deletes
+    ]
+    patched.extend(sorted(upserts.values(), key=lambda row: int(row["id"])))
+    return patched
@@ -0,0 +1,76 @@
+# ltx_automation_app/database/catalog_edits.py
+"""
+Optimistic concurrency for Metric and README catalog edits.
+
+Catalog rows carry a VERSION that the ORM bumps on every update (the
+models map it as SQLAlchemy's version_id_col), and every ORM update is
+issued as "UPDATE ... WHERE id = ? AND VERSION = ?". An editor keeps the
+version of the row it started from and saves with update_catalog_row():
+if someone else saved in between, nothing is written and
+CatalogEditConflict carries the current row so the caller can merge and
+retry against its version. No row locks or long transactions are needed.
+
+The catalog importer bumps VERSION on the rows it updates as well.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import reflex as rx
+from sqlalchemy.orm.exc import StaleDataError
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogEditConflict(Exception):
+    """The row changed since the editor loaded it."""
+
+    def __init__(self, model, row_id: int, version: int, current: Dict[str, Any]):
+        super().__init__(
+            f"{model.__tablename__} {row_id} was changed by someone else (now version {version})"
+        )
+        self.row_id = row_id
+        self.version = version
+        # Current column values of the row
+        self.current = current
+
+
+def _conflict(model, row) -> CatalogEditConflict:
+    current = {column.name: getattr(row, column.name) for column in model.__table__.columns}
+    return CatalogEditConflict(model, row.id, row.VERSION, current)
+
+
+def update_catalog_row(model, row_id: int, expected_version: int, changes: Dict[str, Any]) -> Optional[int]:
+    """
+    Compare-and-set update of a Metric or ReadmeInstruction row: write
+    `changes` only if the row is still at expected_version.
+    Should be called from within a State event handler.
+
+    Returns:
+        The row's new VERSION (unchanged if there was nothing to write),
+        or None if the row does not exist.
+
+    Raises:
+        CatalogEditConflict: the row is at another version; nothing was written.
+    """
+    with rx.session() as session:
+        row = session.get(model, row_id)
+        if row is None:
+            return None
+        if row.VERSION != expected_version:
+            raise _conflict(model, row)
+        if not changes:
+            return row.VERSION
+        for column, value in changes.items():
+            setattr(row, column, value)
+        try:
+            session.commit()
+        except StaleDataError:
+            # Another writer committed between our read and our UPDATE
+            session.rollback()
+            row = session.get(model, row_id, populate_existing=True)
+            if row is None:
+                return None
+            logger.info(f"Edit conflict on {model.__tablename__} {row_id}")
+            raise _conflict(model, row)
+        return row.VERSION
@@ -0,0 +1,223 @@
+# ltx_automation_app/database/catalog_revisions.py
+"""
+Revision history of README_TXT and METRIC_DEF.
+
+Every ORM write that changes one of these texts adds a catalogrevision row
+for the new row VERSION, in the same transaction. Storing the full text
+each time would grow quickly with autosave, so most revisions hold only a
+zlib-compressed line diff against the previous revision, and every
+REVISION_SNAPSHOT_INTERVAL-th revision holds the full (compressed) text.
+Rebuilding any version reads its latest snapshot and applies at most
+REVISION_SNAPSHOT_INTERVAL - 1 diffs.
+
+Writes that bypass the ORM (the catalog importer) are not recorded as they
+happen; the next ORM edit notices that the stored history no longer ends
+with the text it replaces and stores that text as a snapshot first.
+Writes to a database without the catalogrevision table (scratch benchmark
+databases) are not recorded.
+"""
+
+import hashlib
+import json
+import logging
+import zlib
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional
+
+import reflex as rx
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import func, select
+
+from .catalog_cache import CATALOG_MODELS, METRIC_CATALOG, README_CATALOG, has_table
+from .models import CatalogRevision
+
+logger = logging.getLogger(__name__)
+
+# A full snapshot every N revisions bounds a rebuild to N - 1 diffs
+REVISION_SNAPSHOT_INTERVAL = 20
+
+# Versioned text column per catalog
+REVISION_COLUMNS = {
+    METRIC_CATALOG: "METRIC_DEF",
+    README_CATALOG: "README_TXT",
+}
+
+
+# ============ Encoding ============
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _encode_diff(old: str, new: str) -> bytes:
+    """
+    Line diff from old to new as compressed JSON: [start, end] copies old
+    lines, a string inserts text.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: List[Any] = []
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(new_lines[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode("utf-8"))
+
+
+def _apply_diff(old: str, data: bytes) -> str:
+    old_lines = old.splitlines(keepends=True)
+    return "".join(
+        "".join(old_lines[op[0]:op[1]]) if isinstance(op, list) else op
+        for op in json.loads(zlib.decompress(data))
+    )
+
+
+def _revision_row(catalog: str, row_id: int, version: int, text: str, previous: Optional[str], chain: int):
+    """Insert parameters for a revision: a diff against `previous`, or a snapshot if None."""
+    snapshot = previous is None or chain >= REVISION_SNAPSHOT_INTERVAL
+    return {
+        "catalog": catalog,
+        "row_id": row_id,
+        "version": version,
+        "is_snapshot": snapshot,
+        "chain": 0 if snapshot else chain,
+        "data": zlib.compress(text.encode("utf-8")) if snapshot else _encode_diff(previous, text),
+        "text_size": len(text.encode("utf-8")),
+        "text_hash": _text_hash(text),
+    }
+
+
+# ============ Recording ============
+
+def _record_revision(connection, catalog: str, obj, old_known: bool, old_text: Optional[str]):
+    new_text = getattr(obj, REVISION_COLUMNS[catalog]) or ""
+    version = obj.VERSION
+    latest = connection.execute(
+        sqlalchemy.select(CatalogRevision.version, CatalogRevision.chain, CatalogRevision.text_hash)
+        .where(CatalogRevision.catalog == catalog, CatalogRevision.row_id == obj.id)
+        .order_by(CatalogRevision.version.desc())
+        .limit(1)
+    ).first()
+
+    rows = []
+    previous, chain = None, 0
+    if old_known and latest is not None and latest.text_hash == _text_hash(old_text or ""):
+        previous, chain = old_text or "", latest.chain + 1
+    elif old_known and old_text and (latest is None or latest.version < version - 1):
+        # History starts here, or the text was changed outside the ORM:
+        # keep the replaced text as a snapshot first
+        rows.append(_revision_row(catalog, obj.id, version - 1, old_text, None, 0))
+        previous, chain = old_text, 1
+    rows.append(_revision_row(catalog, obj.id, version, new_text, previous, chain))
+    connection.execute(sqlalchemy.insert(CatalogRevision.__table__), rows)
+
+
+def _after_flush(session, flush_context):
+    for obj in list(session.new) + list(session.dirty):
+        catalog = CATALOG_MODELS.get(type(obj))
+        if not catalog:
+            continue
+        if not has_table(session.connection(), CatalogRevision.__tablename__):
+            return
+        if obj in session.new:
+            if getattr(obj, REVISION_COLUMNS[catalog]):
+                _record_revision(session.connection(), catalog, obj, False, None)
+            continue
+        history = sqlalchemy.inspect(obj).attrs[REVISION_COLUMNS[catalog]].history
+        if not history.added:
+            continue
+        old_known = bool(history.deleted)
+        old_text = history.deleted[0] if old_known else None
+        if old_known and (old_text or "") == (history.added[0] or ""):
+            continue
+        _record_revision(session.connection(), catalog, obj, old_known, old_text)
+
+
+event.listen(Session, "after_flush", _after_flush)
+
+
+# ============ Reading ============
+
+def get_revision_text(catalog: str, row_id: int, version: Optional[int] = None) -> Optional[str]:
+    """
+    Rebuild the text ("metric": METRIC_DEF, "readme": README_TXT) of a row
+    as of a row version (latest if None). Returns None if no revision that
+    old is stored.
+    Should be called from within a State event handler.
+    """
+    scope = [CatalogRevision.catalog == catalog, CatalogRevision.row_id == row_id]
+    if version is not None:
+        scope.append(CatalogRevision.version <= version)
+    with rx.session() as session:
+        snapshot_version = session.exec(
+            select(func.max(CatalogRevision.version)).where(*scope, CatalogRevision.is_snapshot)
+        ).one()
+        if snapshot_version is None:
+            return None
+        revisions = session.exec(
+            select(CatalogRevision.is_snapshot, CatalogRevision.data)
+            .where(*scope, CatalogRevision.version >= snapshot_version)
+            .order_by(CatalogRevision.version)
+        ).all()
+    text = ""
+    for is_snapshot, data in revisions:
+        text = zlib.decompress(data).decode("utf-8") if is_snapshot else _apply_diff(text, data)
+    return text
+
+
+def get_revision_history(catalog: str, row_id: int) -> List[Dict[str, Any]]:
+    """
+    List a row's stored revisions, newest first (version, snapshot,
+    text_size, stored_size, created_at); get the text with get_revision_text.
+    Should be called from within a State event handler.
+    """
+    with rx.session() as session:
+        rows = session.exec(
+            select(
+                CatalogRevision.version,
+                CatalogRevision.is_snapshot,
+                CatalogRevision.text_size,
+                func.length(CatalogRevision.data),
+                CatalogRevision.created_at,
+            )
+            .where(CatalogRevision.catalog == catalog, CatalogRevision.row_id == row_id)
+            .order_by(CatalogRevision.version.desc())
+        ).all()
+    return [
+        {
+            "version": version,
+            "snapshot": is_snapshot,
+            "text_size": text_size,
+            "stored_size": stored_size,
+            "created_at": created_at,
+        }
+        for version, is_snapshot, text_size, stored_size, created_at in rows
+    ]
+
+
+def get_revision_stats(catalog: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Space used by the revision history compared with storing every
+    revision in full: revisions, snapshots, stored_bytes, full_bytes, ratio.
+    """
+    query = select(
+        func.count(),
+        func.coalesce(func.sum(sqlalchemy.cast(CatalogRevision.is_snapshot, sqlalchemy.Integer)), 0),
+        func.coalesce(func.sum(func.length(CatalogRevision.data)), 0),
+        func.coalesce(func.sum(CatalogRevision.text_size), 0),
+    )
+    if catalog:
+        query = query.where(CatalogRevision.catalog == catalog)
+    with rx.session() as session:
+        revisions, snapshots, stored, full = session.exec(query).one()
+    return {
+        "revisions": revisions,
+        "snapshots": snapshots,
+        "stored_bytes": stored,
+        "full_bytes": full,
+        "ratio": stored / full if full else 0.0,
+    }
@@ -0,0 +1,392 @@
+# ltx_automation_app/database/catalog_search.py
+"""
+Full-text search over the metric and README catalogs.
+
+On SQLite the catalogs are indexed by FTS5 external-content tables
+(metric_fts, readmeinstruction_fts) that triggers keep in sync with the
+base tables, so a search is one indexed MATCH query ranked by bm25 instead
+of a Python substring scan over every row. Databases without the index
+(PostgreSQL, or a SQLite file created without migrations) fall back to a
+LIKE query with the same result shape.
+
+Search terms are split into words and matched as prefixes, so "flu acc"
+finds "Fluency" and "Accuracy". Highlighted fields are HTML-escaped with
+matches wrapped in <mark></mark>.
+"""
+
+import html
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import reflex as rx
+import sqlalchemy
+from sqlmodel import or_, select
+
+from .models import Metric, ReadmeInstruction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+
+# Control characters never occur in catalog text, so they can mark matches
+# inside FTS5 output and be swapped for <mark> after HTML escaping
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Indexed columns per catalog; bm25 weights favour the name/title column
+SEARCH_INDEXES: Dict[str, Dict[str, Any]] = {
+    "metric": {
+        "fts_table": "metric_fts",
+        "columns": ["METRIC_NAME", "METRIC_DEF", "METRIC_NOTES"],
+        "weights": [10.0, 2.0, 1.0],
+    },
+    "readmeinstruction": {
+        "fts_table": "readmeinstruction_fts",
+        "columns": ["README_TITLE", "README_TXT"],
+        "weights": [10.0, 1.0],
+    },
+}
+
+_fts_available: Dict[str, bool] = {}
+
+
+# ============ Index DDL ============
+
+def search_index_ddl(table: str) -> List[str]:
+    """CREATE statements for one catalog's FTS5 table and sync triggers."""
+    spec = SEARCH_INDEXES[table]
+    fts = spec["fts_table"]
+    columns = ", ".join(f'"{c}"' for c in spec["columns"])
+    new_values = ", ".join(f'new."{c}"' for c in spec["columns"])
+    old_values = ", ".join(f'old."{c}"' for c in spec["columns"])
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{columns}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def create_search_index(connection):
+    """
+    Create the FTS5 tables and triggers on a SQLite connection and index
+    the existing rows. No-op on other databases.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for table, spec in SEARCH_INDEXES.items():
+        for statement in search_index_ddl(table):
+            connection.execute(sqlalchemy.text(statement))
+        connection.execute(sqlalchemy.text(
+            f"INSERT INTO {spec['fts_table']}({spec['fts_table']}) VALUES ('rebuild')"
+        ))
+    _fts_available.clear()
+
+
+def rebuild_search_index():
+    """
+    Re-index both catalogs from the base tables, e.g. after restoring a
+    database copied without its FTS tables. Returns False if there is no index.
+    """
+    with rx.session() as session:
+        if not _has_search_index(session, "metric"):
+            return False
+        for spec in SEARCH_INDEXES.values():
+            session.execute(sqlalchemy.text(
+                f"INSERT INTO {spec['fts_table']}({spec['fts_table']}) VALUES ('rebuild')"
+            ))
+        session.commit()
+    return True
+
+
+def _has_search_index(session, table: str) -> bool:
+    """True when the FTS5 table for a catalog exists (cached per database)."""
+    bind = session.get_bind()
+    fts = SEARCH_INDEXES[table]["fts_table"]
+    key = f"{bind.url}|{fts}"
+    if key not in _fts_available:
+        if bind.dialect.name != "sqlite":
+            _fts_available[key] = False
+        else:
+            _fts_available[key] = session.execute(
+                sqlalchemy.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": fts},
+            ).first() is not None
+    return _fts_available[key]
+
+
+# ============ Query helpers ============
+
+def search_terms(search_term: str) -> List[str]:
+    """Split user input into lowercase search words."""
+    return [word.lower() for word in _WORD_RE.findall(search_term or "")]
+
+
+def _match_query(terms: List[str]) -> str:
+    """FTS5 MATCH expression: every word as a quoted prefix, all required."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _rank_function(table: str) -> str:
+    """FTS5 rank function with the catalog's column weights, e.g. bm25(10.0, 2.0, 1.0)."""
+    return f"bm25({', '.join(str(w) for w in SEARCH_INDEXES[table]['weights'])})"
+
+
+def _marked_to_html(text: Optional[str]) -> str:
+    """HTML-escape text and turn the match markers into <mark> tags."""
+    if not text:
+        return ""
+    return html.escape(text).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def _highlight_terms(text: Optional[str], terms: List[str], max_chars: Optional[int] = None) -> str:
+    """Python-side highlighting used by the LIKE fallback."""
+    if not text:
+        return ""
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars].rstrip() + "…"
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    return _marked_to_html(pattern.sub(lambda m: f"{_MARK_OPEN}{m.group(0)}{_MARK_CLOSE}", text))
+
+
+def _like_filters(columns, terms: List[str]):
+    """Every term must appear in at least one of the columns."""
+    return [or_(*[column.ilike(f"%{term}%") for column in columns]) for term in terms]
+
+
+# ============ Metric search ============
+
+def _metric_result(row, name_highlight: str, definition_snippet: str) -> Dict[str, str]:
+    return {
+        "id": str(row.id),
+        "name": row.METRIC_NAME,
+        "type": row.METRIC_TYPE,
+        "definition": row.METRIC_DEF or "",
+        "notes": row.METRIC_NOTES or "",
+        "name_highlight": name_highlight,
+        "definition_snippet": definition_snippet,
+    }
+
+
+def search_metrics(
+    search_term: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    metric_type: str = None,
+    active_only: bool = False,
+    ids: Optional[Iterable[int]] = None,
+) -> List[Dict[str, str]]:
+    """
+    Search metrics by name, definition and notes, best matches first.
+    Should be called from within a State event handler.
+
+    Args:
+        search_term: Free text typed by the user
+        limit: Page size
+        offset: Number of results to skip (page * limit)
+        metric_type: Only return this METRIC_TYPE (e.g. EVERGREEN)
+        active_only: Only return metrics with STATUS_IND == "Active"
+        ids: Only return metrics with these ids (e.g. those matching the
+            facet filters), applied in the query so pages stay full
+
+    Returns:
+        Metric dicts (id, name, type, definition, notes) plus
+        name_highlight and definition_snippet as HTML
+    """
+    terms = search_terms(search_term)
+    if ids is not None:
+        ids = [int(metric_id) for metric_id in ids]
+    if not terms or ids == []:
+        return []
+
+    with rx.session() as session:
+        if _has_search_index(session, "metric"):
+            return _search_metrics_fts(session, terms, limit, offset, metric_type, active_only, ids)
+        return _search_metrics_like(session, terms, limit, offset, metric_type, active_only, ids)
+
+
+def _search_metrics_fts(session, terms, limit, offset, metric_type, active_only, ids=None):
+    filters = ""
+    params = {
+        "query": _match_query(terms),
+        "open": _MARK_OPEN,
+        "close": _MARK_CLOSE,
+        "limit": limit,
+        "offset": offset,
+    }
+    if active_only:
+        filters += " AND m.STATUS_IND = 'Active'"
+    if metric_type:
+        filters += " AND m.METRIC_TYPE = :metric_type"
+        params["metric_type"] = metric_type
+    if ids is not None:
+        # One JSON parameter instead of one bound variable per id
+        filters += " AND m.id IN (SELECT value FROM json_each(:ids))"
+        params["ids"] = json.dumps(ids)
+
+    rank = _rank_function("metric")
+    rows = session.execute(
+        sqlalchemy.text(
+            "SELECT m.id, m.METRIC_NAME, m.METRIC_TYPE, m.METRIC_DEF, m.METRIC_NOTES, "
+            "highlight(metric_fts, 0, :open, :close) AS name_highlight, "
+            "snippet(metric_fts, 1, :open, :close, '…', 24) AS definition_snippet "
+            "FROM metric_fts JOIN metric m ON m.id = metric_fts.rowid "
+            f"WHERE metric_fts MATCH :query AND rank MATCH '{rank}'{filters} "
+            "ORDER BY rank "
+            "LIMIT :limit OFFSET :offset"
+        ),
+        params,
+    ).all()
+    return [
+        _metric_result(row, _marked_to_html(row.name_highlight), _marked_to_html(row.definition_snippet))
+        for row in rows
+    ]
+
+
+def _search_metrics_like(session, terms, limit, offset, metric_type, active_only, ids=None):
+    query = select(Metric).where(
+        *_like_filters([Metric.METRIC_NAME, Metric.METRIC_DEF, Metric.METRIC_NOTES], terms)
+    )
+    if active_only:
+        query = query.where(Metric.STATUS_IND == "Active")
+    if metric_type:
+        query = query.where(Metric.METRIC_TYPE == metric_type)
+    if ids is not None:
+        query = query.where(Metric.id.in_(ids))
+    rows = session.exec(query.order_by(Metric.METRIC_NAME).offset(offset).limit(limit)).all()
+    return [
+        _metric_result(
+            row,
+            _highlight_terms(row.METRIC_NAME, terms),
+            _highlight_terms(row.METRIC_DEF, terms, max_chars=160),
+        )
+        for row in rows
+    ]
+
+
+def search_metric_ids(search_term: str, metric_type: str = None, active_only: bool = False) -> List[int]:
+    """
+    Ids of every metric matching search_term (unranked, no highlights),
+    for acting on all results at once.
+    Should be called from within a State event handler.
+    """
+    terms = search_terms(search_term)
+    if not terms:
+        return []
+
+    with rx.session() as session:
+        if _has_search_index(session, "metric"):
+            filters = ""
+            params = {"query": _match_query(terms)}
+            if active_only:
+                filters += " AND m.STATUS_IND = 'Active'"
+            if metric_type:
+                filters += " AND m.METRIC_TYPE = :metric_type"
+                params["metric_type"] = metric_type
+            # CROSS JOIN keeps metric_fts as the outer loop; without ORDER BY rank
+            # SQLite may scan metric by STATUS_IND and run MATCH once per row
+            return list(session.execute(
+                sqlalchemy.text(
+                    "SELECT m.id FROM metric_fts CROSS JOIN metric m ON m.id = metric_fts.rowid "
+                    f"WHERE metric_fts MATCH :query{filters}"
+                ),
+                params,
+            ).scalars())
+
+        query = select(Metric.id).where(
+            *_like_filters([Metric.METRIC_NAME, Metric.METRIC_DEF, Metric.METRIC_NOTES], terms)
+        )
+        if active_only:
+            query = query.where(Metric.STATUS_IND == "Active")
+        if metric_type:
+            query = query.where(Metric.METRIC_TYPE == metric_type)
+        return list(session.exec(query).all())
+
+
+# ============ README search ============
+
+def _readme_result(row, title_highlight: str, text_snippet: str) -> Dict[str, str]:
+    return {
+        "id": str(row.id),
+        "title": row.README_TITLE,
+        "type": row.EVAL_TYPE or "GENERAL",
+        "title_highlight": title_highlight,
+        "text_snippet": text_snippet,
+    }
+
+
+def search_readmes(
+    search_term: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    active_only: bool = True,
+) -> List[Dict[str, str]]:
+    """
+    Search README instructions by title and text, best matches first.
+    Should be called from within a State event handler.
+
+    Returns:
+        README dicts (id, title, type) plus title_highlight and
+        text_snippet as HTML
+    """
+    terms = search_terms(search_term)
+    if not terms:
+        return []
+
+    with rx.session() as session:
+        if _has_search_index(session, "readmeinstruction"):
+            return _search_readmes_fts(session, terms, limit, offset, active_only)
+        return _search_readmes_like(session, terms, limit, offset, active_only)
+
+
+def _search_readmes_fts(session, terms, limit, offset, active_only):
+    filters = " AND r.STATUS_IND = 'Active'" if active_only else ""
+    rank = _rank_function("readmeinstruction")
+    rows = session.execute(
+        sqlalchemy.text(
+            "SELECT r.id, r.README_TITLE, r.EVAL_TYPE, "
+            "highlight(readmeinstruction_fts, 0, :open, :close) AS title_highlight, "
+            "snippet(readmeinstruction_fts, 1, :open, :close, '…', 24) AS text_snippet "
+            "FROM readmeinstruction_fts JOIN readmeinstruction r ON r.id = readmeinstruction_fts.rowid "
+            f"WHERE readmeinstruction_fts MATCH :query AND rank MATCH '{rank}'{filters} "
+            "ORDER BY rank "
+            "LIMIT :limit OFFSET :offset"
+        ),
+        {
+            "query": _match_query(terms),
+            "open": _MARK_OPEN,
+            "close": _MARK_CLOSE,
+            "limit": limit,
+            "offset": offset,
+        },
+    ).all()
+    return [
+        _readme_result(row, _marked_to_html(row.title_highlight), _marked_to_html(row.text_snippet))
+        for row in rows
+    ]
+
+
+def _search_readmes_like(session, terms, limit, offset, active_only):
+    query = select(ReadmeInstruction).where(
+        *_like_filters([ReadmeInstruction.README_TITLE, ReadmeInstruction.README_TXT], terms)
+    )
+    if active_only:
+        query = query.where(ReadmeInstruction.STATUS_IND == "Active")
+    rows = session.exec(query.order_by(ReadmeInstruction.README_TITLE).offset(offset).limit(limit)).all()
+    return [
+        _readme_result(
+            row,
+            _highlight_terms(row.README_TITLE, terms),
+            _highlight_terms(row.README_TXT, terms, max_chars=160),
+        )
+        for row in rows
+    ]
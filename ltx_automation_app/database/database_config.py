@@ -6,18 +6,52 @@ NO STATIC FILE IMPORTS - All data comes from database
 """
 
 import reflex as rx
+import os
+import threading
+import time
+from sqlalchemy import event
 from sqlmodel import select
 from pathlib import Path
 import json
 
 # Import models
 from .models import (
-    Organization, Project, Template, ReadmeInstruction, 
+    ACTIVE_STATUS, Organization, Project, Template, ReadmeInstruction, 
     Metric, Evaluation, EvaluationMetric
 )
+from .read_snapshot import snapshot_session
 
 # NO MORE STATIC FILE IMPORTS! 
 
+# Process-wide organization name -> id cache, shared by all sessions.
+# Cleared whenever this process inserts, updates or deletes an organization;
+# entries expire after ORGANIZATION_ID_CACHE_SECONDS so renames and deletes
+# made by other workers are picked up too.
+ORGANIZATION_ID_CACHE_SECONDS = float(os.environ.get("LTX_ORGANIZATION_ID_CACHE_SECONDS", 60))
+_organization_id_cache: dict[str, tuple[int, float]] = {}
+_organization_id_lock = threading.Lock()
+
+
+def invalidate_organization_cache(*_):
+    """Clear the organization name -> id cache."""
+    with _organization_id_lock:
+        _organization_id_cache.clear()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Organization, _event_name, invalidate_organization_cache)
+
+
+def _cache_organization_id(name: str, org_id: int):
+    with _organization_id_lock:
+        _organization_id_cache[name] = (org_id, time.monotonic() + ORGANIZATION_ID_CACHE_SECONDS)
+
+
+def _cached_organization_id(name: str):
+    """The cached id of an organization, or None if unknown or expired."""
+    org_id, expires_at = _organization_id_cache.get(name, (None, 0.0))
+    return org_id if time.monotonic() < expires_at else None
+
 
 def seed_database():
     """
@@ -46,10 +80,14 @@ def seed_database():
             print(f"Database has Metrics from Excel migration")
         
         if not readme_count and not metric_count:
-            print("WARNING: No data found in database. Run your Excel migration script.")
+            print(
+                "WARNING: No data found in database. Import the catalogs with: "
+                "python -m ltx_automation_app.utils.catalog_importer"
+            )
 
 
-# Helper functions using rx.session() - these should be called from State event handlers
+# Helper functions using rx.session() - these should be called from State event handlers.
+# Metric and README reads use snapshot_session(), the in-memory catalog copy
 def get_all_organizations():
     """
     Get all organizations from database.
@@ -70,12 +108,31 @@ def get_organization_projects(org_id: int):
         ).all()
 
 
+def get_organization_id(name: str):
+    """
+    Get an organization's id by name, served from the process-wide cache.
+    Returns None if the organization does not exist.
+    """
+    org_id = _cached_organization_id(name)
+    if org_id is not None:
+        return org_id
+    
+    with rx.session() as session:
+        org_id = session.exec(
+            select(Organization.id).where(Organization.name == name)
+        ).first()
+    
+    if org_id is not None:
+        _cache_organization_id(name, org_id)
+    return org_id
+
+
 def get_all_metrics(metric_type: str = None, metric_focus: str = None):
     """
     Get metrics from database with optional filtering.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         query = select(Metric)
         
         if metric_type:
@@ -92,9 +149,9 @@ def get_evergreen_metrics():
     Get only evergreen (default) metrics.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         return session.exec(
-            select(Metric).where(Metric.DEFAULT_IND == "Y")
+            select(Metric).where(Metric.METRIC_TYPE == "EVERGREEN")
         ).all()
 
 
@@ -103,9 +160,9 @@ def get_custom_metrics():
     Get only custom metrics.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         return session.exec(
-            select(Metric).where(Metric.CUSTOM_IND == "Y")
+            select(Metric).where(Metric.METRIC_TYPE == "CUSTOM")
         ).all()
 
 
@@ -123,11 +180,11 @@ def get_all_readme_instructions(active_only: bool = True):
     Get all README instructions from database.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         query = select(ReadmeInstruction)
         
         if active_only:
-            query = query.where(ReadmeInstruction.STATUS_IND == "Active")
+            query = query.where(ReadmeInstruction.STATUS_IND == ACTIVE_STATUS)
         
         # Order by id or any order field you have
         return session.exec(query).all()
@@ -138,18 +195,52 @@ def get_readme_by_title(title: str):
     Get a specific README instruction by title.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         return session.exec(
             select(ReadmeInstruction).where(ReadmeInstruction.README_TITLE == title)
         ).first()
 
 
+def get_readme_text(readme_id: int) -> str:
+    """
+    Get the full README_TXT of one README instruction (catalog lists only
+    carry a summary). Returns "" if it does not exist.
+    Should be called from within a State event handler.
+    """
+    with snapshot_session() as session:
+        return session.exec(
+            select(ReadmeInstruction.README_TXT).where(ReadmeInstruction.id == readme_id)
+        ).first() or ""
+
+
 def get_metric_by_name(name: str):
     """
     Get a specific metric by name.
     Should be called from within a State event handler.
     """
-    with rx.session() as session:
+    with snapshot_session() as session:
         return session.exec(
             select(Metric).where(Metric.METRIC_NAME == name)
-        ).first()
\ No newline at end of file
+        ).first()
+
+# Async variants using rx.asession() - call these from async State event handlers
+# so a slow query never blocks the event loop for other clients. Only the
+# lookups async handlers await have one; add others as handlers need them.
+async def get_organization_id_async(name: str):
+    """
+    Get an organization's id by name from the cache, without blocking the event loop.
+    Returns None if the organization does not exist.
+    """
+    org_id = _cached_organization_id(name)
+    if org_id is not None:
+        return org_id
+    
+    async with rx.asession() as session:
+        org_id = (await session.exec(
+            select(Organization.id).where(Organization.name == name)
+        )).first()
+    
+    if org_id is not None:
+        _cache_organization_id(name, org_id)
+    return org_id
+
@@ -0,0 +1,74 @@
+# ltx_automation_app/database/engine.py
+"""
+Database engine setup with tuned connection pooling.
+
+The database URL comes from rxconfig.py (LTX_DATABASE_URL / LTX_ASYNC_DATABASE_URL),
+so the same code runs on the local SQLite file or on PostgreSQL shared by
+several backend workers. Reflex builds its engines with default pool settings;
+configure_database_engines() builds them with the settings below and hands
+them to Reflex, so rx.session() and rx.asession() use the tuned pools.
+
+Pool settings can be overridden per environment:
+    LTX_DB_POOL_SIZE, LTX_DB_MAX_OVERFLOW, LTX_DB_POOL_RECYCLE, LTX_DB_POOL_TIMEOUT
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+import sqlmodel
+from reflex import model as rx_model
+from reflex.config import get_config
+from sqlalchemy.ext.asyncio import create_async_engine
+
+logger = logging.getLogger(__name__)
+
+POOL_SETTINGS: Dict[str, Any] = {
+    "pool_size": int(os.environ.get("LTX_DB_POOL_SIZE", 10)),
+    "max_overflow": int(os.environ.get("LTX_DB_MAX_OVERFLOW", 20)),
+    "pool_pre_ping": True,
+    "pool_recycle": int(os.environ.get("LTX_DB_POOL_RECYCLE", 1800)),  # seconds
+    "pool_timeout": int(os.environ.get("LTX_DB_POOL_TIMEOUT", 30)),    # seconds
+}
+
+
+def is_postgres_url(url: str) -> bool:
+    """True for any postgresql[+driver]:// URL."""
+    return url.startswith("postgresql")
+
+
+def get_engine_kwargs(url: str) -> Dict[str, Any]:
+    """
+    Engine arguments for a URL: Reflex's defaults plus tuned pool settings.
+    In-memory SQLite uses a single shared connection, so it gets no pool sizing.
+    """
+    kwargs = rx_model.get_engine_args(url)
+    if url.startswith("sqlite") and ":memory:" in url:
+        return kwargs
+    kwargs.update(POOL_SETTINGS)
+    return kwargs
+
+
+def configure_database_engines():
+    """
+    Create the sync and async engines with tuned pools and register them
+    with Reflex, before the first rx.session()/rx.asession() call creates
+    untuned ones. Safe to call more than once.
+    """
+    config = get_config()
+
+    if config.db_url and config.db_url not in rx_model._ENGINE:
+        rx_model._ENGINE[config.db_url] = sqlmodel.create_engine(
+            config.db_url, **get_engine_kwargs(config.db_url)
+        )
+
+    if config.async_db_url and config.async_db_url not in rx_model._ASYNC_ENGINE:
+        rx_model._ASYNC_ENGINE[config.async_db_url] = create_async_engine(
+            config.async_db_url, **get_engine_kwargs(config.async_db_url)
+        )
+
+    logger.info(
+        f"Database engines configured (pool_size={POOL_SETTINGS['pool_size']}, "
+        f"max_overflow={POOL_SETTINGS['max_overflow']})"
+    )
+
@@ -0,0 +1,250 @@
+# ltx_automation_app/database/maintenance.py
+"""
+Scheduled SQLite maintenance and storage statistics.
+
+Ingestion and catalog edits keep inserting, updating and deleting rows, so
+without upkeep the planner statistics go stale, freed pages stay in the
+file and the WAL grows between checkpoints. run_database_maintenance()
+does one pass:
+
+    0. prune the catalog change feed (see catalog_changes)
+    1. ANALYZE (bounded by analysis_limit) / PRAGMA optimize
+    2. incremental vacuum of the free pages (the first pass switches the
+       database to auto_vacuum=INCREMENTAL, which takes one full VACUUM)
+    3. WAL checkpoint, truncating the WAL file when no reader holds it
+
+database_maintenance_task() is registered as an app lifespan task and runs
+a pass every LTX_MAINTENANCE_INTERVAL seconds, but only once nothing has
+been committed for LTX_MAINTENANCE_IDLE seconds, so it stays out of the way
+of imports and editing sessions.
+
+get_storage_stats() reports per-table row counts, page usage and index
+sizes for the admin view. Both are SQLite only; on other databases they
+do nothing.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import reflex as rx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .catalog_changes import prune_catalog_changes
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_INTERVAL_SECONDS = int(os.environ.get("LTX_MAINTENANCE_INTERVAL", 6 * 3600))
+MAINTENANCE_IDLE_SECONDS = int(os.environ.get("LTX_MAINTENANCE_IDLE", 120))
+# How often the lifespan task checks whether a pass is due
+MAINTENANCE_CHECK_SECONDS = 60
+# Rows sampled per index by ANALYZE (0 = all rows)
+ANALYSIS_LIMIT = int(os.environ.get("LTX_ANALYSIS_LIMIT", 1000))
+
+# auto_vacuum values as reported by PRAGMA auto_vacuum
+_AUTO_VACUUM_INCREMENTAL = 2
+
+_last_commit = time.monotonic()
+_last_run: Optional[float] = None
+_last_result: Dict[str, Any] = {}
+_run_lock = threading.Lock()
+
+
+def _on_commit(connection):
+    global _last_commit
+    _last_commit = time.monotonic()
+
+
+event.listen(Engine, "commit", _on_commit)
+
+
+def _sqlite_engine():
+    engine = rx.model.get_engine()
+    return engine if engine.dialect.name == "sqlite" else None
+
+
+def _pragma(connection: sqlite3.Connection, statement: str):
+    row = connection.execute(f"PRAGMA {statement}").fetchone()
+    return row[0] if row else None
+
+
+# ============ Maintenance ============
+
+def run_database_maintenance(full_analyze: bool = False) -> Dict[str, Any]:
+    """
+    Run one maintenance pass (change feed pruning, statistics, incremental
+    vacuum, WAL checkpoint) and return what it did. full_analyze reads every row
+    instead of sampling ANALYSIS_LIMIT rows per index.
+    Returns {} if another pass is running or the database is not SQLite.
+    """
+    global _last_run, _last_result
+    engine = _sqlite_engine()
+    if engine is None or not _run_lock.acquire(blocking=False):
+        return {}
+    try:
+        start = time.perf_counter()
+        result: Dict[str, Any] = {"started_at": datetime.now().isoformat(timespec="seconds")}
+        # Before the vacuum, so it returns the pages the pruned rows used
+        result["pruned_changes"] = prune_catalog_changes()
+
+        raw = engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.commit()
+
+            # 1. Planner statistics
+            connection.execute(f"PRAGMA analysis_limit={0 if full_analyze else ANALYSIS_LIMIT}")
+            if sqlite3.sqlite_version_info >= (3, 46, 0) and not full_analyze:
+                # Analyzes only the tables whose statistics are out of date
+                connection.execute("PRAGMA optimize=0x10002")
+            else:
+                connection.execute("ANALYZE")
+            connection.commit()
+
+            # 2. Return free pages to the file system
+            if _pragma(connection, "auto_vacuum") != _AUTO_VACUUM_INCREMENTAL:
+                # Takes effect only through a full VACUUM; later passes are incremental
+                connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                connection.execute("VACUUM")
+                result["converted_to_incremental_vacuum"] = True
+            free_pages = _pragma(connection, "freelist_count") or 0
+            if free_pages:
+                # execute() would step the pragma once, freeing a single page
+                connection.executescript("PRAGMA incremental_vacuum")
+            result["freed_pages"] = free_pages - (_pragma(connection, "freelist_count") or 0)
+
+            # 3. Move the WAL into the database file and reset it
+            if str(_pragma(connection, "journal_mode")).lower() == "wal":
+                busy, wal_pages, checkpointed = connection.execute(
+                    "PRAGMA wal_checkpoint(TRUNCATE)"
+                ).fetchone()
+                result["wal_checkpoint"] = {
+                    "busy": bool(busy),
+                    "wal_pages": wal_pages,
+                    "checkpointed": checkpointed,
+                }
+        finally:
+            raw.close()
+
+        result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        _last_run, _last_result = time.monotonic(), result
+        logger.info(f"Database maintenance done: {result}")
+        return result
+    finally:
+        _run_lock.release()
+
+
+def get_last_maintenance() -> Dict[str, Any]:
+    """Result of the last maintenance pass in this process ({} if none ran yet)."""
+    return dict(_last_result)
+
+
+def maintenance_due() -> bool:
+    """True when the interval has passed and the database has been idle long enough."""
+    now = time.monotonic()
+    if _last_run is not None and now - _last_run < MAINTENANCE_INTERVAL_SECONDS:
+        return False
+    return now - _last_commit >= MAINTENANCE_IDLE_SECONDS
+
+
+async def database_maintenance_task():
+    """
+    Lifespan task: run a maintenance pass whenever one is due, off the
+    event loop. Disabled with LTX_MAINTENANCE_INTERVAL=0.
+    """
+    global _last_run
+    if MAINTENANCE_INTERVAL_SECONDS <= 0 or _sqlite_engine() is None:
+        return
+    while True:
+        await asyncio.sleep(MAINTENANCE_CHECK_SECONDS)
+        if not maintenance_due():
+            continue
+        try:
+            await asyncio.to_thread(run_database_maintenance)
+        except Exception as e:
+            logger.warning(f"Database maintenance failed: {e}")
+            # Don't retry every minute
+            _last_run = time.monotonic()
+
+
+# ============ Storage statistics ============
+
+def _page_usage(connection: sqlite3.Connection) -> Dict[str, tuple]:
+    """{table or index name: (pages, bytes)}, empty if SQLite lacks dbstat."""
+    try:
+        rows = connection.execute(
+            "SELECT name, COUNT(*), SUM(pgsize) FROM dbstat GROUP BY name"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    return {name: (pages, size) for name, pages, size in rows}
+
+
+def get_storage_stats() -> Dict[str, Any]:
+    """
+    Database file size and page usage plus, per table, its row count,
+    pages and bytes and those of each of its indexes (largest first).
+    Should be called from within a State event handler.
+    """
+    engine = _sqlite_engine()
+    if engine is None:
+        return {}
+    raw = engine.raw_connection()
+    try:
+        connection = raw.driver_connection
+        page_size = _pragma(connection, "page_size")
+        database = {
+            "page_size": page_size,
+            "page_count": _pragma(connection, "page_count"),
+            "freelist_count": _pragma(connection, "freelist_count"),
+            "auto_vacuum": _pragma(connection, "auto_vacuum"),
+            "journal_mode": _pragma(connection, "journal_mode"),
+        }
+        database["file_bytes"] = database["page_count"] * page_size
+        database["free_bytes"] = database["freelist_count"] * page_size
+        database["wal_bytes"] = 0
+        filename = connection.execute("PRAGMA database_list").fetchone()[2]
+        if filename and os.path.exists(f"{filename}-wal"):
+            database["wal_bytes"] = os.path.getsize(f"{filename}-wal")
+
+        usage = _page_usage(connection)
+        objects = connection.execute(
+            "SELECT type, name, tbl_name FROM sqlite_master WHERE type = 'index' "
+            "OR (type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "AND sql NOT LIKE 'CREATE VIRTUAL TABLE%') ORDER BY name"
+        ).fetchall()
+        tables: Dict[str, Dict[str, Any]] = {}
+        for kind, name, _ in objects:
+            if kind == "table":
+                pages, size = usage.get(name, (0, 0))
+                tables[name] = {
+                    "name": name,
+                    "rows": connection.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0],
+                    "pages": pages,
+                    "bytes": size,
+                    "index_bytes": 0,
+                    "indexes": [],
+                }
+        # Includes the sqlite_autoindex_* indexes behind UNIQUE / PRIMARY KEY constraints
+        for kind, name, table in objects:
+            if kind == "index" and table in tables:
+                pages, size = usage.get(name, (0, 0))
+                tables[table]["indexes"].append({"name": name, "pages": pages, "bytes": size})
+                tables[table]["index_bytes"] += size
+    finally:
+        raw.close()
+
+    return {
+        "database": database,
+        "tables": sorted(
+            tables.values(), key=lambda t: t["bytes"] + t["index_bytes"], reverse=True
+        ),
+        "has_page_usage": bool(usage),
+        "last_maintenance": get_last_maintenance(),
+    }
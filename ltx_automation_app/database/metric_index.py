@@ -0,0 +1,215 @@
+# ltx_automation_app/database/metric_index.py
+"""
+In-memory bitmap index over the metric catalog for multi-facet filtering.
+
+For every facet value (e.g. metric_type=CUSTOM, genai_ind=Y) the index
+holds a packed bitset with one bit per metric, in id order. A filter is
+OR within a facet and AND across facets, so it runs as a few vectorized
+bitwise operations over arrays of n/8 bytes instead of a Python pass over
+the catalog; the matching ids come from the sorted id array.
+
+One index is built per process from a narrow query and rebuilt lazily
+after the metric catalog changes (see catalog_cache.catalog_version).
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import reflex as rx
+from sqlmodel import select
+
+from .catalog_cache import METRIC_CATALOG, METRIC_FACETS, catalog_version
+from .models import Metric
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, METRICS, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+INDEX_FACETS = {
+    **METRIC_FACETS,
+    "score_type": Metric.SCORE_TYPE,
+    "status": Metric.STATUS_IND,
+}
+
+# facet -> one value or several (OR); an empty value list does not filter
+FacetFilters = Dict[str, Union[str, Sequence[str]]]
+
+
+class MetricFacetIndex:
+    """Packed bitsets per facet value over metrics sorted by id."""
+
+    def __init__(self, ids: np.ndarray, columns: Dict[str, Sequence[Optional[str]]]):
+        self.ids = ids
+        self.size = len(ids)
+        self._all = np.packbits(np.ones(self.size, dtype=bool))
+        self.bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for facet, values in columns.items():
+            # Dictionary-encode the column, then one bitset per distinct value
+            labels: Dict[str, int] = {}
+            codes = np.fromiter(
+                (labels.setdefault(value or "", len(labels)) for value in values),
+                dtype=np.int32,
+                count=self.size,
+            )
+            self.bitmaps[facet] = {
+                label: np.packbits(codes == code)
+                for label, code in labels.items()
+                if label
+            }
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the id array and all bitsets."""
+        return self.ids.nbytes + sum(
+            bitmap.nbytes for values in self.bitmaps.values() for bitmap in values.values()
+        )
+
+    def mask(self, filters: Optional[FacetFilters] = None, skip: str = None) -> np.ndarray:
+        """Packed bitset of the metrics matching filters (ignoring facet `skip`)."""
+        result = self._all.copy()
+        for facet, values in (filters or {}).items():
+            if facet == skip:
+                continue
+            if facet not in self.bitmaps:
+                raise ValueError(f"Unknown metric facet: {facet}")
+            values = [values] if isinstance(values, str) else [value for value in values if value]
+            if not values:
+                continue
+            facet_mask = np.zeros_like(result)
+            for value in values:
+                bitmap = self.bitmaps[facet].get(value)
+                if bitmap is not None:
+                    np.bitwise_or(facet_mask, bitmap, out=facet_mask)
+            np.bitwise_and(result, facet_mask, out=result)
+        return result
+
+    def ids_for(self, filters: Optional[FacetFilters] = None) -> np.ndarray:
+        """Sorted ids of the metrics matching filters."""
+        return self.ids[np.flatnonzero(np.unpackbits(self.mask(filters), count=self.size))]
+
+    def page_ids(self, filters: Optional[FacetFilters], after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        """
+        First `limit` matching ids greater than after_id, and whether more
+        match. Only the bytes holding those ids are unpacked.
+        """
+        mask = self.mask(filters)
+        start = 0 if after_id is None else int(np.searchsorted(self.ids, after_id, side="right"))
+        first_byte = start // 8
+        # Clear the bits before `start` in its byte
+        head = mask[first_byte:first_byte + 1] & np.uint8(0xFF >> (start % 8))
+        mask = np.concatenate((head, mask[first_byte + 1:]))
+        # Each non-zero byte holds at least one match: limit + 1 bytes are enough
+        nonzero = np.flatnonzero(mask)[:limit + 1]
+        if not len(nonzero):
+            return [], False
+        bits = np.unpackbits(mask[nonzero[0]:nonzero[-1] + 1])
+        positions = np.flatnonzero(bits)[:limit + 1] + (first_byte + nonzero[0]) * 8
+        return self.ids[positions[:limit]].tolist(), len(positions) > limit
+
+    def count(self, filters: Optional[FacetFilters] = None) -> int:
+        """Number of metrics matching filters."""
+        return int(np.bitwise_count(self.mask(filters)).sum())
+
+    def matches(self, filters: Optional[FacetFilters], ids: Iterable[int]) -> np.ndarray:
+        """Boolean array: which of the given metric ids match filters."""
+        ids = np.asarray(list(ids), dtype=self.ids.dtype)
+        if not self.size:
+            return np.zeros(len(ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.ids, ids), self.size - 1)
+        bits = np.unpackbits(self.mask(filters), count=self.size)
+        return (self.ids[positions] == ids) & bits[positions].astype(bool)
+
+    def facet_counts(
+        self,
+        filters: Optional[FacetFilters] = None,
+        facets: Sequence[str] = None,
+    ) -> Dict[str, List[Dict[str, object]]]:
+        """
+        Value counts per facet, sorted by value. Each facet is counted
+        under the filters on the other facets, so the counts show what
+        selecting a value would return.
+        """
+        counts = {}
+        for facet in facets or self.bitmaps:
+            base = self.mask(filters, skip=facet)
+            counts[facet] = [
+                {"value": value, "count": int(np.bitwise_count(base & bitmap).sum())}
+                for value, bitmap in sorted(self.bitmaps[facet].items())
+            ]
+        return counts
+
+
+_index: Optional[MetricFacetIndex] = None
+_index_version = -1
+_lock = threading.Lock()
+
+
+def _build_index() -> MetricFacetIndex:
+    columns = list(INDEX_FACETS.values())
+    with rx.session() as session:
+        rows = session.exec(select(Metric.id, *columns).order_by(Metric.id)).all()
+    ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    index = MetricFacetIndex(
+        ids,
+        {facet: [row[i + 1] for row in rows] for i, facet in enumerate(INDEX_FACETS)},
+    )
+    logger.info(f"Built metric facet index: {index.size} metrics, {index.nbytes / 1024:.0f} KiB")
+    return index
+
+
+def get_metric_facet_index() -> MetricFacetIndex:
+    """
+    Get the process-wide metric facet index, rebuilding it if the metric
+    catalog changed. Shared and read-only.
+    """
+    global _index, _index_version
+    version = catalog_version(METRIC_CATALOG)
+    if _index is not None and _index_version == version:
+        return _index
+    with _lock:
+        version = catalog_version(METRIC_CATALOG)
+        if _index is None or _index_version != version:
+            _index = _build_index()
+            _index_version = version
+        return _index
+
+
+def get_filtered_metrics_page(
+    filters: FacetFilters,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    Get one page of metrics matching facet filters, in id order, as
+    (rows, next_cursor) like the pagination page functions.
+    Should be called from within a State event handler.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    after = decode_cursor(METRICS, cursor)
+    page_ids, has_more = get_metric_facet_index().page_ids(
+        filters, after[0] if after is not None else None, limit
+    )
+    if not page_ids:
+        return [], None
+    with rx.session() as session:
+        rows = session.exec(select(Metric).where(Metric.id.in_(page_ids)).order_by(Metric.id)).all()
+    return rows, encode_cursor(METRICS, [page_ids[-1]]) if has_more else None
+
+
+def get_metrics_window(filters: FacetFilters, start: int = 0, limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Get the metrics at positions start .. start + limit of the id-ordered
+    list matching facet filters, and how many match in total, as
+    (rows, total). Unlike cursors this reaches any position directly, for
+    windowed (virtualized) lists that jump on scroll.
+    Should be called from within a State event handler.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    ids = get_metric_facet_index().ids_for(filters)
+    window_ids = ids[max(0, start):max(0, start) + limit].tolist()
+    if not window_ids:
+        return [], len(ids)
+    with rx.session() as session:
+        rows = session.exec(select(Metric).where(Metric.id.in_(window_ids)).order_by(Metric.id)).all()
+    return rows, len(ids)
@@ -6,14 +6,40 @@ Database models for LTX Automation - Updated with optional fields for migration
 import reflex as rx
 import sqlmodel
 import sqlalchemy
+from sqlalchemy.orm import declared_attr
 from typing import Optional
 from datetime import datetime
 
+# Catalog STATUS_IND values. Only Active rows are on the hot path: the
+# catalog cache, dropdowns and listings read them through partial indexes,
+# while Retired (archived) rows stay in place for history and restores.
+ACTIVE_STATUS = "Active"
+RETIRED_STATUS = "Retired"
+
+_ACTIVE_ONLY = sqlalchemy.text("\"STATUS_IND\" = 'Active'")
+
 
 class ReadmeInstruction(rx.Model, table=True):
     """
     README Instruction model - matches Excel columns exactly
     """
+    __table_args__ = (
+        sqlalchemy.Index("ix_readmeinstruction_DEFAULT_IND_CUSTOM_IND", "DEFAULT_IND", "CUSTOM_IND"),
+        # Partial indexes: hot-path listings only ever read Active rows
+        sqlalchemy.Index(
+            "ix_readmeinstruction_active_id",
+            "id",
+            sqlite_where=_ACTIVE_ONLY,
+            postgresql_where=_ACTIVE_ONLY,
+        ),
+        sqlalchemy.Index(
+            "ix_readmeinstruction_active_README_TITLE",
+            "README_TITLE",
+            sqlite_where=_ACTIVE_ONLY,
+            postgresql_where=_ACTIVE_ONLY,
+        ),
+    )
+    
     # Make required fields optional with defaults for migration
     README_TITLE: Optional[str] = sqlmodel.Field(default="", index=True)
     README_TXT: Optional[str] = sqlmodel.Field(default="", sa_column=sqlalchemy.Column(sqlalchemy.Text))
@@ -25,10 +51,20 @@ class ReadmeInstruction(rx.Model, table=True):
     CONTENT_TYPE: Optional[str] = None
     
     # Status and indicator fields
-    STATUS_IND: Optional[str] = sqlmodel.Field(default="Active")
+    STATUS_IND: Optional[str] = sqlmodel.Field(default=ACTIVE_STATUS)
     DEFAULT_IND: Optional[str] = sqlmodel.Field(default="N")  # Y for default, N for custom
     CUSTOM_IND: Optional[str] = sqlmodel.Field(default="Y")   # Y for custom, N for default
     
+    # Hash of the source workbook row (None for rows created in the app)
+    SOURCE_HASH: Optional[str] = None
+    
+    # Row version for optimistic concurrency: the ORM bumps it on every
+    # update and adds "AND VERSION = <loaded>" to the WHERE clause
+    VERSION: int = sqlmodel.Field(
+        default=1,
+        sa_column=sqlalchemy.Column("VERSION", sqlalchemy.Integer, nullable=False, server_default="1"),
+    )
+    
     # Timestamps
     CREATE_DT: datetime = sqlmodel.Field(
         default=None,
@@ -53,11 +89,37 @@ class ReadmeInstruction(rx.Model, table=True):
     def README_ID(self):
         return self.id
 
+    @declared_attr
+    def __mapper_args__(cls):
+        return {"version_id_col": cls.__table__.c.VERSION}
+
 
 class Metric(rx.Model, table=True):
     """
     Metric model - matches Excel columns exactly
     """
+    __table_args__ = (
+        # Partial indexes: hot-path listings only ever read Active rows
+        sqlalchemy.Index(
+            "ix_metric_active_id",
+            "id",
+            sqlite_where=_ACTIVE_ONLY,
+            postgresql_where=_ACTIVE_ONLY,
+        ),
+        sqlalchemy.Index(
+            "ix_metric_active_METRIC_TYPE",
+            "METRIC_TYPE",
+            sqlite_where=_ACTIVE_ONLY,
+            postgresql_where=_ACTIVE_ONLY,
+        ),
+        sqlalchemy.Index(
+            "ix_metric_active_METRIC_NAME",
+            "METRIC_NAME",
+            sqlite_where=_ACTIVE_ONLY,
+            postgresql_where=_ACTIVE_ONLY,
+        ),
+    )
+    
     # Make required fields optional with defaults for migration
     METRIC_TYPE: Optional[str] = sqlmodel.Field(default="", index=True)
     METRIC_NAME: Optional[str] = sqlmodel.Field(default="", index=True)
@@ -75,7 +137,17 @@ class Metric(rx.Model, table=True):
     CONTENT_TYPE: Optional[str] = None
     
     # Status field
-    STATUS_IND: Optional[str] = sqlmodel.Field(default="Active")
+    STATUS_IND: Optional[str] = sqlmodel.Field(default=ACTIVE_STATUS)
+    
+    # Hash of the source workbook row (None for rows created in the app)
+    SOURCE_HASH: Optional[str] = None
+    
+    # Row version for optimistic concurrency: the ORM bumps it on every
+    # update and adds "AND VERSION = <loaded>" to the WHERE clause
+    VERSION: int = sqlmodel.Field(
+        default=1,
+        sa_column=sqlalchemy.Column("VERSION", sqlalchemy.Integer, nullable=False, server_default="1"),
+    )
     
     # Timestamps
     CREATE_DT: datetime = sqlmodel.Field(
@@ -96,6 +168,10 @@ class Metric(rx.Model, table=True):
         ),
     )
 
+    @declared_attr
+    def __mapper_args__(cls):
+        return {"version_id_col": cls.__table__.c.VERSION}
+
 
 # Keep existing models for app functionality
 class Organization(rx.Model, table=True):
@@ -117,6 +193,11 @@ class Project(rx.Model, table=True):
     """
     Project model - stores projects within organizations
     """
+    __table_args__ = (
+        # Project names are unique per organization; also serves organization_id lookups
+        sqlalchemy.Index("uq_project_organization_id_name", "organization_id", "name", unique=True),
+    )
+    
     name: Optional[str] = sqlmodel.Field(default="")
     description: Optional[str] = None
     organization_id: Optional[int] = sqlmodel.Field(default=None, foreign_key="organization.id")
@@ -170,6 +251,10 @@ class Evaluation(rx.Model, table=True):
     """
     Evaluation model - stores evaluation configurations
     """
+    __table_args__ = (
+        sqlalchemy.Index("ix_evaluation_project_id", "project_id"),
+    )
+    
     name: Optional[str] = sqlmodel.Field(default="")
     project_id: Optional[int] = sqlmodel.Field(default=None, foreign_key="project.id")
     evaluation_type: Optional[str] = sqlmodel.Field(default="Metrics")  # e.g., "Metrics", "README", "Both"
@@ -199,6 +284,10 @@ class EvaluationMetric(rx.Model, table=True):
     """
     EvaluationMetric model - junction table linking evaluations to metrics
     """
+    __table_args__ = (
+        sqlalchemy.Index("ix_evaluationmetric_evaluation_id", "evaluation_id"),
+    )
+    
     evaluation_id: Optional[int] = sqlmodel.Field(default=None, foreign_key="evaluation.id")
     metric_id: Optional[int] = sqlmodel.Field(default=None, foreign_key="metric.id")
     value: Optional[float] = None
@@ -210,4 +299,96 @@ class EvaluationMetric(rx.Model, table=True):
             sqlalchemy.DateTime(timezone=True),
             server_default=sqlalchemy.func.now(),
         ),
-    )
\ No newline at end of file
+    )
+
+class MetricScoreCache(rx.Model, table=True):
+    """
+    MetricScoreCache model - automated metric scores keyed by content hash.
+    The key covers source, target, metric definition and scorer version,
+    so a row stays valid until one of those inputs changes.
+    """
+    cache_key: str = sqlmodel.Field(index=True, unique=True)
+    scorer_version: Optional[str] = sqlmodel.Field(default="")
+    score: Optional[float] = None
+    created_at: datetime = sqlmodel.Field(
+        default=None,
+        sa_column=sqlalchemy.Column(
+            "created_at",
+            sqlalchemy.DateTime(timezone=True),
+            server_default=sqlalchemy.func.now(),
+        ),
+    )
+
+
+class CatalogChange(rx.Model, table=True):
+    """
+    CatalogChange model - append-only log of Metric/ReadmeInstruction writes.
+    The id doubles as the change feed version: a client that has seen
+    version N asks for changes with id > N.
+    """
+    __table_args__ = (
+        sqlalchemy.Index("ix_catalogchange_catalog_id", "catalog", "id"),
+    )
+    
+    catalog: str = sqlmodel.Field(default="")  # "metric" or "readme"
+    row_id: Optional[int] = None  # None for "reload" (bulk write, ids unknown)
+    operation: str = sqlmodel.Field(default="")  # insert, update, delete, reload
+    changed_at: datetime = sqlmodel.Field(
+        default=None,
+        sa_column=sqlalchemy.Column(
+            "changed_at",
+            sqlalchemy.DateTime(timezone=True),
+            server_default=sqlalchemy.func.now(),
+        ),
+    )
+
+
+class CatalogSource(rx.Model, table=True):
+    """
+    CatalogSource model - last synced source workbook per catalog.
+    A sync whose file hash matches content_hash is skipped entirely.
+    """
+    catalog: str = sqlmodel.Field(index=True, unique=True)  # "metric" or "readme"
+    file_name: Optional[str] = None
+    content_hash: Optional[str] = None
+    row_count: Optional[int] = None
+    synced_at: datetime = sqlmodel.Field(
+        default=None,
+        sa_column=sqlalchemy.Column(
+            "synced_at",
+            sqlalchemy.DateTime(timezone=True),
+            server_default=sqlalchemy.func.now(),
+            onupdate=sqlalchemy.func.now(),
+        ),
+    )
+
+
+class CatalogRevision(rx.Model, table=True):
+    """
+    CatalogRevision model - history of README_TXT / METRIC_DEF per row
+    version. Every few revisions hold a full (zlib) snapshot; the ones in
+    between hold a compressed line diff against the previous revision.
+    """
+    __table_args__ = (
+        sqlalchemy.Index("ix_catalogrevision_catalog_row_id_version", "catalog", "row_id", "version", unique=True),
+    )
+    
+    catalog: str = sqlmodel.Field(default="")  # "metric" or "readme"
+    row_id: int = 0
+    version: int = 0  # Row VERSION this text was saved with
+    is_snapshot: bool = False  # Full text, or a diff against the previous revision
+    chain: int = 0  # Diffs since the last snapshot (0 for a snapshot)
+    data: bytes = sqlmodel.Field(
+        default=b"",
+        sa_column=sqlalchemy.Column("data", sqlalchemy.LargeBinary, nullable=False),
+    )
+    text_size: int = 0  # Length of the full text in bytes (UTF-8)
+    text_hash: str = sqlmodel.Field(default="")  # sha256 of the full text
+    created_at: datetime = sqlmodel.Field(
+        default=None,
+        sa_column=sqlalchemy.Column(
+            "created_at",
+            sqlalchemy.DateTime(timezone=True),
+            server_default=sqlalchemy.func.now(),
+        ),
+    )
@@ -0,0 +1,157 @@
+# ltx_automation_app/database/pagination.py
+"""
+Keyset (seek) pagination for the organization and project listings, and
+the cursors of the filtered metric pages (metric_index).
+
+Each listing has a fixed, unique sort key. A page is fetched with
+"WHERE key > last key ORDER BY key LIMIT n", which walks the index and
+costs the same for page 1000 as for page 1, unlike OFFSET. Inserts and deletes between requests never
+duplicate or skip rows.
+
+Page functions return (rows, next_cursor). next_cursor is None on the
+last page; otherwise pass it back to get the following page. Cursors are
+opaque strings (URL-safe base64 JSON) bound to one listing, so a cursor
+from one listing cannot be used with another.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import reflex as rx
+from sqlalchemy import tuple_
+from sqlmodel import select
+
+from .models import Organization, Project
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+ORGANIZATIONS = "organizations"
+PROJECTS = "projects"
+METRICS = "metrics"
+
+
+# ============ Cursors ============
+
+def encode_cursor(listing: str, values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    payload = json.dumps([listing, list(values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(listing: str, cursor: Optional[str]) -> Optional[list]:
+    """
+    Decode a cursor for a listing. Returns None for an empty cursor
+    (first page) and raises ValueError for a malformed or foreign cursor.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        owner, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if owner != listing or not isinstance(values, list):
+        raise ValueError(f"Cursor does not belong to the {listing} listing")
+    return values
+
+
+# ============ Query helpers ============
+
+def _page_size(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def _keyset(query, columns: Sequence, after: Optional[list]):
+    """Add the seek predicate and sort order (callers add LIMIT + 1 to detect a next page)."""
+    if after is not None:
+        if len(columns) == 1:
+            key, value = columns[0], after[0]
+        else:
+            key, value = tuple_(*columns), tuple_(*after)
+        query = query.where(key > value)
+    return query.order_by(*columns)
+
+
+def _page(listing: str, rows: List[Any], limit: int, sort_key: Callable[[Any], list]) -> Tuple[List[Any], Optional[str]]:
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(listing, sort_key(rows[-1]))
+
+
+def _organizations_query(cursor: Optional[str], limit: int):
+    after = decode_cursor(ORGANIZATIONS, cursor)
+    return _keyset(select(Organization), [Organization.name, Organization.id], after).limit(limit + 1)
+
+
+def _organization_projects_query(org_name: str, cursor: Optional[str], limit: int):
+    # Joined on the organization name, so a page is one statement without
+    # a separate organization id lookup
+    after = decode_cursor(PROJECTS, cursor)
+    query = (
+        select(Project)
+        .join(Organization, Project.organization_id == Organization.id)
+        .where(Organization.name == org_name)
+    )
+    return _keyset(query, [Project.name, Project.id], after).limit(limit + 1)
+
+
+def _by_name_and_id(row) -> list:
+    return [row.name, row.id]
+
+
+# ============ Sync page functions ============
+
+def get_organizations_page(cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Get one page of organizations ordered by name.
+    Should be called from within a State event handler.
+    """
+    limit = _page_size(limit)
+    with rx.session() as session:
+        rows = session.exec(_organizations_query(cursor, limit)).all()
+    return _page(ORGANIZATIONS, rows, limit, _by_name_and_id)
+
+
+def get_organization_projects_page(org_name: str, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Get one page of an organization's projects ordered by name, by
+    organization name (an unknown organization has no projects).
+    Should be called from within a State event handler.
+    """
+    limit = _page_size(limit)
+    with rx.session() as session:
+        rows = session.exec(_organization_projects_query(org_name, cursor, limit)).all()
+    return _page(PROJECTS, rows, limit, _by_name_and_id)
+
+
+# ============ Async page functions ============
+
+async def get_organizations_page_async(cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE):
+    """
+    Get one page of organizations ordered by name without blocking the event loop.
+    Should be awaited from within an async State event handler.
+    """
+    limit = _page_size(limit)
+    async with rx.asession() as session:
+        rows = (await session.exec(_organizations_query(cursor, limit))).all()
+    return _page(ORGANIZATIONS, rows, limit, _by_name_and_id)
+
+
+async def get_organization_projects_page_async(
+    org_name: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    Get one page of an organization's projects (by organization name)
+    without blocking the event loop.
+    Should be awaited from within an async State event handler.
+    """
+    limit = _page_size(limit)
+    async with rx.asession() as session:
+        rows = (await session.exec(_organization_projects_query(org_name, cursor, limit))).all()
+    return _page(PROJECTS, rows, limit, _by_name_and_id)
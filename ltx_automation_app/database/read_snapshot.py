@@ -0,0 +1,367 @@
+# ltx_automation_app/database/read_snapshot.py
+"""
+In-memory SQLite snapshot of the Metric and README catalogs for reads.
+
+The catalog read helpers in database_config query this snapshot instead
+of the database file, so their queries do no disk I/O and never wait on a
+writer's lock.
+
+The snapshot is loaded with the SQLite backup API (sqlite3.Connection.backup,
+a page copy of the database in one read transaction); everything but the
+catalog tables and their indexes is then dropped. The catalog versions
+(catalog_cache.catalog_versions, the latest change log ids) the copy
+corresponds to are read from the copied change log first.
+
+Writes are applied from the change log rather than by reloading:
+- A session that wrote catalog rows bumps an in-process commit count when
+  it commits, and patches the snapshot right there: the rows logged since
+  the snapshot's versions are re-read by id and replaced in place (one
+  indexed query per catalog). A commit costs work proportional to its
+  changes, not to the catalog.
+- A "reload" entry (bulk write), changes already pruned from the log, or
+  more than CHANGE_FEED_LIMIT entries load the snapshot again instead.
+- Writes from other processes are picked up by comparing the versions
+  with the database at most every SNAPSHOT_CHECK_SECONDS.
+
+A read only compares in-process counters, so it touches no disk unless the
+cross-process check is due. When the snapshot is behind a commit of this
+process (a patch failed, or another thread is patching), reads go to the
+database instead of waiting.
+
+The snapshot is a shared-cache in-memory database: a pool of read-only
+connections serves concurrent readers, and one extra connection keeps it
+alive and applies the patches. Readers read uncommitted, so a patch never
+waits on (or fails because of) a reader. A reload fills a new database and
+swaps it in, so readers never see a partial copy; readers still on the old
+one finish on it.
+
+Only SQLite is copied: on other databases (and when the snapshot is
+disabled with LTX_READ_SNAPSHOT=0) snapshot_session() is rx.session().
+"""
+
+import contextlib
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import reflex as rx
+import sqlmodel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from .catalog_cache import CATALOG_MODELS, CATALOG_TABLES, METRIC_CATALOG, README_CATALOG
+from .catalog_changes import CHANGE_FEED_LIMIT, watermark_catalog
+from .models import CatalogChange, Metric, ReadmeInstruction
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TABLES = (Metric.__tablename__, ReadmeInstruction.__tablename__)
+_CATALOG_TABLE = {catalog: table for table, catalog in CATALOG_TABLES.items()}
+# Pooled read connections per snapshot (more are opened under load)
+SNAPSHOT_POOL_SIZE = int(os.environ.get("LTX_READ_SNAPSHOT_POOL_SIZE", 8))
+# How often reads compare the snapshot with the database, for writes made
+# by other processes (writes of this process are applied when they commit)
+SNAPSHOT_CHECK_SECONDS = float(os.environ.get("LTX_READ_SNAPSHOT_CHECK_SECONDS", 5))
+
+_engine = None
+_anchor: Optional[sqlite3.Connection] = None
+_version: Optional[Dict[str, int]] = None
+_generation = itertools.count(1)
+# Catalog commits seen by this process, and how many of them the snapshot holds
+_commits = 0
+_synced_commits = 0
+_next_check = 0.0
+# Guards swapping the snapshot and checking out a connection from it
+_swap_lock = threading.Lock()
+# Serializes loads and patches (the anchor connection is only used under it)
+_refresh_lock = threading.Lock()
+_commits_lock = threading.Lock()
+
+
+def _enabled() -> bool:
+    return os.environ.get("LTX_READ_SNAPSHOT", "1") != "0"
+
+
+def _available() -> bool:
+    return _enabled() and rx.model.get_engine().dialect.name == "sqlite"
+
+
+def _connect(uri: str, read_only: bool = True) -> sqlite3.Connection:
+    connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    if read_only:
+        connection.execute("PRAGMA query_only=ON")
+        # No table read locks, so patches on the anchor never hit SQLITE_LOCKED
+        connection.execute("PRAGMA read_uncommitted=ON")
+    return connection
+
+
+# ============ Loading ============
+
+def _copied_versions(connection: sqlite3.Connection) -> Dict[str, int]:
+    """Catalog versions recorded in a database's change log."""
+    row = connection.execute(
+        f"SELECT (SELECT MAX(id) FROM {CatalogChange.__tablename__} WHERE catalog = ?), "
+        f"(SELECT MAX(id) FROM {CatalogChange.__tablename__} WHERE catalog = ?)",
+        (METRIC_CATALOG, README_CATALOG),
+    ).fetchone()
+    return {METRIC_CATALOG: row[0] or 0, README_CATALOG: row[1] or 0}
+
+
+def _strip_to_catalog(connection: sqlite3.Connection):
+    """Drop every trigger, view and table of a backup but the catalog tables."""
+    def names(kind: str, extra: str = "") -> List[str]:
+        return [
+            name for (name,) in connection.execute(
+                f"SELECT name FROM sqlite_master WHERE type = ? {extra}", (kind,)
+            ).fetchall()
+        ]
+
+    for name in names("trigger"):
+        connection.execute(f'DROP TRIGGER "{name}"')
+    for name in names("view"):
+        connection.execute(f'DROP VIEW "{name}"')
+    # Virtual (FTS) tables first: dropping one drops its shadow tables
+    for name in names("table", "AND sql LIKE 'CREATE VIRTUAL TABLE%'"):
+        connection.execute(f'DROP TABLE "{name}"')
+    for name in names("table", "AND name NOT LIKE 'sqlite_%'"):
+        if name not in SNAPSHOT_TABLES:
+            connection.execute(f'DROP TABLE "{name}"')
+    connection.commit()
+    # Hand the pages of the dropped tables back
+    connection.execute("VACUUM")
+
+
+def _load():
+    """Load a new snapshot with the backup API and swap it in. Call with _refresh_lock held."""
+    global _engine, _anchor, _version
+    start = time.perf_counter()
+    uri = f"file:ltx_catalog_snapshot_{next(_generation)}?mode=memory&cache=shared"
+    anchor = _connect(uri, read_only=False)
+    raw = rx.model.get_engine().raw_connection()
+    try:
+        raw.driver_connection.backup(anchor)
+        version = _copied_versions(anchor)
+        _strip_to_catalog(anchor)
+    except Exception:
+        anchor.close()
+        raise
+    finally:
+        raw.close()
+    engine = sqlmodel.create_engine(
+        "sqlite://",
+        creator=lambda: _connect(uri),
+        poolclass=QueuePool,
+        pool_size=SNAPSHOT_POOL_SIZE,
+        max_overflow=SNAPSHOT_POOL_SIZE,
+    )
+    with _swap_lock:
+        old_engine, old_anchor = _engine, _anchor
+        _engine, _anchor, _version = engine, anchor, version
+    if old_engine is not None:
+        # Readers still on the old copy hold their connection, which keeps
+        # it alive until they are done
+        old_engine.dispose()
+        old_anchor.close()
+    logger.info(
+        f"Loaded catalog read snapshot {version} in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+
+# ============ Patching ============
+
+# Per table: (column names, current rows of the changed ids, ids that are gone)
+_Patch = Dict[str, Tuple[List[str], list, List[int]]]
+
+
+def _read_changes(source: sqlite3.Connection) -> Optional[Tuple[Dict[str, int], _Patch]]:
+    """
+    Read the catalog versions and the current rows of everything logged
+    since the snapshot's versions, in one read transaction of the database.
+    Returns None when the snapshot has to be loaded again instead.
+    """
+    source.execute("BEGIN")
+    try:
+        versions = _copied_versions(source)
+        patch: _Patch = {}
+        for catalog, since in _version.items():
+            if versions[catalog] == since:
+                continue
+            pruned = source.execute(
+                f"SELECT row_id FROM {CatalogChange.__tablename__} WHERE catalog = ?",
+                (watermark_catalog(catalog),),
+            ).fetchone()
+            entries = source.execute(
+                f"SELECT row_id, operation FROM {CatalogChange.__tablename__} "
+                "WHERE catalog = ? AND id > ? ORDER BY id LIMIT ?",
+                (catalog, since, CHANGE_FEED_LIMIT + 1),
+            ).fetchall()
+            if (
+                len(entries) > CHANGE_FEED_LIMIT
+                or versions[catalog] < since  # the database was replaced
+                or since < ((pruned and pruned[0]) or 0)
+                or any(operation == "reload" for _, operation in entries)
+            ):
+                return None
+            table = _CATALOG_TABLE[catalog]
+            ids = sorted({row_id for row_id, _ in entries})
+            cursor = source.execute(
+                f'SELECT * FROM "{table}" WHERE id IN ({", ".join("?" for _ in ids)})', ids
+            )
+            rows = cursor.fetchall()
+            found = {row[0] for row in rows}
+            columns = [column[0] for column in cursor.description]
+            patch[table] = (columns, rows, [row_id for row_id in ids if row_id not in found])
+    finally:
+        source.execute("COMMIT")
+    return versions, patch
+
+
+def _apply(patch: _Patch):
+    """Replace the changed rows in the snapshot in one transaction of the anchor."""
+    try:
+        for table, (columns, rows, gone) in patch.items():
+            if rows:
+                names = ", ".join(f'"{column}"' for column in columns)
+                _anchor.executemany(
+                    f'INSERT OR REPLACE INTO "{table}" ({names}) VALUES ({", ".join("?" for _ in columns)})',
+                    rows,
+                )
+            if gone:
+                _anchor.execute(
+                    f'DELETE FROM "{table}" WHERE id IN ({", ".join("?" for _ in gone)})', gone
+                )
+        _anchor.commit()
+    except Exception:
+        _anchor.rollback()
+        raise
+
+
+def _sync():
+    """Bring the snapshot up to the database. Call with _refresh_lock held."""
+    global _version
+    if _anchor is None:
+        _load()
+        return
+    raw = rx.model.get_engine().raw_connection()
+    try:
+        changes = _read_changes(raw.driver_connection)
+    finally:
+        raw.close()
+    if changes is None:
+        _load()
+        return
+    versions, patch = changes
+    if patch:
+        try:
+            _apply(patch)
+        except sqlite3.Error as e:
+            # E.g. a migration changed a catalog table under us
+            logger.info(f"Reloading the catalog read snapshot, patch failed: {e}")
+            _load()
+            return
+    _version = versions
+
+
+def _refresh(wait: bool) -> bool:
+    """
+    Bring the snapshot up to the database. Without wait, gives up if
+    another thread is refreshing. True if the snapshot can serve reads.
+    """
+    global _synced_commits, _next_check
+    if not _refresh_lock.acquire(blocking=wait):
+        # Serve the snapshot only if it holds every commit of this process
+        return _engine is not None and _synced_commits == _commits
+    try:
+        # Commits landing from here on are patched by their own hook
+        commits = _commits
+        _sync()
+        _synced_commits = commits
+        _next_check = time.monotonic() + SNAPSHOT_CHECK_SECONDS
+        return True
+    except Exception as e:
+        logger.warning(f"Catalog read snapshot unavailable, reading from the database: {e}")
+        return False
+    finally:
+        _refresh_lock.release()
+
+
+# ============ Commit hook ============
+
+# session.info key: the transaction wrote catalog rows
+_CHANGED_KEY = "ltx_catalog_snapshot_changed"
+
+
+def _after_flush(session, flush_context):
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if type(obj) in CATALOG_MODELS:
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+def _do_orm_execute(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in CATALOG_TABLES:
+        orm_execute_state.session.info[_CHANGED_KEY] = True
+
+
+def _after_commit(session):
+    global _commits
+    if not session.info.pop(_CHANGED_KEY, False):
+        return
+    with _commits_lock:
+        _commits += 1
+    if _engine is not None:
+        _refresh(wait=True)
+
+
+def _after_rollback(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "do_orm_execute", _do_orm_execute)
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
+
+
+# ============ Reading ============
+
+def load_read_snapshot() -> bool:
+    """
+    Load the catalog tables into the in-memory snapshot (or bring it up to
+    date) and start serving reads from it. Returns False when the snapshot
+    is not available (not SQLite, disabled, or the load failed).
+    Registered as an app lifespan task.
+    """
+    return _available() and _refresh(wait=True)
+
+
+def _serving() -> bool:
+    """True if the snapshot can serve a read, refreshing it first when due."""
+    if _engine is not None and _synced_commits == _commits and time.monotonic() < _next_check:
+        return True
+    return _refresh(wait=False)
+
+
+@contextlib.contextmanager
+def snapshot_session() -> Iterator[sqlmodel.Session]:
+    """
+    Session for catalog reads (Metric and ReadmeInstruction only), served
+    from the in-memory snapshot when it is current, else from rx.session().
+    Should be called from within a State event handler.
+    """
+    if not _available() or not _serving():
+        with rx.session() as session:
+            yield session
+        return
+    with _swap_lock:
+        connection = _engine.connect()
+    with connection, sqlmodel.Session(bind=connection) as session:
+        yield session
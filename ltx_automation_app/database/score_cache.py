@@ -0,0 +1,216 @@
+# ltx_automation_app/database/score_cache.py
+"""
+Content-addressed cache of automated metric scores.
+
+Scores are keyed by hash(source, target, metric definition, scorer version),
+plus the reference for reference-based metrics, so re-running automated
+scoring on a new model version only sends the segments that have never
+been scored to the scorer.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import reflex as rx
+import sqlalchemy
+from sqlmodel import select
+
+from .models import Metric, MetricScoreCache
+
+logger = logging.getLogger(__name__)
+
+# Keeps each IN (...) lookup well under SQLite's bound-parameter limit
+SCORE_CACHE_BATCH_SIZE = 500
+
+# Process-wide running totals, surfaced through get_score_cache_stats()
+_stats_lock = threading.Lock()
+_cumulative_stats = {"hits": 0, "misses": 0}
+
+
+def score_cache_key(
+    source: str,
+    target: str,
+    metric_definition: str,
+    scorer_version: str,
+    reference: Optional[str] = None,
+) -> str:
+    """
+    Build the cache key for one scored segment.
+    Each part is length-prefixed so no two inputs can collide by concatenation.
+    The reference is only part of the key when given, so keys of
+    (source, target) pairs do not change.
+    """
+    digest = hashlib.sha256()
+    parts = (source, target, metric_definition, scorer_version)
+    if reference is not None:
+        parts += (reference,)
+    for part in parts:
+        encoded = (part or "").encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def metric_definition_text(metric: Metric) -> str:
+    """Text that identifies what a metric measures, used in cache keys."""
+    return f"{metric.METRIC_NAME or ''}\n{metric.METRIC_DEF or ''}"
+
+
+def _batched(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def lookup_cached_scores(keys: Iterable[str]) -> Dict[str, float]:
+    """
+    Look up cached scores for many keys at once.
+    Runs one IN query per SCORE_CACHE_BATCH_SIZE keys.
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    found: Dict[str, float] = {}
+    if not unique_keys:
+        return found
+
+    with rx.session() as session:
+        for batch in _batched(unique_keys, SCORE_CACHE_BATCH_SIZE):
+            rows = session.exec(
+                select(MetricScoreCache.cache_key, MetricScoreCache.score).where(
+                    MetricScoreCache.cache_key.in_(batch)
+                )
+            ).all()
+            found.update({key: score for key, score in rows})
+    return found
+
+
+def store_cached_scores(scores: Dict[str, float], scorer_version: str = ""):
+    """
+    Store newly computed scores in one executemany insert.
+    Keys written concurrently by another worker are skipped.
+    """
+    if not scores:
+        return
+
+    rows = [
+        {"cache_key": key, "scorer_version": scorer_version, "score": score}
+        for key, score in scores.items()
+    ]
+
+    with rx.session() as session:
+        try:
+            session.execute(sqlalchemy.insert(MetricScoreCache), rows)
+            session.commit()
+            return
+        except sqlalchemy.exc.IntegrityError:
+            session.rollback()
+
+    # Another worker stored some of these keys first - insert the rest
+    existing = lookup_cached_scores(scores.keys())
+    remaining = [row for row in rows if row["cache_key"] not in existing]
+    if remaining:
+        with rx.session() as session:
+            session.execute(sqlalchemy.insert(MetricScoreCache), remaining)
+            session.commit()
+
+
+def score_metrics_with_cache(
+    pairs: Sequence[Tuple[str, ...]],
+    metrics: Sequence[Metric],
+    scorer: Callable[[List[Tuple[str, ...]], Metric], List[float]],
+    scorer_version: str,
+) -> Tuple[List[List[float]], Dict[str, float]]:
+    """
+    Score segments for several metrics, reusing cached scores.
+    The keys of all metrics are looked up together and the new scores of
+    all metrics are stored in one insert.
+
+    Args:
+        pairs: (source, target) or (source, target, reference) segments to
+            score, in output order
+        metrics: Metrics whose definitions are being scored
+        scorer: Callable that scores a list of segments for one metric; it
+            only receives cache misses, each distinct segment once
+        scorer_version: Version string of the scorer, part of the cache key
+
+    Returns:
+        Per metric, scores in the same order as pairs, and the hit/miss
+        stats for this run (over all metrics)
+    """
+    keys = [
+        [
+            score_cache_key(pair[0], pair[1], definition, scorer_version, *pair[2:3])
+            for pair in pairs
+        ]
+        for definition in map(metric_definition_text, metrics)
+    ]
+
+    cached = lookup_cached_scores(key for metric_keys in keys for key in metric_keys)
+
+    fresh: Dict[str, float] = {}
+    for metric, metric_keys in zip(metrics, keys):
+        # Send each distinct missing segment to the scorer exactly once
+        missing: Dict[str, Tuple[str, ...]] = {}
+        for key, pair in zip(metric_keys, pairs):
+            if key not in cached and key not in fresh and key not in missing:
+                missing[key] = pair
+        if not missing:
+            continue
+        fresh_scores = scorer(list(missing.values()), metric)
+        if len(fresh_scores) != len(missing):
+            raise ValueError(
+                f"Scorer returned {len(fresh_scores)} scores for {len(missing)} pairs"
+            )
+        fresh.update(zip(missing.keys(), fresh_scores))
+
+    store_cached_scores(fresh, scorer_version=scorer_version)
+    cached.update(fresh)
+
+    total = sum(len(metric_keys) for metric_keys in keys)
+    hits = total - len(fresh)
+    stats = {
+        "total": total,
+        "hits": hits,
+        "misses": len(fresh),
+        "hit_rate": hits / total if total else 0.0,
+    }
+    with _stats_lock:
+        _cumulative_stats["hits"] += hits
+        _cumulative_stats["misses"] += len(fresh)
+
+    names = ", ".join(f"'{metric.METRIC_NAME}'" for metric in metrics)
+    logger.info(
+        f"Score cache for {names}: {hits}/{total} hits ({stats['hit_rate']:.1%})"
+    )
+    return [[cached[key] for key in metric_keys] for metric_keys in keys], stats
+
+
+def score_with_cache(
+    pairs: Sequence[Tuple[str, ...]],
+    metric: Metric,
+    scorer: Callable[[List[Tuple[str, ...]], Metric], List[float]],
+    scorer_version: str,
+) -> Tuple[List[float], Dict[str, float]]:
+    """
+    Score segments for one metric, reusing cached scores
+    (score_metrics_with_cache for a single metric).
+
+    Returns:
+        Scores in the same order as pairs, and the hit/miss stats for this run
+    """
+    (scores,), stats = score_metrics_with_cache(pairs, [metric], scorer, scorer_version)
+    return scores, stats
+
+
+def get_score_cache_stats() -> Dict[str, float]:
+    """Process-wide score cache hit/miss totals since startup."""
+    with _stats_lock:
+        hits = _cumulative_stats["hits"]
+        misses = _cumulative_stats["misses"]
+    total = hits + misses
+    return {
+        "total": total,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
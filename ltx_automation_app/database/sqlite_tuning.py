@@ -0,0 +1,152 @@
+# ltx_automation_app/database/sqlite_tuning.py
+"""
+SQLite performance profile applied to every new database connection.
+
+By default SQLite runs in rollback-journal mode with a full fsync on every
+commit. The profiles below switch to WAL with synchronous=NORMAL and give
+SQLite more page cache and memory-mapped I/O.
+
+The active profile is chosen per environment with LTX_DB_PROFILE
+(development, production, test or baseline). Single pragmas can be
+overridden with LTX_SQLITE_<PRAGMA>, e.g. LTX_SQLITE_CACHE_SIZE=-131072.
+Overrides must be one of the pragma's keywords (PRAGMA_KEYWORDS) or an
+integer; a bad value raises ValueError when the tuning is installed.
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "development"
+
+# Order matters: busy_timeout first so the WAL switch waits on locks
+SQLITE_PROFILES: Dict[str, Dict[str, object]] = {
+    "development": {
+        "busy_timeout": 5000,            # ms to wait on a locked database
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,            # negative = KiB, i.e. 64 MiB
+        "mmap_size": 268435456,          # 256 MiB
+        "temp_store": "MEMORY",
+    },
+    "production": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -262144,           # 256 MiB
+        "mmap_size": 1073741824,         # 1 GiB
+        "temp_store": "MEMORY",
+    },
+    "test": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -16384,            # 16 MiB
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    # SQLite defaults - no pragmas applied (used as the benchmark baseline)
+    "baseline": {},
+}
+
+# Values accepted for keyword pragmas; every other pragma takes an integer
+PRAGMA_KEYWORDS: Dict[str, set] = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY", "0", "1", "2"},
+}
+
+_profile_override: Optional[str] = None
+_installed = False
+
+
+def set_sqlite_profile(profile: Optional[str]):
+    """
+    Force a profile for connections opened from now on.
+    Pass None to go back to LTX_DB_PROFILE.
+    """
+    global _profile_override
+    if profile is not None and profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile}'")
+    _profile_override = profile
+
+
+def _override_value(pragma: str, value: str) -> object:
+    """Validate an LTX_SQLITE_* override; returns the keyword or integer to use."""
+    variable = f"LTX_SQLITE_{pragma.upper()}"
+    if pragma in PRAGMA_KEYWORDS:
+        keyword = value.strip().upper()
+        if keyword not in PRAGMA_KEYWORDS[pragma]:
+            raise ValueError(
+                f"{variable}={value!r} is not one of {', '.join(sorted(PRAGMA_KEYWORDS[pragma]))}"
+            )
+        return keyword
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{variable}={value!r} is not an integer") from None
+
+
+def get_sqlite_pragmas(profile: Optional[str] = None) -> Dict[str, object]:
+    """
+    Resolve the pragmas for a profile, including LTX_SQLITE_* overrides.
+    Raises ValueError for an override that is not a valid value.
+    """
+    name = profile or _profile_override or os.environ.get("LTX_DB_PROFILE", DEFAULT_PROFILE)
+    if name not in SQLITE_PROFILES:
+        logger.warning(f"Unknown LTX_DB_PROFILE '{name}', using '{DEFAULT_PROFILE}'")
+        name = DEFAULT_PROFILE
+
+    pragmas = dict(SQLITE_PROFILES[name])
+    for pragma in SQLITE_PROFILES[DEFAULT_PROFILE]:
+        override = os.environ.get(f"LTX_SQLITE_{pragma.upper()}")
+        if override is not None:
+            pragmas[pragma] = _override_value(pragma, override)
+    return pragmas
+
+
+def _is_sqlite_connection(dbapi_connection) -> bool:
+    """True for sqlite3 connections and SQLAlchemy's aiosqlite adapter."""
+    return (
+        isinstance(dbapi_connection, sqlite3.Connection)
+        or "sqlite" in type(dbapi_connection).__module__
+    )
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, object]):
+    """Run PRAGMA statements on a raw DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    if not _is_sqlite_connection(dbapi_connection):
+        return
+    pragmas = get_sqlite_pragmas()
+    if pragmas:
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+
+def install_sqlite_tuning():
+    """
+    Hook the connect event of every engine (including the one behind
+    rx.session()) so new SQLite connections get the active profile.
+    Safe to call more than once. Raises ValueError for a bad
+    LTX_SQLITE_* override, so it fails at startup rather than on connect.
+    """
+    global _installed
+    get_sqlite_pragmas()
+    if _installed:
+        return
+    event.listen(Engine, "connect", _on_connect)
+    _installed = True
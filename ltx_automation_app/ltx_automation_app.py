@@ -8,6 +8,9 @@ import reflex as rx
 from ltx_automation_app.components.landing_card import landing_card
 from ltx_automation_app.pages.placeholder_page import seo_page, lingnet_page
 from ltx_automation_app.pages.ltx_bench_page import ltx_bench_page
+from ltx_automation_app.database.engine import configure_database_engines
+from ltx_automation_app.database.read_snapshot import load_read_snapshot
+from ltx_automation_app.database.maintenance import database_maintenance_task
 
 
 def index() -> rx.Component:
@@ -71,9 +74,17 @@ def index() -> rx.Component:
     )
 
 
+# Tuned connection pools must be registered before the first query
+configure_database_engines()
+
 # Initialize the Reflex app with light theme
 app = rx.App()
 
+# Catalog reads are served from an in-memory copy loaded at startup
+app.register_lifespan_task(load_read_snapshot)
+# ANALYZE, incremental vacuum and WAL checkpoints when the database is idle
+app.register_lifespan_task(database_maintenance_task)
+
 # Register pages
 app.add_page(index, route="/")
 app.add_page(seo_page, route="/seo")
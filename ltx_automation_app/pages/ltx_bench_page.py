@@ -15,6 +15,7 @@ from ltx_automation_app.components.ltx_bench.evaluation_library.evaluation_libra
 from ltx_automation_app.components.ltx_bench.organization_selection import organization_selection_view
 from ltx_automation_app.components.ltx_bench.project_management import project_creation_and_selection_view
 from ltx_automation_app.components.ltx_bench.file_prep_view import file_prep_view
+from ltx_automation_app.components.ltx_bench.database_admin_view import database_admin_view
 
 
 def ltx_bench_page() -> rx.Component:
@@ -44,8 +45,13 @@ def ltx_bench_page() -> rx.Component:
                             LTXBenchNavigationState.current_view == "file_prep",
                             file_prep_container(),
                             
-                            # Default fallback
-                            ltx_bench_dashboard()
+                            rx.cond(
+                                LTXBenchNavigationState.current_view == "database_admin",
+                                database_admin_view(),
+                                
+                                # Default fallback
+                                ltx_bench_dashboard()
+                            )
                         )
                     )
                 )
@@ -4,9 +4,13 @@ LTX Bench states with proper database integration.
 Each state class inherits directly from rx.State for optimal performance.
 """
 
+import asyncio
 import reflex as rx
+from datetime import datetime
+from types import SimpleNamespace
 from typing import Dict, Any, List
 from sqlmodel import select
+from sqlalchemy.exc import IntegrityError
 from ltx_automation_app.database.models import (
     Organization, 
     Project, 
@@ -14,8 +18,96 @@ from ltx_automation_app.database.models import (
     ReadmeInstruction,
     Metric, 
     Evaluation,
-    EvaluationMetric
+    EvaluationMetric,
+    ACTIVE_STATUS,
 )
+from ltx_automation_app.database.database_config import (
+    get_organization_id_async,
+    get_readme_text,
+)
+from ltx_automation_app.database.catalog_archive import (
+    archive_readme,
+    get_archived_readmes,
+    restore_readme,
+)
+from ltx_automation_app.database.catalog_edits import CatalogEditConflict, update_catalog_row
+from ltx_automation_app.database.catalog_cache import (
+    METRIC_CATALOG,
+    README_CATALOG,
+    catalog_version,
+    metric_catalog_row,
+    get_metric_catalog,
+    get_metric_options,
+    get_readme_catalog,
+    get_readme_dropdown_options,
+    get_readme_options,
+)
+from ltx_automation_app.database.catalog_changes import (
+    apply_catalog_changes,
+    get_catalog_changes,
+    get_catalog_feed_version,
+)
+from ltx_automation_app.database.catalog_search import (
+    DEFAULT_PAGE_SIZE as SEARCH_PAGE_SIZE,
+    search_metric_ids,
+    search_metrics as search_metric_catalog,
+)
+from ltx_automation_app.database.pagination import (
+    get_organization_projects_page,
+    get_organization_projects_page_async,
+    get_organizations_page,
+    get_organizations_page_async,
+)
+from ltx_automation_app.database.metric_index import (
+    get_metric_facet_index,
+    get_metrics_window,
+)
+from ltx_automation_app.database.maintenance import get_storage_stats, run_database_maintenance
+from ltx_automation_app.database.score_cache import get_score_cache_stats
+from ltx_automation_app.utils.excel_builder import DynamicExcelBuilder
+from ltx_automation_app.utils.mt_metrics import compute_pre_eval_hints
+from ltx_automation_app.components.infinite_scroll import LOAD_MORE_THRESHOLD_PX
+from ltx_automation_app.components.virtual_list import (
+    VIRTUAL_LIST_OVERSCAN_ROWS,
+    scroll_to_top,
+    window_for_scroll,
+)
+
+# Typing in the README editor reaches the server after this pause (client-side
+# debounce); edits are then written at most once per autosave window
+README_INPUT_DEBOUNCE_MS = 500
+README_AUTOSAVE_SECONDS = 5
+
+# README columns shown in the edit merge view (CUSTOM_IND follows DEFAULT_IND)
+README_EDIT_FIELDS = {
+    "README_TITLE": "Title",
+    "README_TXT": "Content",
+    "EVAL_TYPE": "Eval Type",
+    "SCORE_TYPE": "Score Type",
+    "PRE_EVAL_CONTEXT": "Pre-Eval Context",
+    "DEFAULT_IND": "Default",
+}
+
+# Metrics shown by the library list at first, and added per "load more"
+METRIC_WINDOW_SIZE = 50
+
+# Virtualized metric list of the file prep metric picker: fixed row and
+# viewport heights (px) and the element id of its scroll container
+METRIC_ROW_HEIGHT_PX = 96
+METRIC_LIST_HEIGHT_PX = 384
+METRIC_LIST_ID = "metric_list"
+
+# Existing metric names suggested while typing a custom metric
+CUSTOM_METRIC_SUGGESTIONS = 10
+
+# Facets offered as filter chips in the file prep metric picker
+METRIC_FILTER_FACETS = {
+    "metric_type": "Type",
+    "genai_ind": "GenAI",
+    "mt_llm_ind": "MT/LLM",
+    "content_type": "Content",
+    "score_type": "Score",
+}
 
 
 class LTXBenchNavigationState(rx.State):
@@ -31,37 +123,76 @@ class LTXBenchNavigationState(rx.State):
     organizations: list[str] = []
     projects: list[str] = []
     
+    # Lists are loaded page by page (keyset cursors of the next page, "" = none)
+    organizations_has_more: bool = False
+    projects_has_more: bool = False
+    _organizations_cursor: str = ""
+    _projects_cursor: str = ""
+    
     @rx.event
     def load_initial_data(self):
         """Load organizations from database when page loads."""
         self.refresh_organizations()
     
+    def _set_organizations_page(self, orgs, cursor, append: bool = False):
+        names = [org.name for org in orgs]
+        self.organizations = self.organizations + names if append else names
+        self._organizations_cursor = cursor or ""
+        self.organizations_has_more = cursor is not None
+    
+    def _set_projects_page(self, projects, cursor, append: bool = False):
+        names = [project.name for project in projects]
+        self.projects = self.projects + names if append else names
+        self._projects_cursor = cursor or ""
+        self.projects_has_more = cursor is not None
+    
+    def _clear_projects(self):
+        self.projects = []
+        self._projects_cursor = ""
+        self.projects_has_more = False
+    
     @rx.event
     def refresh_organizations(self):
-        """Refresh organizations list from database."""
-        with rx.session() as session:
-            orgs = session.exec(select(Organization)).all()
-            self.organizations = [org.name for org in orgs]
+        """Reload the first page of organizations from database."""
+        self._set_organizations_page(*get_organizations_page())
+    
+    @rx.event
+    def load_more_organizations(self, remaining: float = 0):
+        """Append the next page of organizations when the list is scrolled near its end."""
+        if not self.organizations_has_more or remaining > LOAD_MORE_THRESHOLD_PX:
+            return
+        self._set_organizations_page(*get_organizations_page(self._organizations_cursor), append=True)
     
     @rx.event
     def refresh_projects(self):
-        """Refresh projects for selected organization from database."""
+        """Reload the first page of projects for the selected organization."""
         if not self.selected_organization:
-            self.projects = []
+            self._clear_projects()
             return
-            
-        with rx.session() as session:
-            org = session.exec(
-                select(Organization).where(Organization.name == self.selected_organization)
-            ).first()
-            
-            if org:
-                projects = session.exec(
-                    select(Project).where(Project.organization_id == org.id)
-                ).all()
-                self.projects = [proj.name for proj in projects]
-            else:
-                self.projects = []
+        self._set_projects_page(*get_organization_projects_page(self.selected_organization))
+    
+    @rx.event
+    def load_more_projects(self, remaining: float = 0):
+        """Append the next page of projects when the list is scrolled near its end."""
+        if not self.projects_has_more or remaining > LOAD_MORE_THRESHOLD_PX:
+            return
+        self._set_projects_page(
+            *get_organization_projects_page(self.selected_organization, self._projects_cursor),
+            append=True,
+        )
+    
+    async def _refresh_organizations_async(self):
+        """Non-blocking refresh of organizations, for async event handlers."""
+        self._set_organizations_page(*await get_organizations_page_async())
+    
+    async def _refresh_projects_async(self):
+        """Non-blocking refresh of projects, for async event handlers."""
+        if not self.selected_organization:
+            self._clear_projects()
+            return
+        self._set_projects_page(
+            *await get_organization_projects_page_async(self.selected_organization)
+        )
     
     @rx.event
     def set_view(self, view: str):
@@ -83,6 +214,12 @@ class LTXBenchNavigationState(rx.State):
         """Navigate to existing projects view."""
         self.current_view = "existing_projects"
     
+    @rx.event
+    def show_database_admin(self):
+        """Navigate to the database admin view (storage statistics and maintenance)."""
+        self.current_view = "database_admin"
+        return DatabaseAdminState.load_storage_stats
+    
     @rx.event
     def show_new_project(self):
         """Navigate to new project creation (starts with organization selection)."""
@@ -138,11 +275,11 @@ class ProjectManagementState(rx.State):
         
         org_name = org_name.strip()
         
-        with rx.session() as session:
+        async with rx.asession() as session:
             # Check if org already exists
-            existing = session.exec(
+            existing = (await session.exec(
                 select(Organization).where(Organization.name == org_name)
-            ).first()
+            )).first()
             
             if existing:
                 return rx.toast.error(f"Organization '{org_name}' already exists")
@@ -150,11 +287,11 @@ class ProjectManagementState(rx.State):
             # Create new org
             new_org = Organization(name=org_name)
             session.add(new_org)
-            session.commit()
+            await session.commit()
         
         # Update navigation state
         nav_state = await self.get_state(LTXBenchNavigationState)
-        nav_state.refresh_organizations()
+        await nav_state._refresh_organizations_async()
         nav_state.selected_organization = org_name
         
         # Clear input
@@ -174,39 +311,27 @@ class ProjectManagementState(rx.State):
         # Get navigation state
         nav_state = await self.get_state(LTXBenchNavigationState)
         
-        with rx.session() as session:
-            # Get organization
-            org = session.exec(
-                select(Organization).where(
-                    Organization.name == nav_state.selected_organization
-                )
-            ).first()
-            
-            if not org:
-                return rx.toast.error("Organization not found")
-            
-            # Check if project already exists
-            existing = session.exec(
-                select(Project).where(
-                    Project.name == project_name,
-                    Project.organization_id == org.id
-                )
-            ).first()
-            
-            if existing:
-                return rx.toast.error(f"Project '{project_name}' already exists")
-            
-            # Create new project
+        # Get organization id (cached process-wide)
+        org_id = await get_organization_id_async(nav_state.selected_organization)
+        if org_id is None:
+            return rx.toast.error("Organization not found")
+        
+        async with rx.asession() as session:
+            # Create new project; uq_project_organization_id_name rejects duplicates
             new_project = Project(
                 name=project_name,
                 description=project_description,
-                organization_id=org.id
+                organization_id=org_id
             )
             session.add(new_project)
-            session.commit()
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                return rx.toast.error(f"Project '{project_name}' already exists")
         
         # Update navigation state
-        nav_state.refresh_projects()
+        await nav_state._refresh_projects_async()
         nav_state.selected_project = project_name
         nav_state.current_view = "file_prep"
         
@@ -217,6 +342,24 @@ class ProjectManagementState(rx.State):
         return rx.toast.success(f"Project '{project_name}' created")
 
 
+def _write_readme_row(readme_id: int, version: int, changes: Dict[str, str], feed_version: int):
+    """
+    Autosave worker (runs in a thread): the compare-and-set UPDATE of
+    changes, then the README feed entries since feed_version (with the
+    whole catalog on a reload), so applying them needs no database access.
+    Returns (new version, None if the README is gone, or the
+    CatalogEditConflict when someone else saved first; feed changes).
+    """
+    try:
+        outcome = update_catalog_row(ReadmeInstruction, readme_id, version, changes)
+    except CatalogEditConflict as conflict:
+        outcome = conflict
+    feed = get_catalog_changes(README_CATALOG, feed_version)
+    if feed["reload"]:
+        feed = {**feed, "rows": get_readme_catalog()}
+    return outcome, feed
+
+
 class EvaluationLibraryState(rx.State):
     """
     State for the Evaluation Library section.
@@ -243,6 +386,19 @@ class EvaluationLibraryState(rx.State):
     edit_readme_title: str = ""  # For editing README title
     edit_readme_content: str = ""  # For editing README content
     
+    # Autosave: column values last written, values when editing started,
+    # and whether an autosave window is open
+    readme_autosave_status: str = ""
+    _saved_readme_fields: Dict[str, str] = {}
+    _readme_fields_before_edit: Dict[str, str] = {}
+    _autosave_scheduled: bool = False
+    
+    # Optimistic concurrency: VERSION of the stored README the edits are
+    # based on, and the fields someone else changed too (merge view rows:
+    # column, label, mine, theirs, choice)
+    _readme_version: int = 0
+    readme_conflict_fields: list[Dict[str, str]] = []
+    
     # Dropdown options loaded from database
     eval_type_options: list[str] = []  # Distinct EVAL_TYPE values
     score_type_options: list[str] = []  # Distinct SCORE_TYPE values
@@ -256,12 +412,26 @@ class EvaluationLibraryState(rx.State):
     selected_pre_eval: str = ""
     selected_default_custom: str = "default"
     
-    # Metrics Library state
-    all_metrics: list[Dict[str, Any]] = []
+    # Archived READMEs (id, title), listed while the archived view is open
+    show_archived_readmes: bool = False
+    archived_readmes: list[Dict[str, str]] = []
+    
+    # Metrics Library state. The catalog and the search results loaded so
+    # far stay on the backend; the client only gets the visible window
+    # (visible_metrics), so events send what changed on screen
+    _all_metrics: list[Dict[str, str]] = []
+    _metric_search_results: list[Dict[str, str]] = []
+    metric_window_size: int = METRIC_WINDOW_SIZE
     metrics_loading: bool = False
     metrics_error: str = ""
-    filtered_metrics: list[Dict[str, Any]] = []
     metric_search_term: str = ""
+    metric_search_has_more: bool = False
+    
+    # Change feed versions of _all_metrics / readme_instructions
+    _metrics_feed_version: int = 0
+    _readmes_feed_version: int = 0
+    # Catalog version last loaded from the shared catalog cache (-1 = never)
+    _dropdowns_version: int = -1
     
     # Additional state methods for sidebar and sections
     @rx.event
@@ -273,7 +443,7 @@ class EvaluationLibraryState(rx.State):
             if not self.readme_instructions:  # Only load if not already loaded
                 self.load_readme_instructions()
         elif section == "metrics":
-            if not self.all_metrics:  # Only load if not already loaded
+            if not self._all_metrics:  # Only load if not already loaded
                 self.load_all_metrics()
     
     @rx.event
@@ -301,38 +471,53 @@ class EvaluationLibraryState(rx.State):
         self.load_readme_instructions()
         self.load_readme_dropdown_options()
     
+    def _apply_readme_changes(self, changes: Dict[str, Any] = None) -> bool:
+        """
+        Bring readme_instructions up to date from the change feed: only the
+        changed entries are replaced (the whole list on a reload).
+        Changes already read from the feed (see _write_readme_row) can be
+        passed in. Returns False if nothing changed.
+        """
+        if changes is None:
+            changes = get_catalog_changes(README_CATALOG, self._readmes_feed_version)
+        if changes["version"] == self._readmes_feed_version:
+            return False
+        if changes["reload"]:
+            self.readme_instructions = changes.get("rows") or get_readme_catalog()
+        else:
+            self.readme_instructions = apply_catalog_changes(self.get_value("readme_instructions"), changes)
+        self._readmes_feed_version = changes["version"]
+        return True
+    
     @rx.event
     def load_readme_instructions(self):
         """
-        Load all README instructions from the database.
+        Load all README instructions from the shared catalog cache.
+        Once loaded, only the changes since the last load are applied.
         """
         try:
-            with rx.session() as session:
-                instructions = session.exec(select(ReadmeInstruction)).all()
-                
-                self.readme_instructions = [
-                    {
-                        "id": str(instruction.id),
-                        "title": instruction.README_TITLE,
-                        "content": instruction.README_TXT,
-                        "README_TITLE": instruction.README_TITLE,  # For view compatibility
-                        "README_TXT": instruction.README_TXT,  # For view compatibility
-                        "README_ID": str(instruction.id),  # For view compatibility
-                        "score_type": instruction.SCORE_TYPE or "",
-                        "eval_type": instruction.EVAL_TYPE or "",
-                        "pre_eval_context": instruction.PRE_EVAL_CONTEXT or "",
-                        "default_ind": instruction.DEFAULT_IND or "N",
-                        "DEFAULT_IND": instruction.DEFAULT_IND or "N",  # For view compatibility
-                        "custom_ind": instruction.CUSTOM_IND or "Y",
-                        "status": instruction.STATUS_IND or "Active"
-                    }
-                    for instruction in instructions
-                ]
+            if not self.readme_instructions:
+                self._readmes_feed_version = get_catalog_feed_version(README_CATALOG)
+                self.readme_instructions = get_readme_catalog()
+            else:
+                if self.readme_edit_mode:
+                    # Save what was typed before the list (and the selection) is refreshed
+                    self._flush_readme_autosave()
+                if not self._apply_readme_changes():
+                    return
+                if any(r["id"] == self.selected_readme_id for r in self.readme_instructions):
+                    # Keep the current selection, refreshed from the patched list
+                    # (while editing, the edits stay on screen)
+                    if self.readme_edit_mode:
+                        self._refresh_current_readme()
+                    else:
+                        self.select_readme(self.selected_readme_id)
+                    return
+            
+            # If there are instructions, select the first one
+            if self.readme_instructions:
+                self.select_readme(self.readme_instructions[0]["id"])
                 
-                # If there are instructions, select the first one
-                if self.readme_instructions:
-                    self.select_readme(self.readme_instructions[0]["id"])
-                    
         except Exception as e:
             print(f"Error loading README instructions: {e}")
             self.readme_instructions = []
@@ -344,35 +529,17 @@ class EvaluationLibraryState(rx.State):
         Load distinct values for dropdowns from the database.
         This ensures dropdowns always show current database values.
         """
+        version = catalog_version(README_CATALOG)
+        if self._dropdowns_version == version:
+            return
         try:
-            with rx.session() as session:
-                # Get distinct EVAL_TYPE values (excluding None/empty)
-                eval_types = session.exec(
-                    select(ReadmeInstruction.EVAL_TYPE).distinct().where(
-                        ReadmeInstruction.EVAL_TYPE != None,
-                        ReadmeInstruction.EVAL_TYPE != ""
-                    )
-                ).all()
-                self.eval_type_options = list(set([t for t in eval_types if t]))
-                
-                # Get distinct SCORE_TYPE values (excluding None/empty)
-                score_types = session.exec(
-                    select(ReadmeInstruction.SCORE_TYPE).distinct().where(
-                        ReadmeInstruction.SCORE_TYPE != None,
-                        ReadmeInstruction.SCORE_TYPE != ""
-                    )
-                ).all()
-                self.score_type_options = list(set([t for t in score_types if t]))
-                
-                # Get distinct PRE_EVAL_CONTEXT values (excluding None/empty)
-                pre_evals = session.exec(
-                    select(ReadmeInstruction.PRE_EVAL_CONTEXT).distinct().where(
-                        ReadmeInstruction.PRE_EVAL_CONTEXT != None,
-                        ReadmeInstruction.PRE_EVAL_CONTEXT != ""
-                    )
-                ).all()
-                self.pre_eval_options = list(set([t for t in pre_evals if t]))
-                
+            # Distinct non-empty values, computed once per catalog version
+            options = get_readme_dropdown_options()
+            self.eval_type_options = options["eval_type"]
+            self.score_type_options = options["score_type"]
+            self.pre_eval_options = options["pre_eval_context"]
+            self._dropdowns_version = version
+            
         except Exception as e:
             print(f"Error loading dropdown options: {e}")
             # Set default options if database query fails
@@ -383,9 +550,22 @@ class EvaluationLibraryState(rx.State):
     @rx.event
     def cancel_edit(self):
         """
-        Cancel editing and revert to view mode without saving.
+        Cancel editing and revert to view mode, undoing any changes that
+        were already autosaved.
         """
+        toast = None
+        try:
+            self._write_readme_fields(self._readme_fields_before_edit)
+        except CatalogEditConflict:
+            # Someone else changed what we autosaved: keep their version
+            self._show_saved_readme()
+            toast = rx.toast.info("This README was changed by someone else; their version was kept")
+        except Exception as e:
+            print(f"Error reverting README changes: {e}")
+            return rx.toast.error(f"Failed to revert autosaved changes: {str(e)}")
         self.readme_edit_mode = False
+        self.readme_autosave_status = ""
+        self.readme_conflict_fields = []
         # Reset edit vars
         self.edit_readme_title = ""  # ADD THIS LINE
         self.edit_readme_content = ""  # ADD THIS LINE
@@ -393,32 +573,27 @@ class EvaluationLibraryState(rx.State):
         self.edit_score_type = ""
         self.edit_pre_eval = ""
         self.edit_default_custom = "default"
+        return toast
     
     @rx.event
     def select_readme(self, readme_id: str):
         """
         Select a README instruction for viewing/editing.
+        Pending autosave edits of the previous README are saved first.
         """
+        if self.readme_edit_mode:
+            self._flush_readme_autosave()
+            self.readme_conflict_fields = []
         for readme in self.readme_instructions:
             if readme["id"] == readme_id:
                 self.selected_readme_id = readme_id
                 self.selected_readme_title = readme["title"]
-                self.selected_readme_content = readme["content"]
+                # The list only carries summaries; fetch the text of this one
+                self.selected_readme_content = get_readme_text(int(readme_id))
                 self.selected_eval_type = readme["eval_type"]
                 self.selected_score_type = readme["score_type"]
                 self.selected_pre_eval = readme["pre_eval_context"]
-                
-                # Set current_readme_data with uppercase keys for view compatibility
-                self.current_readme_data = {
-                    "id": readme["id"],
-                    "README_TITLE": readme["README_TITLE"],
-                    "README_TXT": readme["README_TXT"],
-                    "README_ID": readme["README_ID"],
-                    "DEFAULT_IND": readme["DEFAULT_IND"],
-                    "eval_type": readme["eval_type"],
-                    "score_type": readme["score_type"],
-                    "pre_eval_context": readme["pre_eval_context"]
-                }
+                self.current_readme_data = readme
                 
                 # Set default/custom based on indicators
                 if readme.get("default_ind") == "Y":
@@ -445,105 +620,397 @@ class EvaluationLibraryState(rx.State):
             self.edit_pre_eval = self.selected_pre_eval
             self.edit_default_custom = self.selected_default_custom
             self.readme_edit_mode = True
+            # Autosave compares against what is stored; cancel restores it
+            self._saved_readme_fields = self._edited_readme_fields()
+            self._readme_fields_before_edit = self._saved_readme_fields
+            self._readme_version = int(self.current_readme_data.get("version", 1))
+            self.readme_autosave_status = ""
+            self.readme_conflict_fields = []
         else:
-            # Exiting edit mode without saving - just toggle back
+            # Exiting edit mode - keep what was typed
+            self._flush_readme_autosave()
             self.readme_edit_mode = False
     
+    # ============ README autosave ============
+    
+    def _edited_readme_fields(self) -> Dict[str, str]:
+        """Column values of the README as currently edited."""
+        default = self.edit_default_custom == "default"
+        return {
+            "README_TITLE": self.edit_readme_title,
+            "README_TXT": self.edit_readme_content,
+            "EVAL_TYPE": self.edit_eval_type,
+            "SCORE_TYPE": self.edit_score_type,
+            "PRE_EVAL_CONTEXT": self.edit_pre_eval,
+            "DEFAULT_IND": "Y" if default else "N",
+            "CUSTOM_IND": "N" if default else "Y",
+        }
+    
+    def _pending_readme_changes(self) -> Dict[str, str]:
+        """Edited columns that differ from the stored README."""
+        saved = self._saved_readme_fields
+        return {
+            column: value
+            for column, value in self._edited_readme_fields().items()
+            if saved.get(column) != value
+        }
+    
+    def _set_edited_readme_fields(self, fields: Dict[str, str]):
+        """Put column values back into the edit vars (inverse of _edited_readme_fields)."""
+        self.edit_readme_title = fields["README_TITLE"]
+        self.edit_readme_content = fields["README_TXT"]
+        self.edit_eval_type = fields["EVAL_TYPE"]
+        self.edit_score_type = fields["SCORE_TYPE"]
+        self.edit_pre_eval = fields["PRE_EVAL_CONTEXT"]
+        self.edit_default_custom = "default" if fields["DEFAULT_IND"] == "Y" else "custom"
+    
+    def _merge_readme_conflict(self, conflict: CatalogEditConflict, fields: Dict[str, str]) -> Dict[str, str]:
+        """
+        Three-way merge of our fields with the row someone else saved,
+        using the last version we stored as the base. Fields only they
+        changed are taken over; fields both changed differently are listed
+        in readme_conflict_fields (keeping our value until resolved).
+        The merged values become the edit values, and the edit is rebased
+        on their version.
+        """
+        current = conflict.current
+        theirs = {
+            "README_TITLE": current["README_TITLE"],
+            "README_TXT": current["README_TXT"] or "",
+            "EVAL_TYPE": current["EVAL_TYPE"] or "",
+            "SCORE_TYPE": current["SCORE_TYPE"] or "",
+            "PRE_EVAL_CONTEXT": current["PRE_EVAL_CONTEXT"] or "",
+            "DEFAULT_IND": current["DEFAULT_IND"] or "N",
+            "CUSTOM_IND": current["CUSTOM_IND"] or "Y",
+        }
+        base = self._saved_readme_fields
+        merged = dict(fields)
+        conflicts = []
+        for column, mine in fields.items():
+            if mine == theirs[column] or theirs[column] == base.get(column):
+                continue
+            if mine == base.get(column):
+                merged[column] = theirs[column]
+            elif column in README_EDIT_FIELDS:  # CUSTOM_IND follows DEFAULT_IND
+                conflicts.append({
+                    "column": column,
+                    "label": README_EDIT_FIELDS[column],
+                    "mine": mine,
+                    "theirs": theirs[column],
+                    "choice": "mine",
+                })
+        self._saved_readme_fields = theirs
+        self._readme_version = conflict.version
+        self._set_edited_readme_fields(merged)
+        self.readme_conflict_fields = conflicts
+        return merged
+    
+    def _show_saved_readme(self, changes: Dict[str, Any] = None):
+        """Show the stored README values (e.g. after a merge took theirs)."""
+        saved = self._saved_readme_fields
+        self.selected_readme_title = saved["README_TITLE"]
+        self.selected_readme_content = saved["README_TXT"]
+        self.selected_eval_type = saved["EVAL_TYPE"]
+        self.selected_score_type = saved["SCORE_TYPE"]
+        self.selected_pre_eval = saved["PRE_EVAL_CONTEXT"]
+        self.selected_default_custom = "default" if saved["DEFAULT_IND"] == "Y" else "custom"
+        
+        # Replace just the saved entry (and any other changed ones) in the list
+        self._apply_readme_changes(changes)
+        self._refresh_current_readme()
+    
+    def _refresh_current_readme(self):
+        """Point current_readme_data at the selected README's list entry."""
+        for instruction in self.readme_instructions:
+            if instruction["id"] == self.selected_readme_id:
+                self.current_readme_data = instruction
+                break
+    
+    def _write_readme_fields(self, fields: Dict[str, str]) -> bool:
+        """
+        Write the given columns of the selected README in one compare-and-set
+        UPDATE (only the columns that changed, only if nobody saved since our
+        version) and refresh the local copy.
+        If someone else saved first, their changes are merged in and the
+        write retried; CatalogEditConflict is raised (with
+        readme_conflict_fields filled) when both changed the same field.
+        Returns False if the README no longer exists.
+        """
+        while True:
+            changes = self._readme_write(fields)
+            if not changes:
+                return True
+            try:
+                version = update_catalog_row(
+                    ReadmeInstruction, int(self.selected_readme_id), self._readme_version, changes
+                )
+            except CatalogEditConflict as conflict:
+                fields = self._merge_readme_conflict(conflict, fields)
+                if self.readme_conflict_fields:
+                    raise
+                continue
+            if version is None:
+                return False
+            self._readme_written(changes, version)
+            return True
+    
+    def _readme_write(self, fields: Dict[str, str]) -> Dict[str, str]:
+        """The columns of fields that differ from the stored README."""
+        return {
+            column: value for column, value in fields.items()
+            if self._saved_readme_fields.get(column) != value
+        }
+    
+    def _readme_written(self, changes: Dict[str, str], version: int, feed: Dict[str, Any] = None):
+        """Record a successful write of changes (now at version) and show it."""
+        self._saved_readme_fields = {**self._saved_readme_fields, **changes}
+        self._readme_version = version
+        self._show_saved_readme(feed)
+    
+    def _flush_readme_autosave(self):
+        """Save pending edits now (one UPDATE) and record the outcome in the status."""
+        if self.readme_conflict_fields or not self._pending_readme_changes():
+            return
+        try:
+            if self._write_readme_fields(self._edited_readme_fields()):
+                self.readme_autosave_status = f"Saved at {datetime.now():%H:%M:%S}"
+            else:
+                self.readme_autosave_status = "README not found in database"
+        except CatalogEditConflict:
+            self.readme_autosave_status = "Changed by someone else - review the conflicts"
+        except Exception as e:
+            print(f"Error autosaving README changes: {e}")
+            self.readme_autosave_status = "Autosave failed - use Save to retry"
+    
+    def _schedule_readme_autosave(self):
+        """Start an autosave window unless one is already open."""
+        if not self.readme_edit_mode or not self._pending_readme_changes():
+            return
+        if self.readme_conflict_fields:
+            # Nothing is saved until the conflicts are resolved
+            return
+        self.readme_autosave_status = "Unsaved changes"
+        if self._autosave_scheduled:
+            return
+        self._autosave_scheduled = True
+        return EvaluationLibraryState.autosave_readme
+    
+    @rx.event(background=True)
+    async def autosave_readme(self):
+        """
+        Save the edits made during one autosave window. Every edit in the
+        window is coalesced into a single UPDATE of the changed columns.
+        """
+        await asyncio.sleep(README_AUTOSAVE_SECONDS)
+        async with self:
+            self._autosave_scheduled = False
+            if not self.readme_edit_mode or self.readme_conflict_fields:
+                return
+            readme_id, version = self.selected_readme_id, self._readme_version
+            changes = self._readme_write(self._edited_readme_fields())
+            feed_version = self._readmes_feed_version
+        
+        while changes:
+            # The database round trip runs in a worker thread, without the
+            # state lock: the event loop and this session's events go on
+            try:
+                result = await asyncio.to_thread(
+                    _write_readme_row, int(readme_id), version, changes, feed_version
+                )
+            except Exception as e:
+                result = e
+            
+            async with self:
+                if (
+                    not self.readme_edit_mode
+                    or self.selected_readme_id != readme_id
+                    or self._readme_version != version
+                ):
+                    # A foreground save or another README took over meanwhile;
+                    # an edit it did not save yet will conflict with ours and merge
+                    return
+                changes = self._finish_readme_autosave(changes, result)
+                if not changes:
+                    # Edits typed during the write open the next window
+                    return self._schedule_readme_autosave()
+                version = self._readme_version
+                feed_version = self._readmes_feed_version
+    
+    def _finish_readme_autosave(self, changes: Dict[str, str], result) -> Dict[str, str]:
+        """
+        Record the outcome of a background autosave write of changes.
+        After someone else's save was merged in without conflicts, returns
+        the columns to write next.
+        """
+        if isinstance(result, Exception):
+            print(f"Error autosaving README changes: {result}")
+            self.readme_autosave_status = "Autosave failed - use Save to retry"
+            return {}
+        outcome, feed = result
+        if isinstance(outcome, CatalogEditConflict):
+            fields = self._merge_readme_conflict(outcome, self._edited_readme_fields())
+            if self.readme_conflict_fields:
+                self.readme_autosave_status = "Changed by someone else - review the conflicts"
+                return {}
+            retry = self._readme_write(fields)
+            if not retry:
+                # Their save already holds our edits
+                self._show_saved_readme(feed)
+                self.readme_autosave_status = f"Saved at {datetime.now():%H:%M:%S}"
+            return retry
+        if outcome is None:
+            self.readme_autosave_status = "README not found in database"
+            return {}
+        self._readme_written(changes, outcome, feed)
+        self.readme_autosave_status = f"Saved at {datetime.now():%H:%M:%S}"
+        return {}
+    
     @rx.event
     def save_readme_changes(self):
         """
         Save the edited README changes to the database.
-        This saves ALL changes including title, content, and settings.
+        Only the columns that differ from the stored README are written.
         """
+        if self.readme_conflict_fields:
+            return rx.toast.warning("Resolve the conflicting fields first")
         try:
-            with rx.session() as session:
-                # Find and update the README in the database
-                readme = session.exec(
-                    select(ReadmeInstruction).where(
-                        ReadmeInstruction.id == int(self.selected_readme_id)
-                    )
-                ).first()
-                
-                if readme:
-                    # Update ALL fields in the database
-                    readme.README_TITLE = self.edit_readme_title  # Save edited title
-                    readme.README_TXT = self.edit_readme_content  # Save edited content
-                    readme.EVAL_TYPE = self.edit_eval_type
-                    readme.SCORE_TYPE = self.edit_score_type
-                    readme.PRE_EVAL_CONTEXT = self.edit_pre_eval
-                    readme.DEFAULT_IND = "Y" if self.edit_default_custom == "default" else "N"
-                    readme.CUSTOM_IND = "N" if self.edit_default_custom == "default" else "Y"
-                    
-                    session.commit()
-                    
-                    # Update the local state to reflect saved changes
-                    self.selected_readme_title = self.edit_readme_title
-                    self.selected_readme_content = self.edit_readme_content
-                    self.selected_eval_type = self.edit_eval_type
-                    self.selected_score_type = self.edit_score_type
-                    self.selected_pre_eval = self.edit_pre_eval
-                    self.selected_default_custom = self.edit_default_custom
-                    
-                    # Update the readme_instructions list to reflect changes
-                    for i, instruction in enumerate(self.readme_instructions):
-                        if instruction["id"] == self.selected_readme_id:
-                            self.readme_instructions[i]["title"] = self.edit_readme_title
-                            self.readme_instructions[i]["content"] = self.edit_readme_content
-                            self.readme_instructions[i]["README_TITLE"] = self.edit_readme_title
-                            self.readme_instructions[i]["README_TXT"] = self.edit_readme_content
-                            self.readme_instructions[i]["eval_type"] = self.edit_eval_type
-                            self.readme_instructions[i]["score_type"] = self.edit_score_type
-                            self.readme_instructions[i]["pre_eval_context"] = self.edit_pre_eval
-                            self.readme_instructions[i]["default_ind"] = "Y" if self.edit_default_custom == "default" else "N"
-                            self.readme_instructions[i]["custom_ind"] = "N" if self.edit_default_custom == "default" else "Y"
-                            self.current_readme_data = self.readme_instructions[i]
-                            break
-                    
-                    # Exit edit mode
-                    self.readme_edit_mode = False
-                    
-                    return rx.toast.success("README saved successfully to database")
-                else:
-                    return rx.toast.error("README not found in database")
-                    
+            if not self._write_readme_fields(self._edited_readme_fields()):
+                return rx.toast.error("README not found in database")
+        except CatalogEditConflict:
+            self.readme_autosave_status = "Changed by someone else - review the conflicts"
+            return rx.toast.warning("This README was changed by someone else - review the conflicts")
         except Exception as e:
             print(f"Error saving README changes: {e}")
             return rx.toast.error(f"Failed to save changes: {str(e)}")
+        
+        # Exit edit mode
+        self.readme_edit_mode = False
+        self.readme_autosave_status = ""
+        return rx.toast.success("README saved successfully to database")
+    
+    @rx.event
+    def choose_readme_conflict_value(self, column: str, choice: str):
+        """Pick "mine" or "theirs" for one conflicting field in the merge view."""
+        fields = self._edited_readme_fields()
+        rows = []
+        for row in self.readme_conflict_fields:
+            if row["column"] == column:
+                row = {**row, "choice": choice}
+                fields[column] = row[choice]
+            rows.append(row)
+        self.readme_conflict_fields = rows
+        self._set_edited_readme_fields(fields)
+    
+    @rx.event
+    def apply_readme_merge(self):
+        """Save the merged README (the chosen value for each conflicting field)."""
+        self.readme_conflict_fields = []
+        self._flush_readme_autosave()
+        if self.readme_conflict_fields:
+            return rx.toast.warning("This README changed again - review the conflicts")
+        return rx.toast.success("Merged changes saved")
     
     @rx.event
     def set_edit_eval_type(self, value: str):
         """Set the evaluation type during editing."""
         self.edit_eval_type = value
+        return self._schedule_readme_autosave()
     
     @rx.event
     def set_edit_score_type(self, value: str):
         """Set the score type during editing."""
         self.edit_score_type = value
+        return self._schedule_readme_autosave()
     
     @rx.event
     def set_edit_pre_eval(self, value: str):
         """Set the pre-eval context during editing."""
         self.edit_pre_eval = value
+        return self._schedule_readme_autosave()
     
     @rx.event
     def set_edit_default_custom(self, value: str):
         """Set default/custom radio during editing."""
         self.edit_default_custom = value
+        return self._schedule_readme_autosave()
     
+    @rx.event
+    def set_edit_readme_title(self, value: str):
+        """Set the readme title during editing (debounced on the client)."""
+        self.edit_readme_title = value
+        return self._schedule_readme_autosave()
         
     @rx.event
     def set_edit_readme_content(self, value: str):
-        """Set the readme content during editing."""
+        """Set the readme content during editing (debounced on the client)."""
         self.edit_readme_content = value
+        return self._schedule_readme_autosave()
     
     @rx.event
     def delete_readme(self):
-        """Delete the currently selected README instruction."""
+        """
+        Archive the currently selected README instruction.
+        It leaves the library but stays in the database and can be restored.
+        """
         if not self.selected_readme_id:
             return rx.toast.error("No README selected")
         
-        # Implement deletion logic if needed
-        return rx.toast.info("Delete functionality not yet implemented")
+        try:
+            title = archive_readme(int(self.selected_readme_id))
+        except Exception as e:
+            print(f"Error archiving README: {e}")
+            return rx.toast.error(f"Failed to archive README: {str(e)}")
+        if title is None:
+            return rx.toast.error("README not found in database")
+        
+        # The change feed reports the archived row as a delete; the first
+        # remaining README gets selected
+        self.load_readme_instructions()
+        if not self.readme_instructions:
+            self.selected_readme_id = ""
+            self.selected_readme_title = ""
+            self.selected_readme_content = ""
+            self.current_readme_data = {}
+            self.readme_edit_mode = False
+        if self.show_archived_readmes:
+            self._load_archived_readmes()
+        return rx.toast.success(f"Archived README '{title}'")
+    
+    def _load_archived_readmes(self):
+        self.archived_readmes = [
+            {"id": str(readme.id), "title": readme.README_TITLE or ""}
+            for readme in get_archived_readmes()
+        ]
+    
+    @rx.event
+    def toggle_archived_readmes(self):
+        """Show or hide the archived READMEs (loaded when shown)."""
+        self.show_archived_readmes = not self.show_archived_readmes
+        if not self.show_archived_readmes:
+            return
+        try:
+            self._load_archived_readmes()
+        except Exception as e:
+            print(f"Error loading archived READMEs: {e}")
+            self.archived_readmes = []
+            return rx.toast.error("Failed to load archived READMEs")
+    
+    @rx.event
+    def restore_archived_readme(self, readme_id: str):
+        """Restore an archived README to the library and select it."""
+        try:
+            title = restore_readme(int(readme_id))
+        except Exception as e:
+            print(f"Error restoring README: {e}")
+            return rx.toast.error(f"Failed to restore README: {str(e)}")
+        if title is None:
+            return rx.toast.error("README not found in database")
+        
+        # The change feed reports the restored row as an upsert
+        self._load_archived_readmes()
+        self.load_readme_instructions()
+        self.select_readme(readme_id)
+        return rx.toast.success(f"Restored README '{title}'")
     
     @rx.event
     def edit_readme(self):
@@ -554,43 +1021,77 @@ class EvaluationLibraryState(rx.State):
     @rx.event
     def load_all_metrics(self):
         """
-        Load all metrics from the database.
+        Load all metrics from the shared catalog cache.
+        Once loaded, only the changes since the last load are applied.
         """
         try:
-            with rx.session() as session:
-                metrics = session.exec(select(Metric)).all()
-                
-                self.all_metrics = [
-                    {
-                        "id": str(metric.id),
-                        "name": metric.METRIC_NAME,
-                        "type": metric.METRIC_TYPE,
-                        "definition": metric.METRIC_DEF or "",
-                        "notes": metric.METRIC_NOTES or ""
-                    }
-                    for metric in metrics
-                ]
-                self.filtered_metrics = self.all_metrics
-                
+            if not self._all_metrics:
+                self._metrics_feed_version = get_catalog_feed_version(METRIC_CATALOG)
+                self._all_metrics = get_metric_catalog()
+            else:
+                changes = get_catalog_changes(METRIC_CATALOG, self._metrics_feed_version)
+                if changes["version"] == self._metrics_feed_version:
+                    return
+                self._all_metrics = (
+                    get_metric_catalog() if changes["reload"]
+                    else apply_catalog_changes(self.get_value("_all_metrics"), changes)
+                )
+                self._metrics_feed_version = changes["version"]
+            
         except Exception as e:
             print(f"Error loading metrics: {e}")
             self.metrics_error = "Failed to load metrics"
-            self.all_metrics = []
-            self.filtered_metrics = []
+            self._all_metrics = []
+    
+    @rx.var
+    def visible_metrics(self) -> list[Dict[str, str]]:
+        """The metrics on screen: the first metric_window_size of the catalog or search results."""
+        metrics = self._metric_search_results if self.metric_search_term.strip() else self._all_metrics
+        return metrics[:self.metric_window_size]
+    
+    @rx.var
+    def metric_total(self) -> int:
+        """Metrics in the catalog, or search results loaded so far."""
+        return len(self._metric_search_results if self.metric_search_term.strip() else self._all_metrics)
+    
+    @rx.var
+    def metrics_has_more(self) -> bool:
+        """Whether "load more" would show more metrics."""
+        return self.metric_total > self.metric_window_size or (
+            bool(self.metric_search_term.strip()) and self.metric_search_has_more
+        )
     
     @rx.event
     def search_metrics(self, search_term: str):
-        """Filter metrics based on search term."""
+        """Full-text search metrics; shows the first page of ranked results."""
         self.metric_search_term = search_term
-        if not search_term:
-            self.filtered_metrics = self.all_metrics
-        else:
-            search_lower = search_term.lower()
-            self.filtered_metrics = [
-                m for m in self.all_metrics
-                if search_lower in m["name"].lower() or
-                   search_lower in m.get("definition", "").lower()
-            ]
+        if self.metric_window_size != METRIC_WINDOW_SIZE:
+            self.metric_window_size = METRIC_WINDOW_SIZE
+        if not search_term.strip():
+            self._metric_search_results = []
+            self.metric_search_has_more = False
+            return
+        # Fetch one extra row to know whether another page exists
+        results = search_metric_catalog(search_term, limit=SEARCH_PAGE_SIZE + 1, active_only=True)
+        self.metric_search_has_more = len(results) > SEARCH_PAGE_SIZE
+        self._metric_search_results = results[:SEARCH_PAGE_SIZE]
+    
+    @rx.event
+    def load_more_metric_results(self):
+        """Show the next METRIC_WINDOW_SIZE metrics, fetching search results as needed."""
+        window = self.metric_window_size + METRIC_WINDOW_SIZE
+        searching = bool(self.metric_search_term.strip())
+        while searching and self.metric_search_has_more and len(self._metric_search_results) < window:
+            results = search_metric_catalog(
+                self.metric_search_term,
+                limit=SEARCH_PAGE_SIZE + 1,
+                offset=len(self._metric_search_results),
+                active_only=True,
+            )
+            self.metric_search_has_more = len(results) > SEARCH_PAGE_SIZE
+            self._metric_search_results = self._metric_search_results + results[:SEARCH_PAGE_SIZE]
+        if self.metric_total > self.metric_window_size:
+            self.metric_window_size = window
     
     # Methods actually called by views
     @rx.event
@@ -600,7 +1101,7 @@ class EvaluationLibraryState(rx.State):
         # Load data for the selected section if needed
         if section == "readme" and not self.readme_instructions:
             self.load_readme_instructions()
-        elif section == "metrics" and not self.all_metrics:
+        elif section == "metrics" and not self._all_metrics:
             self.load_all_metrics()
     
     # Placeholder methods for sections not yet implemented
@@ -653,12 +1154,23 @@ class FilePrepState(rx.State):
     }
     
     # Step 2: Metrics Selection (stores IDs only)
-    selected_metric_ids: list[str] = []  # Just the IDs of selected metrics
-    selected_metrics: list[str] = []  # Compatibility alias for views
+    selected_metric_ids: list[str] = []  # IDs of selected metrics (sorted copy of _selected_metric_ids)
+    selected_metrics: list[str] = []  # Names of selected custom metrics (compatibility alias for views)
+    selected_metric_count: int = 0  # Selected metrics of both kinds
+    _selected_metric_ids: set[str] = set()
     custom_metrics: list[Dict[str, str]] = []  # User-defined metrics not in DB
     metric_search: str = ""  # For filtering metrics (renamed for view compatibility)
     metric_search_term: str = ""  # Keep both names for now
+    metric_search_results: list[Dict[str, str]] = []  # Ranked full-text matches for metric_search
+    metric_search_has_more: bool = False
+    metric_window: list[Dict[str, str]] = []  # Rendered rows of the virtualized metric list
+    metric_window_start: int = 0  # Position of metric_window[0] in the filtered list
+    metric_list_total: int = 0  # Active metrics matching the facet filters
+    _metric_search_offset: int = 0  # Search results consumed (before facet filtering)
+    metric_filters: dict[str, list[str]] = {}  # Facet -> selected values (see METRIC_FILTER_FACETS)
+    metric_filter_options: list[Dict[str, str]] = []  # Filter chips with counts
     custom_metric_input: str = ""  # For custom metric input field
+    custom_metric_suggestions: list[str] = []  # Matching metric names for the input's datalist
     
     # Step 3: File Configuration
     num_models: int = 1  # Number of LLMs/tools to compare
@@ -682,6 +1194,8 @@ class FilePrepState(rx.State):
     # Cache for dropdown options (loaded from database)
     _available_readme_options: list[Dict[str, str]] = []
     _available_metric_options: list[Dict[str, str]] = []
+    _readme_options_version: int = -1
+    _metric_options_version: int = -1
     
     # ============ Step Navigation ============
     
@@ -707,51 +1221,23 @@ class FilePrepState(rx.State):
     
     @rx.event
     def load_available_options(self):
-        """Load available READMEs and Metrics from database for dropdowns."""
-        with rx.session() as session:
-            # Load README options
-            readmes = session.exec(
-                select(ReadmeInstruction).where(
-                    ReadmeInstruction.STATUS_IND == "Active"
-                )
-            ).all()
-            self._available_readme_options = [
-                {
-                    "id": str(readme.id),
-                    "title": readme.README_TITLE,
-                    "type": readme.EVAL_TYPE or "GENERAL"
-                }
-                for readme in readmes
-            ]
-            
-            # Load Metric options
-            metrics = session.exec(
-                select(Metric).where(
-                    Metric.STATUS_IND == "Active"
-                )
-            ).all()
-            self._available_metric_options = [
-                {
-                    "id": str(metric.id),
-                    "name": metric.METRIC_NAME,
-                    "type": metric.METRIC_TYPE,
-                    "definition": metric.METRIC_DEF
-                }
-                for metric in metrics
-            ]
+        """Load available READMEs and Metrics for dropdowns from the shared catalog cache."""
+        readme_version = catalog_version(README_CATALOG)
+        if self._readme_options_version != readme_version:
+            self._available_readme_options = get_readme_options()
+            self._readme_options_version = readme_version
+        
+        metric_version = catalog_version(METRIC_CATALOG)
+        if self._metric_options_version != metric_version:
+            self._available_metric_options = get_metric_options()
+            self._metric_options_version = metric_version
     
     @rx.event
     def get_filtered_metrics(self, search_term: str = "") -> list[Dict[str, str]]:
-        """Get filtered list of metrics based on search term."""
-        if not search_term:
+        """Get Active metrics matching search term, best matches first."""
+        if not search_term.strip():
             return self._available_metric_options
-        
-        search_lower = search_term.lower()
-        return [
-            m for m in self._available_metric_options
-            if search_lower in m["name"].lower() or 
-               search_lower in m.get("definition", "").lower()
-        ]
+        return search_metric_catalog(search_term, active_only=True)
     
     # ============ Step 1: README Configuration ============
     
@@ -820,42 +1306,76 @@ class FilePrepState(rx.State):
     
     # ============ Step 2: Metrics Selection ============
     
+    def _set_metric_selection(self, ids: set[str] = None, names: list[str] = None):
+        """
+        Replace the selection. The backend set is the source of truth; the
+        view gets each changed list once, so any bulk operation is a single
+        state delta.
+        """
+        if ids is not None:
+            self._selected_metric_ids = ids
+            self.selected_metric_ids = sorted(ids, key=int)
+        if names is not None:
+            self.selected_metrics = names
+        self.selected_metric_count = len(self._selected_metric_ids) + len(self.selected_metrics)
+    
+    def _facet_metric_ids(self, filters: Dict[str, Any]) -> set[str]:
+        return {str(metric_id) for metric_id in get_metric_facet_index().ids_for(filters).tolist()}
+    
     @rx.event
     def toggle_metric(self, metric_name_or_id: str):
         """Toggle selection of a metric - can work with both names and IDs."""
         # Check if it's an ID (numeric) or a name
         if metric_name_or_id.isdigit():
-            # It's an ID
-            if metric_name_or_id in self.selected_metric_ids:
-                self.selected_metric_ids.remove(metric_name_or_id)
-            else:
-                self.selected_metric_ids.append(metric_name_or_id)
+            self._set_metric_selection(ids=self._selected_metric_ids ^ {metric_name_or_id})
         else:
-            # It's a name - for compatibility with views
-            if metric_name_or_id in self.selected_metrics:
-                self.selected_metrics.remove(metric_name_or_id)
-            else:
-                self.selected_metrics.append(metric_name_or_id)
+            # It's a name (custom metric) - for compatibility with views
+            names = self.get_value("selected_metrics")
+            self._set_metric_selection(
+                names=[n for n in names if n != metric_name_or_id]
+                if metric_name_or_id in names else names + [metric_name_or_id]
+            )
+    
+    @rx.event
+    def select_metrics_by_facet(self, facet: str, value: str):
+        """Add every Active metric with the given facet value (e.g. metric_type=EVERGREEN)."""
+        self._set_metric_selection(
+            ids=self._selected_metric_ids | self._facet_metric_ids({facet: value, "status": ACTIVE_STATUS})
+        )
     
     @rx.event
     def select_all_evergreen_metrics(self):
         """Select all evergreen metrics."""
-        with rx.session() as session:
-            evergreen = session.exec(
-                select(Metric).where(
-                    Metric.METRIC_TYPE == "EVERGREEN",
-                    Metric.STATUS_IND == "Active"
-                )
-            ).all()
-            for metric in evergreen:
-                metric_id = str(metric.id)
-                if metric_id not in self.selected_metric_ids:
-                    self.selected_metric_ids.append(metric_id)
+        self.select_metrics_by_facet("metric_type", "EVERGREEN")
+    
+    @rx.event
+    def select_all_shown_metrics(self):
+        """Select every metric matching the current search (all pages) and facet filters."""
+        if not self.metric_search.strip():
+            shown = self._facet_metric_ids(self._metric_filters())
+        else:
+            ids = search_metric_ids(self.metric_search, active_only=True)
+            keep = get_metric_facet_index().matches(self._metric_filters(), ids)
+            shown = {str(metric_id) for metric_id, matched in zip(ids, keep) if matched}
+        self._set_metric_selection(ids=self._selected_metric_ids | shown)
+    
+    @rx.event
+    def invert_metric_selection(self):
+        """Invert the selection within the metrics matching the current facet filters."""
+        scope = self._facet_metric_ids(self._metric_filters())
+        self._set_metric_selection(ids=self._selected_metric_ids ^ scope)
+    
+    @rx.event
+    def clear_metrics_by_type(self, metric_type: str):
+        """Deselect every metric of one METRIC_TYPE."""
+        self._set_metric_selection(
+            ids=self._selected_metric_ids - self._facet_metric_ids({"metric_type": metric_type})
+        )
     
     @rx.event
     def clear_all_metrics(self):
         """Clear all selected metrics."""
-        self.selected_metric_ids = []
+        self._set_metric_selection(ids=set())
     
     @rx.event
     def add_custom_metric(self, name: str = None, definition: str = ""):
@@ -871,9 +1391,10 @@ class FilePrepState(rx.State):
                 "type": "CUSTOM"
             })
             # Also add to selected metrics
-            self.selected_metrics.append(metric_name.strip())
+            self._set_metric_selection(names=self.get_value("selected_metrics") + [metric_name.strip()])
             # Clear the input field
             self.custom_metric_input = ""
+            self.custom_metric_suggestions = []
     
     @rx.event
     def remove_custom_metric(self, metric_id: str):
@@ -883,16 +1404,128 @@ class FilePrepState(rx.State):
             if m["id"] != metric_id
         ]
     
+    def _metric_filters(self) -> Dict[str, Any]:
+        """Facet filters of the metric picker (always Active metrics only)."""
+        return {**self.get_value("metric_filters"), "status": ACTIVE_STATUS}
+    
+    def _load_metric_window(self, start: int = 0, limit: int = None):
+        """Replace the rendered rows of the metric list with the window at `start`."""
+        if limit is None:
+            limit = METRIC_LIST_HEIGHT_PX // METRIC_ROW_HEIGHT_PX + VIRTUAL_LIST_OVERSCAN_ROWS
+        metrics, total = get_metrics_window(self._metric_filters(), start, limit)
+        self.metric_window = [metric_catalog_row(metric) for metric in metrics]
+        self.metric_window_start = start
+        self.metric_list_total = total
+    
+    def _refresh_metric_filter_options(self):
+        """Recount the facet chips under the current filters."""
+        counts = get_metric_facet_index().facet_counts(self._metric_filters(), list(METRIC_FILTER_FACETS))
+        selected = self.get_value("metric_filters")
+        self.metric_filter_options = [
+            {
+                "facet": facet,
+                "value": option["value"],
+                "label": f"{label}: {option['value']}",
+                "count": str(option["count"]),
+                "selected": "Y" if option["value"] in selected.get(facet, []) else "N",
+            }
+            for facet, label in METRIC_FILTER_FACETS.items()
+            for option in counts[facet]
+        ]
+    
+    def _search_metric_page(self, offset: int = 0) -> list[Dict[str, str]]:
+        """Next page of ranked search results, narrowed by the facet filters."""
+        # The filters go into the search query, so every page is full
+        ids = (
+            get_metric_facet_index().ids_for(self._metric_filters()).tolist()
+            if any(self.metric_filters.values()) else None
+        )
+        # Fetch one extra row to know whether another page exists
+        results = search_metric_catalog(
+            self.metric_search, limit=SEARCH_PAGE_SIZE + 1, offset=offset, active_only=True, ids=ids
+        )
+        self.metric_search_has_more = len(results) > SEARCH_PAGE_SIZE
+        results = results[:SEARCH_PAGE_SIZE]
+        self._metric_search_offset = offset + len(results)
+        return results
+    
+    @rx.event
+    def load_metric_list(self):
+        """Load the first window of Active metrics (and the filter chips) for the metric list."""
+        self._load_metric_window()
+        self._refresh_metric_filter_options()
+    
+    @rx.event
+    def scroll_metric_list(self, scroll_top: float, viewport_height: float):
+        """Fetch the rows around the visible part of the metric list once it nears the window edge."""
+        window = window_for_scroll(
+            scroll_top,
+            viewport_height,
+            METRIC_ROW_HEIGHT_PX,
+            self.metric_window_start,
+            len(self.metric_window),
+            self.metric_list_total,
+        )
+        if window is not None:
+            self._load_metric_window(*window)
+    
+    @rx.event
+    def load_more_metrics(self, remaining: float = 0):
+        """Append the next page of search results when they are scrolled near their end."""
+        if remaining > LOAD_MORE_THRESHOLD_PX:
+            return
+        if self.metric_search.strip() and self.metric_search_has_more:
+            self.metric_search_results = self.metric_search_results + self._search_metric_page(
+                self._metric_search_offset
+            )
+    
+    @rx.event
+    def toggle_metric_filter(self, facet: str, value: str):
+        """Add or remove a facet value filter and reload the metric list."""
+        values = list(self.metric_filters.get(facet, []))
+        if value in values:
+            values.remove(value)
+        else:
+            values.append(value)
+        self.metric_filters = {**self.metric_filters, facet: values}
+        self.load_metric_list()
+        if self.metric_search.strip():
+            self.metric_search_results = self._search_metric_page()
+        return scroll_to_top(METRIC_LIST_ID)
+    
+    @rx.event
+    def clear_metric_filters(self):
+        """Remove all facet filters."""
+        self.metric_filters = {}
+        self.load_metric_list()
+        if self.metric_search.strip():
+            self.metric_search_results = self._search_metric_page()
+        return scroll_to_top(METRIC_LIST_ID)
+    
     @rx.event
     def set_metric_search(self, term: str):
-        """Set the metric search term."""
+        """Set the metric search term and refresh the search results."""
         self.metric_search = term
         self.metric_search_term = term
+        if term.strip():
+            self.metric_search_results = self._search_metric_page()
+        else:
+            self.metric_search_results = []
+            self.metric_search_has_more = False
+            # The list is mounted again scrolled to the top
+            self._load_metric_window()
     
     @rx.event
     def set_custom_metric_input(self, value: str):
-        """Set the custom metric input field."""
+        """Set the custom metric input field and suggest matching metric names."""
         self.custom_metric_input = value
+        if len(value.strip()) < 2:
+            self.custom_metric_suggestions = []
+            return
+        self.custom_metric_suggestions = [
+            metric["name"]
+            for metric in search_metric_catalog(value, limit=CUSTOM_METRIC_SUGGESTIONS, active_only=True)
+        ]
     
     # ============ Step 3: File Upload ============
     
@@ -985,57 +1618,51 @@ class FilePrepState(rx.State):
         self.error_message = ""
         
         try:
-            with rx.session() as session:
+            async with rx.asession() as session:
                 # Get selected README content
-                readme_content = None
+                readme = None
                 if self.include_readme and self.selected_readme_template:
-                    readme = session.exec(
+                    readme = (await session.exec(
                         select(ReadmeInstruction).where(
                             ReadmeInstruction.id == int(self.selected_readme_template)
                         )
-                    ).first()
-                    if readme:
-                        readme_content = {
-                            "title": readme.README_TITLE,
-                            "text": readme.README_TXT,
-                            "eval_type": readme.EVAL_TYPE,
-                            "score_type": readme.SCORE_TYPE
-                        }
+                    )).first()
                 
                 # Get selected metrics content
-                selected_metrics = []
+                metrics = []
                 if self.selected_metric_ids:
-                    metrics = session.exec(
+                    metrics = (await session.exec(
                         select(Metric).where(
                             Metric.id.in_([int(id) for id in self.selected_metric_ids])
                         )
-                    ).all()
-                    selected_metrics = [
-                        {
-                            "name": m.METRIC_NAME,
-                            "type": m.METRIC_TYPE,
-                            "definition": m.METRIC_DEF,
-                            "notes": m.METRIC_NOTES
-                        }
-                        for m in metrics
-                    ]
-                
-                # Add custom metrics
-                selected_metrics.extend(self.custom_metrics)
-                
-                # TODO: Actual Excel generation logic here
-                # This would create the workbook with:
-                # - README tab (if included)
-                # - Part 1 evaluation sheets (one per model)
-                # - Part 2 Data Analysis (if included)
-                # - Part 3 Criteria Assessment (if included)
-                # Using the pulled content from database
-                
-                # For now, simulate success
-                self.generation_status = "complete"
-                self.download_url = f"/_upload/{self.excel_filename}.xlsx"
-                
-                return rx.toast.success("Excel template generated successfully!")
+                    )).all()
+            
+            # Custom metrics are not in the database; the builder reads the same fields
+            custom_metrics = [
+                SimpleNamespace(METRIC_NAME=m["name"], METRIC_DEF=m["definition"], METRIC_NOTES="")
+                for m in self.custom_metrics
+            ]
+            # Automated pre-eval hints: one uploaded segment file per model (A, B, ...)
+            paths = [f["path"] for f in self.uploaded_files[:self.num_models]]
+            pre_eval_hints = await asyncio.to_thread(compute_pre_eval_hints, paths)
+            
+            export = SimpleNamespace(
+                selected_readme=readme,
+                evergreen_metrics_db=[m for m in metrics if m.METRIC_TYPE == "EVERGREEN"],
+                custom_metrics_db=[m for m in metrics if m.METRIC_TYPE != "EVERGREEN"] + custom_metrics,
+                num_models=self.num_models,
+                pre_eval_hints=pre_eval_hints,
+            )
+            workbook = await asyncio.to_thread(DynamicExcelBuilder(export).build)
+            
+            upload_dir = rx.get_upload_dir()
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            (upload_dir / f"{self.excel_filename}.xlsx").write_bytes(workbook)
+            
+            self.generation_status = "complete"
+            self.download_url = f"/_upload/{self.excel_filename}.xlsx"
+            
+            return rx.toast.success("Excel template generated successfully!")
                 
         except Exception as e:
             self.generation_status = "error"
@@ -1050,12 +1677,15 @@ class FilePrepState(rx.State):
         self.current_file_prep_step = 1
         self.selected_readme_template = ""
         self.custom_readme_sections = []
-        self.selected_metric_ids = []
-        self.selected_metrics = []
+        self._set_metric_selection(ids=set(), names=[])
         self.custom_metrics = []
         self.metric_search = ""
         self.metric_search_term = ""
+        self.metric_search_results = []
+        self.metric_search_has_more = False
+        self.metric_filters = {}
         self.custom_metric_input = ""
+        self.custom_metric_suggestions = []
         self.uploaded_files = []
         self.file_upload_complete = False
         self.num_models = 1
@@ -1069,12 +1699,15 @@ class FilePrepState(rx.State):
     def reset_to_step(self, step: int):
         """Reset all data after a specific step."""
         if step < 2:
-            self.selected_metric_ids = []
-            self.selected_metrics = []
+            self._set_metric_selection(ids=set(), names=[])
             self.custom_metrics = []
             self.metric_search = ""
             self.metric_search_term = ""
+            self.metric_search_results = []
+            self.metric_search_has_more = False
+            self.metric_filters = {}
             self.custom_metric_input = ""
+            self.custom_metric_suggestions = []
         if step < 3:
             self.uploaded_files = []
             self.file_upload_complete = False
@@ -1085,4 +1718,116 @@ class FilePrepState(rx.State):
             self.download_url = ""
             self.error_message = ""
         
-        self.current_file_prep_step = step
\ No newline at end of file
+        self.current_file_prep_step = step
+
+def _format_bytes(size: int) -> str:
+    """Human-readable size, e.g. 1.5 MB."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class DatabaseAdminState(rx.State):
+    """
+    State for the database admin view: storage statistics and on-demand
+    maintenance (the same pass the scheduled maintenance task runs).
+    """
+    # Database totals (formatted for display)
+    storage_summary: Dict[str, str] = {}
+    # Per table: name, rows, size, index_size, indexes, share (of the file)
+    storage_tables: list[Dict[str, str]] = []
+    # Per index: table, name, size
+    storage_indexes: list[Dict[str, str]] = []
+    storage_error: str = ""
+    
+    maintenance_running: bool = False
+    last_maintenance: str = ""
+    # Score cache hits since the app started (pre-eval hints)
+    score_cache_summary: str = ""
+    
+    def _show_last_maintenance(self, result: Dict[str, Any]):
+        if not result:
+            self.last_maintenance = "Not run since the app started"
+            return
+        self.last_maintenance = (
+            f"{result['started_at']} - pruned {result.get('pruned_changes', 0)} change "
+            f"entries, freed {result.get('freed_pages', 0)} pages in {result['duration_ms']} ms"
+        )
+    
+    def _show_score_cache_stats(self):
+        stats = get_score_cache_stats()
+        if not stats["total"]:
+            self.score_cache_summary = "No lookups since the app started"
+            return
+        self.score_cache_summary = (
+            f"{stats['hits']:,} of {stats['total']:,} scores reused "
+            f"({stats['hit_rate']:.1%}) since the app started"
+        )
+    
+    @rx.event
+    def load_storage_stats(self):
+        """Load row counts, page usage and index sizes per table."""
+        self._show_score_cache_stats()
+        try:
+            stats = get_storage_stats()
+        except Exception as e:
+            print(f"Error loading storage statistics: {e}")
+            self.storage_error = f"Failed to load storage statistics: {str(e)}"
+            return
+        if not stats:
+            self.storage_error = "Storage statistics are only available for SQLite"
+            return
+        self.storage_error = ""
+        database = stats["database"]
+        file_bytes = database["file_bytes"] or 1
+        self.storage_summary = {
+            "file_size": _format_bytes(database["file_bytes"]),
+            "free_size": _format_bytes(database["free_bytes"]),
+            "wal_size": _format_bytes(database["wal_bytes"]),
+            "pages": f"{database['page_count']:,} x {_format_bytes(database['page_size'])}",
+            "journal_mode": str(database["journal_mode"]).upper(),
+            "auto_vacuum": {0: "None", 1: "Full", 2: "Incremental"}.get(database["auto_vacuum"], ""),
+        }
+        self.storage_tables = [
+            {
+                "name": table["name"],
+                "rows": f"{table['rows']:,}",
+                "size": _format_bytes(table["bytes"]),
+                "index_size": _format_bytes(table["index_bytes"]),
+                "indexes": str(len(table["indexes"])),
+                "share": f"{(table['bytes'] + table['index_bytes']) / file_bytes:.1%}",
+            }
+            for table in stats["tables"]
+        ]
+        indexes = [
+            (table["name"], index) for table in stats["tables"] for index in table["indexes"]
+        ]
+        self.storage_indexes = [
+            {"table": table, "name": index["name"], "size": _format_bytes(index["bytes"])}
+            for table, index in sorted(indexes, key=lambda pair: pair[1]["bytes"], reverse=True)
+        ]
+        self._show_last_maintenance(stats["last_maintenance"])
+    
+    @rx.event(background=True)
+    async def run_maintenance(self):
+        """Run a maintenance pass now (change feed pruning, ANALYZE, incremental vacuum, WAL checkpoint)."""
+        async with self:
+            if self.maintenance_running:
+                return
+            self.maintenance_running = True
+        try:
+            result = await asyncio.to_thread(run_database_maintenance)
+        except Exception as e:
+            print(f"Error running database maintenance: {e}")
+            async with self:
+                self.maintenance_running = False
+            yield rx.toast.error(f"Maintenance failed: {str(e)}")
+            return
+        async with self:
+            self.maintenance_running = False
+            self.load_storage_stats()
+        if not result:
+            yield rx.toast.info("Maintenance is already running")
+        else:
+            yield rx.toast.success(f"Maintenance done in {result['duration_ms']} ms")
@@ -0,0 +1,436 @@
+# ltx_automation_app/utils/catalog_importer.py
+"""
+Import the metric and README catalogs from the source workbooks.
+
+Workbooks are streamed with openpyxl in read-only mode, so memory stays
+flat for large sheets. The header row is matched against the model
+columns (the sheets use the same column names as the models; spaces and
+case are ignored), unknown columns are reported and skipped.
+
+Rows are upserted on the catalog key (METRIC_NAME / README_TITLE): existing
+rows are updated and new rows inserted with one executemany each, all in a
+single transaction, so a failed import leaves the catalog untouched.
+
+--sync imports incrementally: the file is skipped when its content hash
+matches the last sync, otherwise each row's content hash (SOURCE_HASH) is
+compared with the stored one and only new, changed and removed rows are
+written. Unchanged rows keep their MODIFIED_DT. Rows that disappeared from
+the workbook are soft-deleted (STATUS_IND "Retired"); rows created in the
+app (no SOURCE_HASH) are never touched.
+
+Usage:
+    python -m ltx_automation_app.utils.catalog_importer
+    python -m ltx_automation_app.utils.catalog_importer --metrics "METRICS_DB.xlsm" --readmes "README DB.xlsm"
+    python -m ltx_automation_app.utils.catalog_importer --metrics big.xlsx --sheet Metrics \
+        --database-url sqlite:///data/ltx_automation.db
+    python -m ltx_automation_app.utils.catalog_importer --sync
+"""
+
+import argparse
+import hashlib
+import logging
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import reflex as rx  # Must come before sqlmodel (Reflex patches pydantic on import)
+import sqlalchemy
+from openpyxl import load_workbook
+from reflex import model as rx_model
+from sqlmodel import Session, select
+
+from ltx_automation_app.database.models import (
+    ACTIVE_STATUS,
+    RETIRED_STATUS,
+    CatalogSource,
+    Metric,
+    ReadmeInstruction,
+)
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Catalog name -> model, upsert key and default source workbook
+CATALOG_SOURCES: Dict[str, Dict[str, Any]] = {
+    "metric": {
+        "model": Metric,
+        "key": "METRIC_NAME",
+        "workbook": REPO_ROOT / "METRICS_DB.xlsm",
+    },
+    "readme": {
+        "model": ReadmeInstruction,
+        "key": "README_TITLE",
+        "workbook": REPO_ROOT / "README DB.xlsm",
+    },
+}
+
+# Columns managed by the database, never taken from a workbook
+_MANAGED_COLUMNS = {"id", "CREATE_DT", "MODIFIED_DT", "SOURCE_HASH", "VERSION"}
+
+IMPORT_BATCH_SIZE = 5000
+
+# Workbook STATUS_IND spellings -> stored status (the partial indexes match "Active" exactly)
+_STATUS_VALUES = {status.upper(): status for status in (ACTIVE_STATUS, RETIRED_STATUS)}
+
+
+# ============ Reading ============
+
+def _normalize_header(value: Any) -> str:
+    return str(value).strip().upper().replace(" ", "_") if value is not None else ""
+
+
+def _cell_value(value: Any) -> Optional[str]:
+    """Workbook cell -> column text (all catalog columns are strings)."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def map_header(header_row, model) -> Dict[int, str]:
+    """
+    Map workbook column positions to model column names.
+    Unknown and database-managed columns are left out.
+    """
+    columns = {column.name for column in model.__table__.columns} - _MANAGED_COLUMNS
+    mapping = {}
+    for position, value in enumerate(header_row):
+        name = _normalize_header(value)
+        if name in columns:
+            mapping[position] = name
+        elif name:
+            logger.warning(f"Ignoring unknown column '{value}' for {model.__tablename__}")
+    return mapping
+
+
+def read_workbook_rows(path: Path, model, sheet: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a workbook sheet as dicts keyed by model column name.
+    The first non-empty row is the header; fully empty rows are skipped.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        mapping: Dict[int, str] = {}
+        for header_row in rows:
+            if any(value is not None for value in header_row):
+                mapping = map_header(header_row, model)
+                break
+        if not mapping:
+            raise ValueError(f"No {model.__tablename__} columns found in {path}")
+
+        for row in rows:
+            record = {
+                column: _cell_value(row[position]) if position < len(row) else None
+                for position, column in mapping.items()
+            }
+            if any(value is not None for value in record.values()):
+                yield record
+    finally:
+        workbook.close()
+
+
+# ============ Hashing ============
+
+def file_content_hash(path: Path) -> str:
+    """sha256 of the workbook bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def row_content_hash(row: Dict[str, Any]) -> str:
+    """
+    sha256 over a row's column names and values. Fields are length-prefixed
+    so values containing separators cannot collide.
+    """
+    digest = hashlib.sha256()
+    for column in sorted(row):
+        value = "" if row[column] is None else str(row[column])
+        for part in (column, value):
+            encoded = part.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+    return digest.hexdigest()
+
+
+# ============ Upsert ============
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _collect_rows(records: Iterator[Dict[str, Any]], key: str):
+    """
+    Dedupe records by key (later rows win) and give every row the same
+    columns, as executemany requires. Each row gets its SOURCE_HASH.
+    STATUS_IND spellings are normalized ("ACTIVE" -> "Active").
+
+    Returns:
+        (rows by key, rows read, rows skipped for a missing key)
+    """
+    by_key: Dict[str, Dict[str, Any]] = {}
+    read = skipped = 0
+    for record in records:
+        read += 1
+        if not record.get(key):
+            skipped += 1
+            continue
+        if record.get("STATUS_IND"):
+            record["STATUS_IND"] = _STATUS_VALUES.get(record["STATUS_IND"].upper(), record["STATUS_IND"])
+        by_key[record[key]] = record
+
+    columns = sorted({column for record in by_key.values() for column in record})
+    rows = {}
+    for key_value, record in by_key.items():
+        row = {column: record.get(column) for column in columns}
+        row["SOURCE_HASH"] = row_content_hash(row)
+        rows[key_value] = row
+    return rows, read, skipped
+
+
+def _write_rows(session: Session, table, inserts, updates, batch_size: int):
+    """Run the updates (rows carry b_id) and inserts as batched executemany."""
+    if updates:
+        # SET columns come from the parameter keys; b_id binds the WHERE.
+        # VERSION is bumped so in-app editors holding the old row see a conflict
+        statement = (
+            sqlalchemy.update(table)
+            .where(table.c.id == sqlalchemy.bindparam("b_id"))
+            .values(VERSION=table.c.VERSION + 1)
+        )
+        for batch in _chunks(updates, batch_size):
+            session.execute(statement, batch)
+    if inserts:
+        for batch in _chunks(inserts, batch_size):
+            session.execute(sqlalchemy.insert(table), batch)
+
+
+def upsert_catalog_rows(
+    session: Session,
+    catalog: str,
+    records: Iterator[Dict[str, Any]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Insert or update catalog rows by key in the session's transaction
+    (the caller commits). Later rows win when a key repeats.
+
+    Returns:
+        Counts of rows read, inserted, updated and skipped (no key)
+    """
+    source = CATALOG_SOURCES[catalog]
+    table = source["model"].__table__
+    key = source["key"]
+
+    rows, read, skipped = _collect_rows(records, key)
+    existing = dict(session.execute(select(table.c[key], table.c.id)).all())
+
+    inserts, updates = [], []
+    for key_value, row in rows.items():
+        if key_value in existing:
+            updates.append({**row, "b_id": existing[key_value]})
+        else:
+            inserts.append(row)
+    _write_rows(session, table, inserts, updates, batch_size)
+
+    return {"read": read, "inserted": len(inserts), "updated": len(updates), "skipped": skipped}
+
+
+def sync_catalog_rows(
+    session: Session,
+    catalog: str,
+    records: Iterator[Dict[str, Any]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Apply only the differences between the workbook rows and the stored
+    rows, by SOURCE_HASH, in the session's transaction (the caller commits).
+
+    Returns:
+        Counts of rows read, inserted, updated, unchanged, retired and
+        skipped (no key)
+    """
+    source = CATALOG_SOURCES[catalog]
+    table = source["model"].__table__
+    key = source["key"]
+
+    rows, read, skipped = _collect_rows(records, key)
+    existing = {
+        key_value: (row_id, source_hash, status)
+        for key_value, row_id, source_hash, status in session.execute(
+            select(table.c[key], table.c.id, table.c.SOURCE_HASH, table.c.STATUS_IND)
+        ).all()
+    }
+
+    inserts, updates = [], []
+    unchanged = 0
+    for key_value, row in rows.items():
+        if key_value not in existing:
+            inserts.append(row)
+            continue
+        row_id, source_hash, status = existing[key_value]
+        if source_hash == row["SOURCE_HASH"]:
+            unchanged += 1
+            continue
+        update = {**row, "b_id": row_id}
+        if "STATUS_IND" not in row:
+            # Keep the stored status, except retired rows back in the workbook
+            update["STATUS_IND"] = ACTIVE_STATUS if status == RETIRED_STATUS else status
+        updates.append(update)
+
+    # Only workbook rows (SOURCE_HASH set) are retired; app-created rows are kept
+    retired = [
+        {"b_id": row_id, "STATUS_IND": RETIRED_STATUS, "SOURCE_HASH": None}
+        for key_value, (row_id, source_hash, status) in existing.items()
+        if key_value not in rows and source_hash is not None
+    ]
+
+    _write_rows(session, table, inserts, updates, batch_size)
+    _write_rows(session, table, [], retired, batch_size)
+
+    return {
+        "read": read,
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "unchanged": unchanged,
+        "retired": len(retired),
+        "skipped": skipped,
+    }
+
+
+def _record_source(session: Session, catalog: str, path: Path, content_hash: str, row_count: int):
+    """Remember which workbook (and content hash) the catalog was last loaded from."""
+    state = session.exec(select(CatalogSource).where(CatalogSource.catalog == catalog)).first()
+    state = state or CatalogSource(catalog=catalog)
+    state.file_name = path.name
+    state.content_hash = content_hash
+    state.row_count = row_count
+    session.add(state)
+
+
+def import_catalog(
+    catalog: str,
+    path: Path = None,
+    sheet: Optional[str] = None,
+    database_url: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Import one catalog workbook in a single transaction.
+
+    Returns:
+        Row counts plus elapsed seconds and rows/second
+    """
+    source = CATALOG_SOURCES[catalog]
+    path = Path(path or source["workbook"])
+    if not path.exists():
+        raise FileNotFoundError(f"Workbook not found: {path}")
+
+    start = time.perf_counter()
+    content_hash = file_content_hash(path)
+    with Session(rx_model.get_engine(database_url)) as session:
+        counts = upsert_catalog_rows(session, catalog, read_workbook_rows(path, source["model"], sheet))
+        _record_source(session, catalog, path, content_hash, counts["read"] - counts["skipped"])
+        session.commit()
+    elapsed = time.perf_counter() - start
+
+    rate = counts["read"] / elapsed if elapsed else float("inf")
+    logger.info(f"Imported {counts['read']} {catalog} rows from {path.name} ({rate:,.0f} rows/s)")
+    return {"catalog": catalog, "file": path.name, **counts, "seconds": elapsed, "rows_per_sec": rate}
+
+
+def sync_catalog(
+    catalog: str,
+    path: Path = None,
+    sheet: Optional[str] = None,
+    database_url: Optional[str] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Incrementally sync one catalog workbook in a single transaction.
+    Nothing is read or written when the file hash matches the last sync
+    (unless force is set).
+
+    Returns:
+        Row counts (see sync_catalog_rows), file_unchanged, elapsed
+        seconds and rows/second
+    """
+    source = CATALOG_SOURCES[catalog]
+    path = Path(path or source["workbook"])
+    if not path.exists():
+        raise FileNotFoundError(f"Workbook not found: {path}")
+
+    start = time.perf_counter()
+    content_hash = file_content_hash(path)
+    with Session(rx_model.get_engine(database_url)) as session:
+        state = session.exec(select(CatalogSource).where(CatalogSource.catalog == catalog)).first()
+        if state and state.content_hash == content_hash and not force:
+            logger.info(f"{path.name} unchanged since last sync, skipping")
+            return {
+                "catalog": catalog, "file": path.name, "file_unchanged": True,
+                "read": 0, "inserted": 0, "updated": 0, "unchanged": state.row_count or 0,
+                "retired": 0, "skipped": 0, "seconds": time.perf_counter() - start, "rows_per_sec": 0.0,
+            }
+
+        counts = sync_catalog_rows(session, catalog, read_workbook_rows(path, source["model"], sheet))
+        _record_source(session, catalog, path, content_hash, counts["read"] - counts["skipped"])
+        session.commit()
+    elapsed = time.perf_counter() - start
+
+    rate = counts["read"] / elapsed if elapsed else float("inf")
+    logger.info(
+        f"Synced {catalog} from {path.name}: {counts['inserted']} new, {counts['updated']} changed, "
+        f"{counts['retired']} retired, {counts['unchanged']} unchanged ({rate:,.0f} rows/s)"
+    )
+    return {"catalog": catalog, "file": path.name, "file_unchanged": False, **counts,
+            "seconds": elapsed, "rows_per_sec": rate}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import metric and README catalogs from Excel")
+    parser.add_argument("--metrics", type=Path, default=None, help="Metrics workbook (default: METRICS_DB.xlsm)")
+    parser.add_argument("--readmes", type=Path, default=None, help="README workbook (default: README DB.xlsm)")
+    parser.add_argument("--only", choices=list(CATALOG_SOURCES), default=None, help="Import a single catalog")
+    parser.add_argument("--sheet", default=None, help="Sheet name (default: first sheet)")
+    parser.add_argument("--database-url", default=None, help="Database to import into (default: rxconfig db_url)")
+    parser.add_argument("--sync", action="store_true", help="Apply only changed rows; skip unchanged files")
+    parser.add_argument("--force", action="store_true", help="With --sync, diff rows even if the file is unchanged")
+    args = parser.parse_args()
+
+    paths = {"metric": args.metrics, "readme": args.readmes}
+    catalogs = [args.only] if args.only else list(CATALOG_SOURCES)
+
+    print(
+        f"{'catalog':<8} {'file':<24} {'read':>8} {'insert':>8} {'update':>8} "
+        f"{'same':>8} {'retire':>7} {'skip':>6} {'rows/s':>10}"
+    )
+    for catalog in catalogs:
+        try:
+            if args.sync:
+                result = sync_catalog(catalog, paths[catalog], args.sheet, args.database_url, args.force)
+            else:
+                result = import_catalog(catalog, paths[catalog], args.sheet, args.database_url)
+        except (FileNotFoundError, ValueError) as e:
+            parser.exit(1, f"{catalog}: {e}\n")
+        if result.get("file_unchanged"):
+            print(f"{result['catalog']:<8} {result['file'][:24]:<24} unchanged since last sync")
+            continue
+        print(
+            f"{result['catalog']:<8} {result['file'][:24]:<24} {result['read']:>8} "
+            f"{result['inserted']:>8} {result['updated']:>8} {result.get('unchanged', 0):>8} "
+            f"{result.get('retired', 0):>7} {result['skipped']:>6} {result['rows_per_sec']:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -450,6 +450,26 @@ class DynamicExcelBuilder:
         # Simplified implementation - add your full logic here
         ws['A1'] = f"Model {model_letter} Evaluation"
         ws['A1'].font = Font(bold=True, size=16)
+        
+        # Optional automated pre-eval hints (see utils/mt_metrics.py)
+        hints = getattr(self.state, 'pre_eval_hints', None) or {}
+        if hints.get(model_letter):
+            self._place_hint_column(ws, hints[model_letter])
+    
+    def _place_hint_column(self, ws, hints: List[str]):
+        """Place one automated hint per segment row in the hint column."""
+        config = SHEET_CONFIGS["part1_model"]
+        col = config["hint_column"]
+        
+        ws[f'{col}1'] = config["hint_header"]
+        ws[f'{col}1'].font = Font(bold=True)
+        ws[f'{col}1'].fill = COLORS["light_blue"]
+        ws[f'{col}1'].border = BORDERS["thin"]
+        ws.column_dimensions[col].width = COLUMN_WIDTHS["part1"].get(col, 40)
+        
+        for row, hint in enumerate(hints, start=2):
+            ws[f'{col}{row}'] = hint
+            ws[f'{col}{row}'].font = Font(name='Calibri', size=11, italic=True, color="595959")
     
     def _create_part2_sheet(self):
         """Create Part 2 - Data Analysis sheet."""
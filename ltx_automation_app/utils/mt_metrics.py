@@ -0,0 +1,411 @@
+# ltx_automation_app/utils/mt_metrics.py
+"""
+Cheap automatic MT signals used as pre-evaluation hints in PART 1 sheets.
+
+All metrics are computed for a whole corpus at once: segments are packed
+into flat NumPy arrays and n-grams are hashed and counted in one vectorized
+pass per order, instead of building a Counter per segment.
+
+Signals per segment:
+- length_ratio: target characters / source characters
+- chrf: character n-gram F-score against the reference (0-100)
+- bleu: smoothed sentence BLEU against the reference (0-100)
+- source_copy: target is (nearly) an untranslated copy of the source
+
+compute_pre_eval_hints() reads the uploaded segment files (one per model)
+and returns the hint column of each PART 1 sheet. Hints go through the
+score cache (database/score_cache.py), so segments already scored for an
+earlier model version or export are not computed again.
+"""
+
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import reflex as rx  # Must come before sqlmodel (Reflex patches pydantic on import)
+
+from ltx_automation_app.database.models import Metric
+from ltx_automation_app.database.score_cache import score_metrics_with_cache
+
+logger = logging.getLogger(__name__)
+
+CHRF_CHAR_ORDER = 6
+CHRF_BETA = 2
+BLEU_MAX_ORDER = 4
+
+# chrF of target against source at or above this counts as a source copy
+SOURCE_COPY_CHRF_THRESHOLD = 90.0
+
+# Corpora at least this large are split across a process pool
+PARALLEL_MIN_SEGMENTS = 20000
+PARALLEL_CHUNK_SIZE = 5000
+
+METRIC_COLUMNS = ["length_ratio", "chrf", "bleu", "source_copy"]
+
+# Part of every score cache key: bump when a signal's computation changes
+SCORER_VERSION = "mt_metrics-1"
+
+# Accepted header names (lower case) of the segment columns in uploaded files
+SEGMENT_COLUMNS = {
+    "source": ("source", "src", "source text", "source segment"),
+    "target": ("target", "tgt", "mt", "translation", "target text", "target segment"),
+    "reference": ("reference", "ref", "reference translation"),
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Polynomial rolling hash over uint64 (wraps on overflow by design)
+_HASH_BASE = np.uint64(1099511628211)
+_SEGMENT_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+# ============ PACKING ============
+
+def _clean_texts(texts: Sequence[Optional[str]]) -> List[str]:
+    """Replace None/NaN with empty strings."""
+    return ["" if t is None or (isinstance(t, float) and np.isnan(t)) else str(t) for t in texts]
+
+
+def _pack_chars(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack segments (whitespace removed, as chrF does) into one code point array.
+    Returns the code points and the segment index of every position.
+    """
+    stripped = [_WHITESPACE_PATTERN.sub("", t) for t in texts]
+    lengths = np.fromiter((len(t) for t in stripped), dtype=np.int64, count=len(stripped))
+    joined = "".join(stripped)
+    units = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    seg_ids = np.repeat(np.arange(len(stripped), dtype=np.int64), lengths)
+    return units, seg_ids
+
+
+def _pack_tokens(hyps: Sequence[str], refs: Sequence[str]):
+    """
+    Tokenize both sides and map tokens to shared integer ids with one factorize.
+    Returns (units, seg_ids) for hypotheses and references.
+    """
+    hyp_tokens = [_TOKEN_PATTERN.findall(t.lower()) for t in hyps]
+    ref_tokens = [_TOKEN_PATTERN.findall(t.lower()) for t in refs]
+
+    hyp_lengths = np.fromiter((len(t) for t in hyp_tokens), dtype=np.int64, count=len(hyp_tokens))
+    ref_lengths = np.fromiter((len(t) for t in ref_tokens), dtype=np.int64, count=len(ref_tokens))
+
+    flat = [tok for toks in hyp_tokens for tok in toks] + [tok for toks in ref_tokens for tok in toks]
+    codes, _ = pd.factorize(pd.Series(flat, dtype=object))
+    codes = codes.astype(np.uint64)
+
+    split = int(hyp_lengths.sum())
+    segs = np.arange(len(hyps), dtype=np.int64)
+    return (
+        (codes[:split], np.repeat(segs, hyp_lengths)),
+        (codes[split:], np.repeat(segs, ref_lengths)),
+        hyp_lengths,
+        ref_lengths,
+    )
+
+
+# ============ N-GRAM COUNTING ============
+
+def _ngram_keys(units: np.ndarray, seg_ids: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash every n-gram that lies inside a single segment.
+    The segment index is mixed into the key so equal n-grams in
+    different segments never match each other.
+    """
+    windows = len(units) - n + 1
+    if windows <= 0:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+
+    valid = seg_ids[:windows] == seg_ids[n - 1:]
+    hashes = np.zeros(windows, dtype=np.uint64)
+    for offset in range(n):
+        hashes = hashes * _HASH_BASE + units[offset:offset + windows] + np.uint64(1)
+
+    segs = seg_ids[:windows][valid]
+    keys = hashes[valid] ^ (segs.astype(np.uint64) * _SEGMENT_MIX)
+    return keys, segs
+
+
+def _ngram_overlap(hyp, ref, n: int, n_segments: int):
+    """
+    Clipped n-gram matches plus hypothesis/reference n-gram totals per segment.
+    """
+    hyp_keys, hyp_segs = _ngram_keys(hyp[0], hyp[1], n)
+    ref_keys, ref_segs = _ngram_keys(ref[0], ref[1], n)
+
+    hyp_total = np.bincount(hyp_segs, minlength=n_segments).astype(np.float64)
+    ref_total = np.bincount(ref_segs, minlength=n_segments).astype(np.float64)
+
+    hyp_unique, hyp_first, hyp_counts = np.unique(hyp_keys, return_index=True, return_counts=True)
+    ref_unique, ref_counts = np.unique(ref_keys, return_counts=True)
+    _, hyp_idx, ref_idx = np.intersect1d(
+        hyp_unique, ref_unique, assume_unique=True, return_indices=True
+    )
+
+    clipped = np.minimum(hyp_counts[hyp_idx], ref_counts[ref_idx])
+    matches = np.bincount(
+        hyp_segs[hyp_first[hyp_idx]], weights=clipped, minlength=n_segments
+    )
+    return matches, hyp_total, ref_total
+
+
+# ============ METRICS ============
+
+def _chrf(hyps: Sequence[str], refs: Sequence[str]) -> np.ndarray:
+    """Sentence-level chrF (character n-grams up to CHRF_CHAR_ORDER, beta=2)."""
+    n_segments = len(hyps)
+    hyp = _pack_chars(hyps)
+    ref = _pack_chars(refs)
+
+    precisions = np.full((CHRF_CHAR_ORDER, n_segments), np.nan)
+    recalls = np.full((CHRF_CHAR_ORDER, n_segments), np.nan)
+    for n in range(1, CHRF_CHAR_ORDER + 1):
+        matches, hyp_total, ref_total = _ngram_overlap(hyp, ref, n, n_segments)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precisions[n - 1] = np.where(hyp_total > 0, matches / hyp_total, np.nan)
+            recalls[n - 1] = np.where(ref_total > 0, matches / ref_total, np.nan)
+
+    # Orders a segment is too short for are left out of its average
+    valid = ~np.isnan(precisions) & ~np.isnan(recalls)
+    orders = valid.sum(axis=0)
+    has_orders = orders > 0
+    precision = np.where(valid, precisions, 0.0).sum(axis=0) / np.maximum(orders, 1)
+    recall = np.where(valid, recalls, 0.0).sum(axis=0) / np.maximum(orders, 1)
+
+    beta2 = CHRF_BETA ** 2
+    denominator = beta2 * precision + recall
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.where(denominator > 0, (1 + beta2) * precision * recall / denominator, 0.0)
+    return np.where(has_orders, score * 100, 0.0)
+
+
+def _bleu(hyps: Sequence[str], refs: Sequence[str]) -> np.ndarray:
+    """Sentence-level BLEU with add-one smoothing for orders above 1."""
+    n_segments = len(hyps)
+    hyp, ref, hyp_lengths, ref_lengths = _pack_tokens(hyps, refs)
+
+    log_precision = np.zeros(n_segments)
+    unigram_matches = np.zeros(n_segments)
+    for n in range(1, BLEU_MAX_ORDER + 1):
+        matches, hyp_total, _ = _ngram_overlap(hyp, ref, n, n_segments)
+        if n == 1:
+            unigram_matches = matches
+            precision = np.divide(matches, hyp_total, out=np.zeros(n_segments), where=hyp_total > 0)
+        else:
+            precision = (matches + 1) / (hyp_total + 1)
+        with np.errstate(divide="ignore"):
+            log_precision += np.log(precision)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        brevity = np.where(
+            hyp_lengths < ref_lengths,
+            np.exp(1 - ref_lengths / np.maximum(hyp_lengths, 1)),
+            1.0,
+        )
+        score = brevity * np.exp(log_precision / BLEU_MAX_ORDER)
+    return np.where((unigram_matches > 0) & (hyp_lengths > 0), score * 100, 0.0)
+
+
+def _compute_chunk(args) -> pd.DataFrame:
+    """Compute all signals for one chunk of segments (process pool worker)."""
+    sources, targets, references = args
+    n_segments = len(targets)
+
+    source_chars = np.fromiter((len(s) for s in sources), dtype=np.float64, count=n_segments)
+    target_chars = np.fromiter((len(t) for t in targets), dtype=np.float64, count=n_segments)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        length_ratio = np.where(source_chars > 0, target_chars / source_chars, np.nan)
+
+    normalized_source = pd.Series(sources).str.strip().str.casefold()
+    normalized_target = pd.Series(targets).str.strip().str.casefold()
+    exact_copy = (normalized_source == normalized_target).to_numpy() & (target_chars > 0)
+    near_copy = _chrf(targets, sources) >= SOURCE_COPY_CHRF_THRESHOLD
+
+    chrf = np.full(n_segments, np.nan)
+    bleu = np.full(n_segments, np.nan)
+    if references is not None:
+        has_reference = np.fromiter((bool(r.strip()) for r in references), dtype=bool, count=n_segments)
+        if has_reference.any():
+            idx = np.flatnonzero(has_reference)
+            hyps = [targets[i] for i in idx]
+            refs = [references[i] for i in idx]
+            chrf[idx] = _chrf(hyps, refs)
+            bleu[idx] = _bleu(hyps, refs)
+
+    return pd.DataFrame({
+        "length_ratio": length_ratio,
+        "chrf": chrf,
+        "bleu": bleu,
+        "source_copy": exact_copy | near_copy,
+    })
+
+
+def compute_segment_metrics(
+    sources: Sequence[Optional[str]],
+    targets: Sequence[Optional[str]],
+    references: Optional[Sequence[Optional[str]]] = None,
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Compute pre-eval signals for a whole corpus.
+
+    Args:
+        sources: Source segments
+        targets: Machine translated segments, aligned with sources
+        references: Optional reference translations; chrF/BLEU are NaN
+            where no reference is given
+        processes: Worker processes for large corpora (None = CPU count)
+
+    Returns:
+        DataFrame with one row per segment and METRIC_COLUMNS
+    """
+    if len(sources) != len(targets):
+        raise ValueError("sources and targets must have the same length")
+    if references is not None and len(references) != len(targets):
+        raise ValueError("references must have the same length as targets")
+
+    sources = _clean_texts(sources)
+    targets = _clean_texts(targets)
+    references = _clean_texts(references) if references is not None else None
+
+    if len(targets) < PARALLEL_MIN_SEGMENTS or processes == 1:
+        return _compute_chunk((sources, targets, references))
+
+    chunks = [
+        (
+            sources[start:start + PARALLEL_CHUNK_SIZE],
+            targets[start:start + PARALLEL_CHUNK_SIZE],
+            references[start:start + PARALLEL_CHUNK_SIZE] if references is not None else None,
+        )
+        for start in range(0, len(targets), PARALLEL_CHUNK_SIZE)
+    ]
+    logger.info(f"Scoring {len(targets)} segments in {len(chunks)} chunks")
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        frames = list(pool.map(_compute_chunk, chunks))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _signal_metric(column: str) -> Metric:
+    """Unsaved Metric naming one signal, for its score cache keys."""
+    return Metric(METRIC_NAME=column, METRIC_DEF="Automatic pre-eval hint (utils/mt_metrics.py)")
+
+
+def cached_segment_metrics(
+    sources: Sequence[Optional[str]],
+    targets: Sequence[Optional[str]],
+    references: Optional[Sequence[Optional[str]]] = None,
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    compute_segment_metrics through the score cache: all signals are looked
+    up per (source, target[, reference]) in one lookup, only segments
+    missing from the cache are computed (in one pass for all signals), and
+    their scores are stored in one insert.
+    Should be called from within a State event handler.
+    """
+    if len(sources) != len(targets):
+        raise ValueError("sources and targets must have the same length")
+    if references is not None and len(references) != len(targets):
+        raise ValueError("references must have the same length as targets")
+
+    columns = [_clean_texts(sources), _clean_texts(targets)]
+    if references is not None:
+        columns.append(_clean_texts(references))
+    segments = list(zip(*columns))
+    computed: Dict[tuple, dict] = {}
+
+    def scorer(missing: List[tuple], metric: Metric) -> List[float]:
+        new = [segment for segment in missing if segment not in computed]
+        if new:
+            new_columns = list(zip(*new))
+            frame = compute_segment_metrics(*new_columns[:2], *new_columns[2:3], processes=processes)
+            computed.update(zip(new, frame.to_dict("records")))
+        return [float(computed[segment][metric.METRIC_NAME]) for segment in missing]
+
+    signals, _ = score_metrics_with_cache(
+        segments, [_signal_metric(column) for column in METRIC_COLUMNS], scorer, SCORER_VERSION
+    )
+    data = {
+        # NaN is stored as NULL
+        column: np.array([np.nan if score is None else score for score in scores], dtype=np.float64)
+        for column, scores in zip(METRIC_COLUMNS, signals)
+    }
+    metrics = pd.DataFrame(data, columns=METRIC_COLUMNS)
+    metrics["source_copy"] = metrics["source_copy"] > 0
+    return metrics
+
+
+def format_hint(row) -> str:
+    """Render one row of compute_segment_metrics as a short hint string."""
+    parts = []
+    if not pd.isna(row["length_ratio"]):
+        parts.append(f"len {row['length_ratio']:.2f}")
+    if not pd.isna(row["chrf"]):
+        parts.append(f"chrF {row['chrf']:.1f}")
+    if not pd.isna(row["bleu"]):
+        parts.append(f"BLEU {row['bleu']:.1f}")
+    if row["source_copy"]:
+        parts.append("SOURCE COPY")
+    return " | ".join(parts)
+
+
+def compute_hint_column(
+    sources: Sequence[Optional[str]],
+    targets: Sequence[Optional[str]],
+    references: Optional[Sequence[Optional[str]]] = None,
+    processes: Optional[int] = None,
+) -> List[str]:
+    """
+    Hint strings for the optional hint column of a PART 1 sheet.
+    Should be called from within a State event handler (reads the score cache).
+    """
+    metrics = cached_segment_metrics(sources, targets, references, processes)
+    return [format_hint(row) for row in metrics.to_dict("records")]
+
+
+# ============ UPLOADED FILES ============
+
+def read_segment_file(path: str) -> Optional[Tuple[List, List, Optional[List]]]:
+    """
+    Read (sources, targets, references) from an uploaded .xlsx/.xls/.csv/.txt
+    file (first sheet; .txt is tab separated), matching column headers
+    against SEGMENT_COLUMNS. references is None without a reference column.
+    Returns None if the file has no source and target columns.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in (".xlsx", ".xls"):
+        frame = pd.read_excel(path, dtype=str)
+    else:
+        frame = pd.read_csv(path, sep="\t" if suffix == ".txt" else ",", dtype=str)
+    columns = {}
+    for name in frame.columns:
+        for role, headers in SEGMENT_COLUMNS.items():
+            if str(name).strip().lower() in headers and role not in columns:
+                columns[role] = name
+    if "source" not in columns or "target" not in columns:
+        return None
+    references = frame[columns["reference"]].tolist() if "reference" in columns else None
+    return frame[columns["source"]].tolist(), frame[columns["target"]].tolist(), references
+
+
+def compute_pre_eval_hints(paths: Sequence[str], processes: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Hint column per PART 1 sheet: the i-th file holds the segments of model
+    chr(65 + i) ("A", "B", ...). Files without source/target columns, or
+    that cannot be read, get no hints.
+    """
+    hints = {}
+    for i, path in enumerate(paths):
+        try:
+            segments = read_segment_file(path)
+        except Exception as e:
+            logger.warning(f"Skipping pre-eval hints for {path}: {e}")
+            continue
+        if segments is not None:
+            hints[chr(65 + i)] = compute_hint_column(*segments, processes=processes)
+    return hints
@@ -0,0 +1,43 @@
+# tests/conftest.py
+"""
+Shared test setup.
+
+The tests run against a scratch SQLite file built with the Alembic
+migrations, never against data/ltx_automation.db: LTX_DATABASE_URL is set
+here, before rxconfig is first imported. The database is shared by the
+whole session, so tests seed rows under names or types of their own and
+only assert on those.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="ltx_tests_")
+os.environ["LTX_DATABASE_URL"] = f"sqlite:///{Path(_DB_DIR) / 'test.db'}"
+os.environ.pop("LTX_ASYNC_DATABASE_URL", None)
+os.environ.setdefault("LTX_DB_PROFILE", "test")
+
+import pytest
+import reflex as rx  # Must come before sqlmodel (Reflex patches pydantic on import)
+from alembic import command
+from alembic.config import Config
+
+import ltx_automation_app.database  # noqa: F401 - registers models and session listeners
+from ltx_automation_app.database.engine import configure_database_engines
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Migrate the scratch database to head and route rx.session() to it."""
+    configure_database_engines()
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(config, "head")
+    engine = rx.model.get_engine()
+    yield engine
+    engine.dispose()
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
@@ -0,0 +1,95 @@
+# tests/test_catalog_changes.py
+"""Change feed trimming: readers are told to reload only when they missed pruned changes."""
+
+from datetime import datetime, timedelta, timezone
+
+import reflex as rx
+import sqlalchemy
+
+from ltx_automation_app.database.catalog_cache import METRIC_CATALOG, README_CATALOG, catalog_version
+from ltx_automation_app.database.catalog_changes import (
+    get_catalog_changes,
+    prune_catalog_changes,
+    watermark_catalog,
+)
+from ltx_automation_app.database.models import CatalogChange, Metric, ReadmeInstruction
+
+
+def _write(model, **fields):
+    """Insert one catalog row in its own transaction; returns (row id, new catalog version)."""
+    catalog = METRIC_CATALOG if model is Metric else README_CATALOG
+    with rx.session() as session:
+        row = model(**fields)
+        session.add(row)
+        session.commit()
+        return row.id, catalog_version(catalog)
+
+
+def _age_entries(up_to_id: int):
+    with rx.session() as session:
+        session.execute(
+            sqlalchemy.update(CatalogChange)
+            .where(CatalogChange.id <= up_to_id)
+            .values(changed_at=datetime.now(timezone.utc) - timedelta(days=30))
+        )
+        session.commit()
+
+
+def test_pruning_interleaved_catalogs_only_reloads_readers_that_missed_changes():
+    _, metric_1 = _write(Metric, METRIC_NAME="Feed metric 1")
+    _, readme_1 = _write(ReadmeInstruction, README_TITLE="Feed README 1")
+    _, metric_2 = _write(Metric, METRIC_NAME="Feed metric 2")
+    _, readme_2 = _write(ReadmeInstruction, README_TITLE="Feed README 2")
+    metric_3_id, metric_3 = _write(Metric, METRIC_NAME="Feed metric 3")
+    _age_entries(readme_2)
+
+    assert prune_catalog_changes() > 0
+    # Watermark rows do not move the catalog versions
+    assert catalog_version(METRIC_CATALOG) == metric_3
+    assert catalog_version(README_CATALOG) == readme_2
+
+    # An up-to-date README reader gets a patch for the next README write,
+    # although metric entries between its version and the write are gone
+    readme_3_id, readme_3 = _write(ReadmeInstruction, README_TITLE="Feed README 3")
+    changes = get_catalog_changes(README_CATALOG, readme_2)
+    assert not changes["reload"]
+    assert changes["version"] == readme_3
+    assert [row["id"] for row in changes["upserts"]] == [str(readme_3_id)]
+
+    # A metric reader that saw metric 2 only needs metric 3
+    changes = get_catalog_changes(METRIC_CATALOG, metric_2)
+    assert not changes["reload"]
+    assert [row["id"] for row in changes["upserts"]] == [str(metric_3_id)]
+
+    # A metric reader still at metric 1 missed the pruned metric 2 entry
+    changes = get_catalog_changes(METRIC_CATALOG, metric_1)
+    assert changes["reload"]
+    assert changes["version"] == metric_3
+
+    # README entries were pruned up to readme 1: a reader that saw it is fine
+    changes = get_catalog_changes(README_CATALOG, readme_1)
+    assert not changes["reload"]
+    assert len(changes["upserts"]) == 2
+
+
+def test_watermark_never_moves_back():
+    _, version = _write(Metric, METRIC_NAME="Feed metric 4")
+    _write(Metric, METRIC_NAME="Feed metric 5")
+    _age_entries(version)
+    prune_catalog_changes()
+    with rx.session() as session:
+        watermark = session.exec(
+            sqlalchemy.select(CatalogChange.row_id).where(
+                CatalogChange.catalog == watermark_catalog(METRIC_CATALOG)
+            )
+        ).scalar_one()
+    assert watermark == version
+
+    # Nothing newer is old enough: a second pass keeps the watermark
+    prune_catalog_changes()
+    with rx.session() as session:
+        assert session.exec(
+            sqlalchemy.select(CatalogChange.row_id).where(
+                CatalogChange.catalog == watermark_catalog(METRIC_CATALOG)
+            )
+        ).scalar_one() == version
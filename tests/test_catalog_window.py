@@ -0,0 +1,165 @@
+# tests/test_catalog_window.py
+"""
+Windowed metric catalog: window contents, keyset page boundaries, and the
+size of the state deltas the metric picker sends to the browser.
+"""
+
+import pytest
+import reflex as rx
+from reflex.utils.format import json_dumps
+from sqlmodel import select
+
+from ltx_automation_app.components.virtual_list import VIRTUAL_LIST_OVERSCAN_ROWS
+from ltx_automation_app.database.catalog_cache import metric_catalog_row
+from ltx_automation_app.database.metric_index import get_filtered_metrics_page, get_metrics_window
+from ltx_automation_app.database.models import ACTIVE_STATUS, RETIRED_STATUS, Metric
+from ltx_automation_app.database.pagination import METRICS, decode_cursor, encode_cursor
+from ltx_automation_app.states.ltx_bench_state import (
+    METRIC_LIST_HEIGHT_PX,
+    METRIC_ROW_HEIGHT_PX,
+    FilePrepState,
+)
+
+WINDOW_TYPE = "WINDOW TEST"
+ACTIVE_ROWS = 300
+FILTERS = {"metric_type": WINDOW_TYPE, "status": ACTIVE_STATUS}
+# Rows a window can hold: the visible rows plus the overscan on both sides
+MAX_WINDOW_ROWS = METRIC_LIST_HEIGHT_PX // METRIC_ROW_HEIGHT_PX + 1 + 2 * VIRTUAL_LIST_OVERSCAN_ROWS
+
+
+@pytest.fixture(scope="module")
+def active_ids():
+    """ACTIVE_ROWS Active metrics of WINDOW_TYPE, with Retired ones between them."""
+    with rx.session() as session:
+        for i in range(ACTIVE_ROWS + ACTIVE_ROWS // 15):
+            session.add(Metric(
+                METRIC_NAME=f"Window metric {i}",
+                METRIC_TYPE=WINDOW_TYPE,
+                METRIC_DEF="Checks that the translation " * 8,
+                STATUS_IND=RETIRED_STATUS if i % 16 == 15 else ACTIVE_STATUS,
+            ))
+        session.commit()
+        ids = session.exec(
+            select(Metric.id)
+            .where(Metric.METRIC_TYPE == WINDOW_TYPE, Metric.STATUS_IND == ACTIVE_STATUS)
+            .order_by(Metric.id)
+        ).all()
+    assert len(ids) == ACTIVE_ROWS
+    return ids
+
+
+def test_window_holds_the_rows_at_its_position(active_ids):
+    rows, total = get_metrics_window(FILTERS, 100, 50)
+    assert [row.id for row in rows] == active_ids[100:150]
+    assert total == ACTIVE_ROWS
+
+
+def test_window_is_cut_at_the_end_of_the_list(active_ids):
+    rows, total = get_metrics_window(FILTERS, ACTIVE_ROWS - 10, 50)
+    assert [row.id for row in rows] == active_ids[-10:]
+    assert get_metrics_window(FILTERS, ACTIVE_ROWS + 5, 50) == ([], ACTIVE_ROWS)
+
+
+def _all_pages(fetch, limit):
+    ids, sizes, cursor = [], [], None
+    while True:
+        rows, cursor = fetch(cursor, limit)
+        ids += [row.id for row in rows]
+        sizes.append(len(rows))
+        if cursor is None:
+            return ids, sizes
+
+
+@pytest.mark.parametrize("limit", [1, 7, 8, 9, 50, 299, 300])
+def test_filtered_pages_meet_without_gaps_or_overlap(active_ids, limit):
+    ids, sizes = _all_pages(lambda cursor, limit: get_filtered_metrics_page(FILTERS, cursor, limit), limit)
+    assert ids == active_ids
+    # Every page but the last is full; an exact multiple ends on a full page
+    assert all(size == limit for size in sizes[:-1])
+    assert 0 < sizes[-1] <= limit
+
+
+def test_page_after_a_retired_row_starts_at_the_next_active_one(active_ids):
+    retired_gap = next(i for i in range(1, ACTIVE_ROWS) if active_ids[i] - active_ids[i - 1] > 1)
+    cursor = encode_cursor(METRICS, [active_ids[retired_gap - 1]])
+    rows, _ = get_filtered_metrics_page(FILTERS, cursor, 3)
+    assert [row.id for row in rows] == active_ids[retired_gap:retired_gap + 3]
+
+
+def test_cursor_of_another_listing_is_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor(METRICS, encode_cursor("readmes", [1]))
+
+
+def _file_prep_state():
+    root = rx.State(_reflex_internal_init=True)
+    return root, root.get_substate(FilePrepState.get_full_name().split(".")[1:])
+
+
+def _delta(root):
+    """Changed vars (without the Reflex suffix) and the delta size in bytes."""
+    delta = root.get_delta()
+    root._clean()
+    changed = {
+        name.removesuffix("_rx_state_"): value
+        for substate in delta.values()
+        for name, value in substate.items()
+    }
+    return changed, len(json_dumps(delta).encode())
+
+
+def _row_bytes(metric_ids):
+    with rx.session() as session:
+        metrics = session.exec(select(Metric).where(Metric.id.in_(metric_ids))).all()
+    return max(len(json_dumps(metric_catalog_row(metric)).encode()) for metric in metrics)
+
+
+def test_scrolling_sends_only_the_new_window(active_ids):
+    root, state = _file_prep_state()
+    state.toggle_metric_filter("metric_type", WINDOW_TYPE)
+    state.load_available_options()
+    changed, _ = _delta(root)
+    # Backend-only catalogs never reach the delta
+    assert not any(name.startswith("_") for name in changed)
+    assert changed["metric_list_total"] == ACTIVE_ROWS
+
+    state.scroll_metric_list(200 * METRIC_ROW_HEIGHT_PX, METRIC_LIST_HEIGHT_PX)
+    changed, size = _delta(root)
+
+    assert set(changed) <= {"metric_window", "metric_window_start", "metric_list_total"}
+    window = changed["metric_window"]
+    start = changed["metric_window_start"]
+    assert [int(row["id"]) for row in window] == active_ids[start:start + len(window)]
+    assert start <= 200 and start + len(window) >= 200 + METRIC_LIST_HEIGHT_PX // METRIC_ROW_HEIGHT_PX
+    assert len(window) <= MAX_WINDOW_ROWS
+    # Upper bound: a full window of rows plus a little framing, far below the catalog
+    row_bytes = _row_bytes(active_ids)
+    assert size <= MAX_WINDOW_ROWS * row_bytes + 1024
+    assert size < ACTIVE_ROWS * row_bytes / 4
+
+
+def test_scrolling_within_the_window_sends_nothing(active_ids):
+    root, state = _file_prep_state()
+    state.toggle_metric_filter("metric_type", WINDOW_TYPE)
+    _delta(root)
+
+    state.scroll_metric_list(METRIC_ROW_HEIGHT_PX, METRIC_LIST_HEIGHT_PX)
+    assert _delta(root)[0] == {}
+
+
+def test_selecting_a_metric_sends_only_the_selection(active_ids):
+    root, state = _file_prep_state()
+    state.toggle_metric_filter("metric_type", WINDOW_TYPE)
+    _delta(root)
+
+    state.toggle_metric(str(active_ids[0]))
+    changed, size = _delta(root)
+    assert set(changed) == {"selected_metric_ids", "selected_metric_count"}
+    assert size < 512
+
+    state.select_metrics_by_facet("metric_type", WINDOW_TYPE)
+    changed, size = _delta(root)
+    assert set(changed) == {"selected_metric_ids", "selected_metric_count"}
+    assert changed["selected_metric_count"] == ACTIVE_ROWS
+    # Ids only: a few bytes per selected metric, not catalog rows
+    assert size < ACTIVE_ROWS * 16
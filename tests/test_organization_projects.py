@@ -0,0 +1,66 @@
+# tests/test_organization_projects.py
+"""
+Project pages by organization name (one joined statement per page) and the
+expiry of the organization id cache.
+"""
+
+import reflex as rx
+import sqlalchemy
+
+from ltx_automation_app.database import database_config
+from ltx_automation_app.database.models import Organization, Project
+from ltx_automation_app.database.pagination import get_organization_projects_page
+
+from test_query_plans import query_plans
+
+
+def _organization(name: str, projects: int) -> int:
+    with rx.session() as session:
+        organization = Organization(name=name)
+        session.add(organization)
+        session.commit()
+        session.add_all(
+            Project(name=f"{name} project {i:02d}", organization_id=organization.id)
+            for i in range(projects)
+        )
+        session.commit()
+        return organization.id
+
+
+def test_project_pages_join_on_the_organization_name():
+    _organization("Joined org", 5)
+    _organization("Other joined org", 2)
+
+    with query_plans("project") as plans:
+        first, cursor = get_organization_projects_page("Joined org", limit=3)
+        rest, last = get_organization_projects_page("Joined org", cursor, limit=3)
+
+    assert [p.name for p in first + rest] == [f"Joined org project {i:02d}" for i in range(5)]
+    assert last is None
+    # One statement per page, seeking through both indexes
+    assert len(plans) == 2
+    for statement, details in plans:
+        assert "JOIN organization" in statement
+        assert any("ix_organization_name (name=?)" in detail for detail in details), details
+        assert any("uq_project_organization_id_name (organization_id=?" in detail for detail in details), details
+
+
+def test_unknown_organization_has_no_projects():
+    assert get_organization_projects_page("No such org") == ([], None)
+
+
+def test_cached_ids_expire_after_a_change_by_another_worker(monkeypatch):
+    org_id = _organization("Renamed elsewhere", 0)
+    assert database_config.get_organization_id("Renamed elsewhere") == org_id
+
+    # Another worker renames it: this process sees no ORM event
+    with rx.model.get_engine().begin() as connection:
+        connection.execute(
+            sqlalchemy.text("UPDATE organization SET name = 'Renamed' WHERE id = :id"), {"id": org_id}
+        )
+    assert database_config.get_organization_id("Renamed elsewhere") == org_id
+
+    monkeypatch.setattr(database_config, "ORGANIZATION_ID_CACHE_SECONDS", 0)
+    database_config._cache_organization_id("Renamed elsewhere", org_id)
+    assert database_config.get_organization_id("Renamed elsewhere") is None
+    assert database_config.get_organization_id("Renamed") == org_id
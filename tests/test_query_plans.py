@@ -0,0 +1,123 @@
+# tests/test_query_plans.py
+"""
+Query plans of the database_config helpers on the migrated schema, the
+unique (organization_id, name) project constraint, and that the Alembic
+migrations match the models (what autogenerate compares against).
+
+Plans are taken with EXPLAIN QUERY PLAN on the connection each helper
+actually queries, so catalog helpers are checked against the in-memory
+read snapshot and its copied indexes.
+"""
+
+import contextlib
+
+import pytest
+import reflex as rx
+import sqlalchemy
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
+
+from ltx_automation_app.database import database_config
+from ltx_automation_app.database.models import Metric, Organization, Project, ReadmeInstruction
+
+
+@contextlib.contextmanager
+def query_plans(table: str):
+    """Collect (statement, plan details) of every SELECT on `table` run inside the block."""
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            rows = conn.connection.driver_connection.execute(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plans.append((statement, [row[3] for row in rows]))
+
+    event.listen(Engine, "before_cursor_execute", explain)
+    try:
+        yield plans
+    finally:
+        event.remove(Engine, "before_cursor_execute", explain)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def catalog_rows():
+    with rx.session() as session:
+        organization = Organization(name="Query plan org")
+        session.add(organization)
+        session.add(Metric(METRIC_NAME="Query plan metric", METRIC_TYPE="EVERGREEN", METRIC_DEF="Plan"))
+        session.add(ReadmeInstruction(README_TITLE="Query plan README", README_TXT="Plan"))
+        session.commit()
+        session.add(Project(name="Query plan project", organization_id=organization.id))
+        session.commit()
+
+
+@pytest.mark.parametrize(
+    "helper, args, table, expected",
+    [
+        ("get_organization_projects", (1,), "project", "USING INDEX uq_project_organization_id_name (organization_id=?)"),
+        ("get_organization_id", ("Query plan org",), "organization", "USING COVERING INDEX ix_organization_name (name=?)"),
+        ("get_all_metrics", ("EVERGREEN",), "metric", "USING INDEX ix_metric_METRIC_TYPE (METRIC_TYPE=?)"),
+        ("get_evergreen_metrics", (), "metric", "USING INDEX ix_metric_METRIC_TYPE (METRIC_TYPE=?)"),
+        ("get_custom_metrics", (), "metric", "USING INDEX ix_metric_METRIC_TYPE (METRIC_TYPE=?)"),
+        ("get_all_readme_instructions", (), "readmeinstruction", "USING INDEX ix_readmeinstruction_active_id"),
+        ("get_readme_by_title", ("Query plan README",), "readmeinstruction", "USING INDEX ix_readmeinstruction_README_TITLE (README_TITLE=?)"),
+        ("get_readme_text", (1,), "readmeinstruction", "USING INTEGER PRIMARY KEY (rowid=?)"),
+        ("get_metric_by_name", ("Query plan metric",), "metric", "USING INDEX ix_metric_METRIC_NAME (METRIC_NAME=?)"),
+    ],
+)
+def test_helper_queries_use_an_index(helper, args, table, expected):
+    database_config.invalidate_organization_cache()
+    with query_plans(table) as plans:
+        getattr(database_config, helper)(*args)
+
+    assert plans, f"{helper} ran no query on {table}"
+    for statement, details in plans:
+        assert any(expected in detail for detail in details), (statement, details)
+        assert f"SCAN {table}" not in details, (statement, details)
+
+
+@pytest.mark.parametrize(
+    "helper, table",
+    [("get_all_organizations", "organization"), ("get_all_templates", "template")],
+)
+def test_unfiltered_listings_scan_once(helper, table):
+    with query_plans(table) as plans:
+        getattr(database_config, helper)()
+
+    assert [details for _, details in plans] == [[f"SCAN {table}"]]
+
+
+def test_all_readme_instructions_can_include_retired_rows():
+    with query_plans("readmeinstruction") as plans:
+        database_config.get_all_readme_instructions(active_only=False)
+
+    assert [details for _, details in plans] == [["SCAN readmeinstruction"]]
+
+
+def test_project_names_are_unique_per_organization():
+    with rx.session() as session:
+        first, second = Organization(name="Unique org A"), Organization(name="Unique org B")
+        session.add_all([first, second])
+        session.commit()
+        session.add(Project(name="Shared name", organization_id=first.id))
+        session.add(Project(name="Shared name", organization_id=second.id))
+        session.commit()
+
+        session.add(Project(name="Shared name", organization_id=first.id))
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            session.commit()
+
+
+def _skip_fts_tables(object, name, type_, reflected, compare_to):
+    # Same filter as alembic/env.py: the FTS5 tables live outside the models
+    return not (type_ == "table" and reflected and compare_to is None and "_fts" in name)
+
+
+def test_migrations_match_the_models():
+    with rx.model.get_engine().connect() as connection:
+        context = MigrationContext.configure(connection, opts={"include_object": _skip_fts_tables})
+        assert compare_metadata(context, SQLModel.metadata) == []
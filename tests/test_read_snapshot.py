@@ -0,0 +1,122 @@
+# tests/test_read_snapshot.py
+"""
+Catalog read snapshot: commits are patched in by the commit hook, reads do
+not touch the database file, bulk writes reload it with the backup API,
+and writes of other processes show up after the check interval.
+"""
+
+import contextlib
+import sqlite3
+
+import pytest
+import reflex as rx
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ltx_automation_app.database import database_config, read_snapshot
+from ltx_automation_app.database.models import Metric
+
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    """A loaded snapshot whose cross-process check is not due during the test."""
+    monkeypatch.setattr(read_snapshot, "SNAPSHOT_CHECK_SECONDS", 3600)
+    assert read_snapshot.load_read_snapshot()
+    return read_snapshot
+
+
+@contextlib.contextmanager
+def database_statements():
+    """Collect the statements run on the application database (not the snapshot)."""
+    statements = []
+    database = rx.model.get_engine()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if conn.engine is database:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def _snapshot_definition(name: str):
+    with read_snapshot._engine.connect() as connection:
+        return connection.exec_driver_sql(
+            'SELECT "METRIC_DEF" FROM metric WHERE "METRIC_NAME" = ?', (name,)
+        ).scalar()
+
+
+def test_commits_are_patched_in_place(snapshot):
+    anchor = snapshot._anchor
+    with rx.session() as session:
+        metric = Metric(METRIC_NAME="Snapshot patched", METRIC_TYPE="SNAPSHOT", METRIC_DEF="v1")
+        # Not the newest row, so its id is not handed out again after the delete
+        session.add_all([metric, Metric(METRIC_NAME="Snapshot kept", METRIC_TYPE="SNAPSHOT")])
+        session.commit()
+        assert _snapshot_definition("Snapshot patched") == "v1"
+
+        metric.METRIC_DEF = "v2"
+        session.add(metric)
+        session.commit()
+        assert _snapshot_definition("Snapshot patched") == "v2"
+
+        session.delete(metric)
+        session.commit()
+        assert _snapshot_definition("Snapshot patched") is None
+
+    # Patched, not loaded again
+    assert snapshot._anchor is anchor
+
+
+def test_reads_do_not_query_the_database(snapshot):
+    with rx.session() as session:
+        session.add(Metric(METRIC_NAME="Snapshot read", METRIC_TYPE="SNAPSHOT", METRIC_DEF="Read"))
+        session.commit()
+
+    with database_statements() as statements:
+        metric = database_config.get_metric_by_name("Snapshot read")
+        assert database_config.get_custom_metrics() is not None
+    assert metric.METRIC_DEF == "Read"
+    assert statements == []
+
+
+def test_bulk_writes_load_a_new_snapshot(snapshot):
+    anchor = snapshot._anchor
+    with rx.session() as session:
+        session.add(Metric(METRIC_NAME="Snapshot bulk", METRIC_TYPE="SNAPSHOT", METRIC_DEF="Before"))
+        session.commit()
+        session.execute(
+            sqlalchemy.update(Metric).where(Metric.METRIC_NAME == "Snapshot bulk").values(METRIC_DEF="After")
+        )
+        session.commit()
+
+    assert snapshot._anchor is not anchor
+    assert _snapshot_definition("Snapshot bulk") == "After"
+    # The backup is cut down to the catalog tables and their indexes
+    objects = snapshot._anchor.execute("SELECT type, tbl_name FROM sqlite_master").fetchall()
+    assert {table for _, table in objects} == set(read_snapshot.SNAPSHOT_TABLES)
+    assert {kind for kind, _ in objects} == {"table", "index"}
+
+
+def test_other_process_writes_show_up_after_the_check_interval(snapshot):
+    # Another process writes (and logs) a metric: no hook runs here
+    other = sqlite3.connect(rx.model.get_engine().url.database)
+    with other:
+        row_id = other.execute(
+            'INSERT INTO metric ("METRIC_NAME", "METRIC_TYPE", "METRIC_DEF", "STATUS_IND") '
+            "VALUES ('Snapshot elsewhere', 'SNAPSHOT', 'Other', 'Active')"
+        ).lastrowid
+        other.execute(
+            "INSERT INTO catalogchange (catalog, row_id, operation) VALUES ('metric', ?, 'insert')",
+            (row_id,),
+        )
+    other.close()
+
+    assert database_config.get_metric_by_name("Snapshot elsewhere") is None
+
+    snapshot._next_check = 0.0
+    assert database_config.get_metric_by_name("Snapshot elsewhere").METRIC_DEF == "Other"
@@ -0,0 +1,50 @@
+# tests/test_readme_archive.py
+"""README library archive: archived READMEs are listed and restored from the state."""
+
+import reflex as rx
+
+from ltx_automation_app.database.models import ACTIVE_STATUS, ReadmeInstruction
+from ltx_automation_app.states.ltx_bench_state import EvaluationLibraryState
+
+
+def _library_state():
+    root = rx.State(_reflex_internal_init=True)
+    return root.get_substate(EvaluationLibraryState.get_full_name().split(".")[1:])
+
+
+def test_archived_readme_is_listed_and_restored():
+    with rx.session() as session:
+        readme = ReadmeInstruction(README_TITLE="Archive round trip", README_TXT="Kept")
+        session.add(readme)
+        session.commit()
+        readme_id = str(readme.id)
+
+    state = _library_state()
+    state.load_readme_instructions()
+    state.toggle_archived_readmes()
+    state.select_readme(readme_id)
+    state.delete_readme()
+
+    assert readme_id not in [r["id"] for r in state.readme_instructions]
+    assert {"id": readme_id, "title": "Archive round trip"} in state.archived_readmes
+
+    state.restore_archived_readme(readme_id)
+
+    assert readme_id not in [r["id"] for r in state.archived_readmes]
+    assert readme_id in [r["id"] for r in state.readme_instructions]
+    assert state.selected_readme_id == readme_id
+    assert state.selected_readme_content == "Kept"
+    with rx.session() as session:
+        assert session.get(ReadmeInstruction, int(readme_id)).STATUS_IND == ACTIVE_STATUS
+
+
+def test_archived_list_is_loaded_only_when_shown():
+    state = _library_state()
+    state.toggle_archived_readmes()
+    assert state.show_archived_readmes
+    state.toggle_archived_readmes()
+    assert not state.show_archived_readmes
+
+    state.archived_readmes = []
+    state.restore_archived_readme("0")  # unknown id: nothing to restore
+    assert state.archived_readmes == []
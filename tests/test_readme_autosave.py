@@ -0,0 +1,117 @@
+# tests/test_readme_autosave.py
+"""
+Background README autosave: the compare-and-set write runs in a worker
+thread without the state lock, and someone else's save is merged in.
+"""
+
+import asyncio
+import threading
+
+import pytest
+import reflex as rx
+
+from ltx_automation_app.database.catalog_edits import update_catalog_row
+from ltx_automation_app.database.models import ReadmeInstruction
+from ltx_automation_app.states import ltx_bench_state
+from ltx_automation_app.states.ltx_bench_state import EvaluationLibraryState
+
+
+class _LockedState:
+    """Stand-in for the StateProxy of a background task: tracks `async with self`."""
+
+    def __init__(self, state):
+        object.__setattr__(self, "_state", state)
+        object.__setattr__(self, "locked", False)
+
+    def __getattr__(self, name):
+        return getattr(self._state, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._state, name, value)
+
+    async def __aenter__(self):
+        object.__setattr__(self, "locked", True)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        object.__setattr__(self, "locked", False)
+
+
+@pytest.fixture
+def editing(monkeypatch):
+    """A fresh README opened in edit mode, and the recorded autosave writes."""
+    with rx.session() as session:
+        readme = ReadmeInstruction(README_TITLE="Autosave README", README_TXT="Before")
+        session.add(readme)
+        session.commit()
+        readme_id = readme.id
+
+    root = rx.State(_reflex_internal_init=True)
+    state = root.get_substate(EvaluationLibraryState.get_full_name().split(".")[1:])
+    state.load_readme_instructions()
+    state.select_readme(str(readme_id))
+    state.toggle_edit_mode()
+    proxy = _LockedState(state)
+
+    writes = []
+
+    def recording_update(*args):
+        writes.append((threading.current_thread() is threading.main_thread(), proxy.locked))
+        return update_catalog_row(*args)
+
+    monkeypatch.setattr(ltx_bench_state, "README_AUTOSAVE_SECONDS", 0)
+    monkeypatch.setattr(ltx_bench_state, "update_catalog_row", recording_update)
+    return readme_id, state, proxy, writes
+
+
+def _autosave(proxy):
+    handler = EvaluationLibraryState.event_handlers["autosave_readme"]
+    return asyncio.run(handler.fn(proxy))
+
+
+def _stored(readme_id):
+    with rx.session() as session:
+        return session.get(ReadmeInstruction, readme_id)
+
+
+def test_autosave_writes_off_the_event_loop_without_the_lock(editing):
+    readme_id, state, proxy, writes = editing
+    state.set_edit_readme_content("After")
+
+    assert _autosave(proxy) is None
+    assert writes == [(False, False)]
+    assert _stored(readme_id).README_TXT == "After"
+    assert state.readme_autosave_status.startswith("Saved at")
+    assert state.selected_readme_content == "After"
+    assert state.current_readme_data["version"] == str(_stored(readme_id).VERSION)
+
+
+def test_autosave_merges_a_concurrent_save_of_other_fields(editing):
+    readme_id, state, proxy, writes = editing
+    stored = _stored(readme_id)
+    update_catalog_row(ReadmeInstruction, readme_id, stored.VERSION, {"README_TITLE": "Their title"})
+    state.set_edit_readme_content("Mine")
+
+    _autosave(proxy)
+    # The first write conflicts, the merged one goes through
+    assert len(writes) == 2 and not any(locked for _, locked in writes)
+    stored = _stored(readme_id)
+    assert (stored.README_TITLE, stored.README_TXT) == ("Their title", "Mine")
+    assert state.readme_conflict_fields == []
+    assert state.edit_readme_title == "Their title"
+
+
+def test_autosave_result_is_dropped_when_another_readme_was_selected(editing, monkeypatch):
+    readme_id, state, proxy, writes = editing
+    state.set_edit_readme_content("Moved on")
+    saved_before = dict(state._saved_readme_fields)
+
+    def switch_then_write(*args):
+        # The user picks another README while the write is in flight
+        state.selected_readme_id = "0"
+        return update_catalog_row(*args)
+
+    monkeypatch.setattr(ltx_bench_state, "update_catalog_row", switch_then_write)
+    _autosave(proxy)
+    assert _stored(readme_id).README_TXT == "Moved on"
+    assert state._saved_readme_fields == saved_before
@@ -0,0 +1,83 @@
+# tests/test_score_cache.py
+"""Score cache round trips: all pre-eval signals share one lookup and one insert."""
+
+import contextlib
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ltx_automation_app.database.models import Metric
+from ltx_automation_app.database.score_cache import get_score_cache_stats, score_metrics_with_cache
+from ltx_automation_app.utils import mt_metrics
+from ltx_automation_app.utils.mt_metrics import METRIC_COLUMNS, cached_segment_metrics, compute_segment_metrics
+
+SOURCES = ["The cat sat on the mat.", "Hello world", "Score cache test"]
+TARGETS = ["Le chat est assis sur le tapis.", "Bonjour le monde", "Score cache test"]
+REFERENCES = ["Le chat s'est assis sur le tapis.", "Bonjour tout le monde", "Test du cache"]
+
+
+@contextlib.contextmanager
+def cache_statements():
+    """Collect the first word (SELECT/INSERT) of every statement on metricscorecache."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "metricscorecache" in statement:
+            statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def test_signals_are_looked_up_and_stored_together(monkeypatch):
+    sources = [f"{text} (batch)" for text in SOURCES]
+    computed = []
+
+    def counting_compute(*args, **kwargs):
+        computed.append(len(args[1]))
+        return compute_segment_metrics(*args, **kwargs)
+
+    monkeypatch.setattr(mt_metrics, "compute_segment_metrics", counting_compute)
+
+    with cache_statements() as statements:
+        first = cached_segment_metrics(sources, TARGETS, REFERENCES)
+    assert statements == ["SELECT", "INSERT"]
+    assert computed == [len(sources)]
+
+    with cache_statements() as statements:
+        again = cached_segment_metrics(sources, TARGETS, REFERENCES)
+    assert statements == ["SELECT"]
+    assert computed == [len(sources)]
+    assert again.equals(first)
+    assert list(first.columns) == METRIC_COLUMNS
+
+
+def test_partial_hits_only_score_the_missing_segments():
+    metrics = [Metric(METRIC_NAME="Partial A", METRIC_DEF="a"), Metric(METRIC_NAME="Partial B", METRIC_DEF="b")]
+    pairs = [("s1", "t1"), ("s2", "t2")]
+    calls = []
+
+    def scorer(missing, metric):
+        calls.append((metric.METRIC_NAME, list(missing)))
+        return [float(len(metric.METRIC_NAME) + i) for i, _ in enumerate(missing)]
+
+    score_metrics_with_cache(pairs[:1], metrics[:1], scorer, "test-1")
+    calls.clear()
+    before = get_score_cache_stats()
+
+    scores, stats = score_metrics_with_cache(pairs + pairs[:1], metrics, scorer, "test-1")
+    assert calls == [("Partial A", [("s2", "t2")]), ("Partial B", [("s1", "t1"), ("s2", "t2")])]
+    assert scores == [[9.0, 9.0, 9.0], [9.0, 10.0, 9.0]]
+    assert (stats["total"], stats["hits"], stats["misses"]) == (6, 3, 3)
+    assert get_score_cache_stats()["misses"] - before["misses"] == 3
+
+
+def test_scorer_returning_too_few_scores_is_rejected():
+    with pytest.raises(ValueError):
+        score_metrics_with_cache(
+            [("x", "y")], [Metric(METRIC_NAME="Short", METRIC_DEF="")], lambda missing, metric: [], "test-1"
+        )
@@ -0,0 +1,87 @@
+# tests/test_sqlite_tuning.py
+"""SQLite profile pragmas on connect, and the concurrency benchmark."""
+
+import pytest
+from sqlmodel import create_engine
+
+from ltx_automation_app.database.sqlite_tuning import (
+    SQLITE_PROFILES,
+    get_sqlite_pragmas,
+    install_sqlite_tuning,
+    set_sqlite_profile,
+)
+from ltx_automation_app.utils.db_benchmark import run_concurrency_benchmark
+
+
+def _pragma(connection, name: str):
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_profile_pragmas_are_applied_on_connect(tmp_path):
+    install_sqlite_tuning()
+    set_sqlite_profile("development")
+    try:
+        engine = create_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+        with engine.connect() as connection:
+            assert _pragma(connection, "journal_mode") == "wal"
+            assert _pragma(connection, "synchronous") == 1  # NORMAL
+            assert _pragma(connection, "busy_timeout") == 5000
+            assert _pragma(connection, "cache_size") == -65536
+            assert _pragma(connection, "temp_store") == 2  # MEMORY
+        engine.dispose()
+    finally:
+        set_sqlite_profile(None)
+
+
+def test_baseline_profile_keeps_sqlite_defaults(tmp_path):
+    install_sqlite_tuning()
+    set_sqlite_profile("baseline")
+    try:
+        engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+        with engine.connect() as connection:
+            assert _pragma(connection, "journal_mode") == "delete"
+            assert _pragma(connection, "synchronous") == 2  # FULL
+        engine.dispose()
+    finally:
+        set_sqlite_profile(None)
+
+
+def test_environment_overrides_single_pragmas(monkeypatch):
+    monkeypatch.setenv("LTX_SQLITE_CACHE_SIZE", "-131072")
+    pragmas = get_sqlite_pragmas("production")
+    assert pragmas["cache_size"] == -131072
+    assert pragmas["mmap_size"] == SQLITE_PROFILES["production"]["mmap_size"]
+
+
+def test_keyword_overrides_are_normalized(monkeypatch):
+    monkeypatch.setenv("LTX_SQLITE_SYNCHRONOUS", " full")
+    assert get_sqlite_pragmas("development")["synchronous"] == "FULL"
+
+
+@pytest.mark.parametrize(
+    "variable, value",
+    [
+        ("LTX_SQLITE_CACHE_SIZE", "64MB"),
+        ("LTX_SQLITE_BUSY_TIMEOUT", "5000; DROP TABLE metric"),
+        ("LTX_SQLITE_JOURNAL_MODE", "WAL2"),
+        ("LTX_SQLITE_TEMP_STORE", "MEMORY; PRAGMA query_only=1"),
+    ],
+)
+def test_bad_overrides_fail_at_install(monkeypatch, variable, value):
+    monkeypatch.setenv(variable, value)
+    with pytest.raises(ValueError, match=variable):
+        install_sqlite_tuning()
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        set_sqlite_profile("turbo")
+
+
+@pytest.mark.parametrize("profile", ["baseline", "development"])
+def test_concurrency_benchmark_reads_and_writes_in_parallel(profile):
+    result = run_concurrency_benchmark(profile, readers=2, writers=1, seconds=0.5)
+    assert result["profile"] == profile
+    assert result["reads_per_sec"] > 0
+    assert result["writes_per_sec"] > 0
+    assert result["errors"] == 0